@@ -22,60 +22,15 @@ const Dashboard: React.FC = () => {
 
   const fetchDashboardStats = async () => {
     try {
-      const today = new Date();
-      today.setHours(0, 0, 0, 0);
-      const todayEnd = new Date(today);
-      todayEnd.setHours(23, 59, 59, 999);
-
-      // 오늘의 상담
-      const consultationsResponse = await api.get('/consultations', {
-        params: {
-          skip: 0,
-          limit: 1000,
-        },
-      });
-      const todayConsultations = consultationsResponse.data.filter((c: any) => {
-        const consultationDate = new Date(c.consultation_date);
-        return consultationDate >= today && consultationDate <= todayEnd;
-      }).length;
-
-      // 진행 중인 계약
-      const contractsResponse = await api.get('/contracts', {
-        params: {
-          skip: 0,
-          limit: 1000,
-        },
-      });
-      const inProgressContracts = contractsResponse.data.filter(
-        (c: any) => c.status === 'in_progress' || c.status === 'signed'
-      ).length;
-
-      // 대기 중인 작업
-      const installationsResponse = await api.get('/installations', {
-        params: {
-          status: 'pending',
-          skip: 0,
-          limit: 1000,
-        },
-      });
-      const pendingTasks = installationsResponse.data.length;
-
-      // 재고 알림 (최소 재고 수준 이하)
-      const inventoryResponse = await api.get('/inventory', {
-        params: {
-          skip: 0,
-          limit: 1000,
-        },
-      });
-      const lowStockItems = inventoryResponse.data.filter(
-        (item: any) => item.quantity <= item.min_stock_level
-      ).length;
+      // 서버에서 집계된 요약 수치 조회
+      const response = await api.get('/dashboard/summary');
+      const summary = response.data;
 
       setStats({
-        todayConsultations,
-        inProgressContracts,
-        pendingTasks,
-        lowStockItems,
+        todayConsultations: summary.today_consultations,
+        inProgressContracts: summary.in_progress_contracts,
+        pendingTasks: summary.pending_tasks,
+        lowStockItems: summary.low_stock_items ?? 0,
       });
     } catch (error) {
       console.error('Failed to fetch dashboard stats:', error);
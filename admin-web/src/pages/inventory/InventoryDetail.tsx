@@ -16,6 +16,8 @@ const InventoryDetail: React.FC = () => {
   const navigate = useNavigate();
   const [loading, setLoading] = useState(true);
   const [items, setItems] = useState<any[]>([]);
+  // 불러온 수량 (수정 시 expected_quantity로 보내, 그 사이 다른 변경이 있으면 서버가 409)
+  const [loadedQuantity, setLoadedQuantity] = useState<number | null>(null);
   const [formData, setFormData] = useState<InventoryFormData>({
     item_id: '',
     quantity: 0,
@@ -46,6 +48,7 @@ const InventoryDetail: React.FC = () => {
     try {
       const response = await api.get(`/inventory/${id}`);
       const data = response.data;
+      setLoadedQuantity(data.quantity ?? 0);
       setFormData({
         item_id: data.item_id ? String(data.item_id) : '',
         quantity: data.quantity || 0,
@@ -91,6 +94,7 @@ const InventoryDetail: React.FC = () => {
         }
         const submitData = {
           quantity: Number(formData.quantity),
+          expected_quantity: loadedQuantity,
           min_stock_level: Number(formData.min_stock_level),
           location: formData.location || '',
           notes: formData.notes || '',
@@ -1,54 +1,65 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from app.db.database import get_db
-from app.db.dependencies import get_current_super_admin
+from app.core.responses import json_response
+from app.api.serializers import user_to_dict
+from app.db.pagination import paginate
+from app.db.dependencies import get_current_admin, get_current_super_admin
+from app.db.slow_query import slow_query_log
 from app.models.user import User
 from app.schemas.auth import UserResponse, UserCreate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
+from app.core.auth_cache import user_cache
+from app.core.config import settings
 
 router = APIRouter()
 
 
 @router.get("/accounts", response_model=List[UserResponse])
 async def get_admin_accounts(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    with_total: bool = False,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_super_admin)
 ):
     """관리자 계정 목록 조회 (슈퍼관리자만)"""
-    users = db.query(User).filter(User.is_admin == True).offset(skip).limit(limit).all()
-    return users
+    query = select(User).where(User.is_admin == True)
+    users = await paginate(db, query, User, response, skip, limit, cursor, with_total)
+    return json_response([user_to_dict(row) for row in users], response)
 
 
 @router.get("/accounts/{user_id}", response_model=UserResponse)
 async def get_admin_account(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_super_admin)
 ):
     """관리자 계정 상세 조회"""
-    user = db.query(User).filter(User.id == user_id, User.is_admin == True).first()
+    user = await db.scalar(select(User).where(User.id == user_id, User.is_admin == True))
     if not user:
         raise HTTPException(status_code=404, detail="관리자 계정을 찾을 수 없습니다")
-    return user
+    return json_response(user_to_dict(user))
 
 
 @router.post("/accounts", response_model=UserResponse)
 async def create_admin_account(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_super_admin)
 ):
     """관리자 계정 등록"""
-    if db.query(User).filter(User.username == user_data.username).first():
+    if await db.scalar(select(User).where(User.username == user_data.username)):
         raise HTTPException(status_code=400, detail="이미 사용 중인 사용자명입니다")
     
-    if db.query(User).filter(User.email == user_data.email).first():
+    if await db.scalar(select(User).where(User.email == user_data.email)):
         raise HTTPException(status_code=400, detail="이미 사용 중인 이메일입니다")
     
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -61,30 +72,30 @@ async def create_admin_account(
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return new_user
+    await db.commit()
+    await db.refresh(new_user)
+    return json_response(user_to_dict(new_user))
 
 
 @router.put("/accounts/{user_id}", response_model=UserResponse)
 async def update_admin_account(
     user_id: int,
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_super_admin)
 ):
     """관리자 계정 수정"""
-    user = db.query(User).filter(User.id == user_id, User.is_admin == True).first()
+    user = await db.scalar(select(User).where(User.id == user_id, User.is_admin == True))
     if not user:
         raise HTTPException(status_code=404, detail="관리자 계정을 찾을 수 없습니다")
     
     # 중복 확인 (자기 자신 제외)
     if user_data.username != user.username:
-        if db.query(User).filter(User.username == user_data.username).first():
+        if await db.scalar(select(User).where(User.username == user_data.username)):
             raise HTTPException(status_code=400, detail="이미 사용 중인 사용자명입니다")
     
     if user_data.email != user.email:
-        if db.query(User).filter(User.email == user_data.email).first():
+        if await db.scalar(select(User).where(User.email == user_data.email)):
             raise HTTPException(status_code=400, detail="이미 사용 중인 이메일입니다")
     
     user.username = user_data.username
@@ -93,30 +104,50 @@ async def update_admin_account(
     user.phone = user_data.phone
     user.role = user_data.role
     if user_data.password:
-        user.hashed_password = get_password_hash(user_data.password)
+        user.hashed_password = await get_password_hash_async(user_data.password)
     user.is_super_admin = user_data.is_super_admin
     
-    db.commit()
-    db.refresh(user)
-    return user
+    await db.commit()
+    user_cache.invalidate_user(user.id)
+    await db.refresh(user)
+    return json_response(user_to_dict(user))
 
 
 @router.delete("/accounts/{user_id}")
 async def delete_admin_account(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_super_admin)
 ):
     """관리자 계정 삭제"""
     if user_id == current_user.id:
         raise HTTPException(status_code=400, detail="자기 자신은 삭제할 수 없습니다")
     
-    user = db.query(User).filter(User.id == user_id, User.is_admin == True).first()
+    user = await db.scalar(select(User).where(User.id == user_id, User.is_admin == True))
     if not user:
         raise HTTPException(status_code=404, detail="관리자 계정을 찾을 수 없습니다")
     
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    user_cache.invalidate_user(user_id)
     return {"message": "관리자 계정이 삭제되었습니다"}
 
 
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = 50,
+    current_user: User = Depends(get_current_admin)
+):
+    """최근 느린 쿼리 조회 (관리자만, SLOW_QUERY_ENABLED=true 필요)"""
+    return {
+        "enabled": settings.SLOW_QUERY_ENABLED,
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "queries": slow_query_log.entries(limit),
+    }
+
+
+@router.delete("/slow-queries")
+async def clear_slow_queries(current_user: User = Depends(get_current_admin)):
+    """느린 쿼리 기록 초기화"""
+    slow_query_log.clear()
+    return {"message": "느린 쿼리 기록이 초기화되었습니다"}
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from app.db.database import get_db
 from app.models.user import User
-from app.core.security import verify_password, create_access_token, get_password_hash
+from app.core.security import (
+    verify_password_async, create_access_token, get_password_hash_async, password_needs_rehash
+)
 from app.core.config import settings
 from app.schemas.auth import Token, UserCreate, UserResponse
 from app.db.dependencies import get_current_user
@@ -15,12 +18,12 @@ router = APIRouter()
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """로그인"""
-    user = db.query(User).filter(User.username == form_data.username).first()
+    user = await db.scalar(select(User).where(User.username == form_data.username))
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자명 또는 비밀번호가 올바르지 않습니다",
@@ -33,6 +36,16 @@ async def login(
             detail="비활성화된 계정입니다"
         )
     
+    # 해시 비용(BCRYPT_ROUNDS)이 바뀌었으면 평문을 알고 있는 지금 재해시
+    # (비밀번호는 같으므로 Core UPDATE로 저장해 인증/참조 캐시 버전을 올리지 않음)
+    if password_needs_rehash(user.hashed_password):
+        hashed_password = await get_password_hash_async(form_data.password)
+        await db.execute(
+            update(User).where(User.id == user.id).values(hashed_password=hashed_password),
+            execution_options={"synchronize_session": False},
+        )
+        await db.commit()
+    
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": str(user.id), "username": user.username, "role": user.role},
@@ -63,7 +76,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 @router.post("/register", response_model=UserResponse)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """사용자 등록 (관리자만 가능)"""
@@ -74,20 +87,20 @@ async def register(
         )
     
     # 중복 확인
-    if db.query(User).filter(User.username == user_data.username).first():
+    if await db.scalar(select(User).where(User.username == user_data.username)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 사용 중인 사용자명입니다"
         )
     
-    if db.query(User).filter(User.email == user_data.email).first():
+    if await db.scalar(select(User).where(User.email == user_data.email)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 사용 중인 이메일입니다"
         )
     
     # 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -100,8 +113,8 @@ async def register(
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
 
@@ -1,49 +1,93 @@
 """
 데이터 백업 API
 """
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime
-import os
-import shutil
 from pathlib import Path
+from typing import Optional, Tuple
+import os
+import re
+from app.db import backup as backup_service
 from app.db.dependencies import get_current_user
 from app.models.user import User
 
 router = APIRouter()
 
-# 데이터베이스 파일 경로
-DB_PATH = "nexo_crm.db"
-BACKUP_DIR = "backups"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _backup_file_path(filename: str) -> Path:
+    """요청 파일명을 백업 디렉토리 안의 경로로 변환 (경로 조작 방지)"""
+    if ".." in filename or "/" in filename or "\\" in filename:
+        raise HTTPException(status_code=400, detail="잘못된 파일명입니다.")
+    if not backup_service.is_backup_file(filename):
+        raise HTTPException(status_code=400, detail="잘못된 파일명입니다.")
+    backup_path = backup_service.backup_dir() / filename
+    if not backup_path.exists():
+        raise HTTPException(status_code=404, detail="백업 파일을 찾을 수 없습니다.")
+    return backup_path
 
-# 백업 디렉토리 생성
-os.makedirs(BACKUP_DIR, exist_ok=True)
+
+def _parse_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """단일 바이트 범위(bytes=start-end) 파싱, 형식이 다르면 None (전체 전송)"""
+    match = RANGE_PATTERN.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    start, end = match.groups()
+    if start == "":
+        # bytes=-N : 마지막 N바이트
+        length = int(end)
+        if length == 0:
+            raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{file_size}"})
+        return max(0, file_size - length), file_size - 1
+    start = int(start)
+    end = min(int(end), file_size - 1) if end else file_size - 1
+    if start >= file_size or start > end:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{file_size}"})
+    return start, end
+
+
+def _iter_file_range(path: Path, start: int, end: int, chunk_size: int = 256 * 1024):
+    """파일의 [start, end] 구간을 청크 단위로 읽기 (스레드 풀에서 실행됨)"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
 
 
 @router.get("/create")
 async def create_backup(current_user: User = Depends(get_current_user)):
     """
     데이터베이스 백업 생성
+    운영 중에도 일관된 스냅샷을 얻도록 SQLite 백업 API를 사용하며,
+    이벤트 루프를 막지 않도록 스레드 풀에서 실행합니다.
     """
     try:
-        if not os.path.exists(DB_PATH):
-            raise HTTPException(status_code=404, detail="데이터베이스 파일을 찾을 수 없습니다.")
-        
-        # 백업 파일명 생성 (날짜/시간 포함)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"nexo_crm_backup_{timestamp}.db"
-        backup_path = os.path.join(BACKUP_DIR, backup_filename)
-        
-        # 데이터베이스 파일 복사
-        shutil.copy2(DB_PATH, backup_path)
-        
+        manifest = await run_in_threadpool(backup_service.create_backup)
+
         return {
             "success": True,
             "message": "백업이 생성되었습니다.",
-            "backup_file": backup_filename,
-            "backup_path": backup_path,
-            "timestamp": timestamp
+            "backup_file": manifest["filename"],
+            "backup_path": str(backup_service.backup_dir() / manifest["filename"]),
+            "timestamp": manifest["timestamp"],
+            "compression": manifest["compression"],
+            "size": manifest["size"],
+            "sha256": manifest["sha256"],
         }
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="데이터베이스 파일을 찾을 수 없습니다.")
+    except backup_service.BackupInProgress as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except backup_service.BackupError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"백업 생성 실패: {str(e)}")
 
@@ -54,48 +98,69 @@ async def list_backups(current_user: User = Depends(get_current_user)):
     백업 파일 목록 조회
     """
     try:
-        if not os.path.exists(BACKUP_DIR):
-            return {"backups": []}
-        
+        directory = backup_service.backup_dir()
+
         backups = []
-        for filename in os.listdir(BACKUP_DIR):
-            if filename.endswith(".db"):
-                file_path = os.path.join(BACKUP_DIR, filename)
+        for filename in os.listdir(directory):
+            if backup_service.is_backup_file(filename):
+                file_path = directory / filename
                 file_stat = os.stat(file_path)
+                manifest = backup_service.read_manifest(file_path) or {}
                 backups.append({
                     "filename": filename,
                     "size": file_stat.st_size,
                     "created_at": datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
-                    "modified_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+                    "modified_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+                    "compression": manifest.get("compression"),
+                    "sha256": manifest.get("sha256"),
+                    "database_size": manifest.get("database_size"),
                 })
-        
+
         # 최신순으로 정렬
         backups.sort(key=lambda x: x["modified_at"], reverse=True)
-        
+
         return {"backups": backups}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"백업 목록 조회 실패: {str(e)}")
 
 
 @router.get("/download/{filename}")
-async def download_backup(filename: str, current_user: User = Depends(get_current_user)):
+async def download_backup(filename: str, request: Request, current_user: User = Depends(get_current_user)):
     """
     백업 파일 다운로드
+    Range 헤더를 지원하므로 큰 백업도 중단된 지점부터 이어받을 수 있습니다.
     """
     try:
-        # 보안: 파일명에 경로 조작 방지
-        if ".." in filename or "/" in filename or "\\" in filename:
-            raise HTTPException(status_code=400, detail="잘못된 파일명입니다.")
-        
-        backup_path = os.path.join(BACKUP_DIR, filename)
-        
-        if not os.path.exists(backup_path):
-            raise HTTPException(status_code=404, detail="백업 파일을 찾을 수 없습니다.")
-        
+        backup_path = _backup_file_path(filename)
+        file_size = backup_path.stat().st_size
+        manifest = backup_service.read_manifest(backup_path) or {}
+        headers = {"Accept-Ranges": "bytes"}
+        if manifest.get("sha256"):
+            headers["X-Checksum-SHA256"] = manifest["sha256"]
+            headers["ETag"] = f'"{manifest["sha256"]}"'
+
+        range_header = request.headers.get("range")
+        # If-Range가 현재 파일과 다르면 전체 파일 전송
+        if_range = request.headers.get("if-range")
+        if range_header and (not if_range or if_range == headers.get("ETag")):
+            byte_range = _parse_range(range_header, file_size)
+            if byte_range:
+                start, end = byte_range
+                headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+                headers["Content-Length"] = str(end - start + 1)
+                headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+                return StreamingResponse(
+                    _iter_file_range(backup_path, start, end),
+                    status_code=206,
+                    media_type=backup_service.media_type(filename),
+                    headers=headers
+                )
+
         return FileResponse(
             backup_path,
-            media_type="application/octet-stream",
-            filename=filename
+            media_type=backup_service.media_type(filename),
+            filename=filename,
+            headers=headers
         )
     except HTTPException:
         raise
@@ -109,17 +174,13 @@ async def delete_backup(filename: str, current_user: User = Depends(get_current_
     백업 파일 삭제
     """
     try:
-        # 보안: 파일명에 경로 조작 방지
-        if ".." in filename or "/" in filename or "\\" in filename:
-            raise HTTPException(status_code=400, detail="잘못된 파일명입니다.")
-        
-        backup_path = os.path.join(BACKUP_DIR, filename)
-        
-        if not os.path.exists(backup_path):
-            raise HTTPException(status_code=404, detail="백업 파일을 찾을 수 없습니다.")
-        
+        backup_path = _backup_file_path(filename)
+
         os.remove(backup_path)
-        
+        manifest_path = backup_service.manifest_path(backup_path)
+        if manifest_path.exists():
+            os.remove(manifest_path)
+
         return {
             "success": True,
             "message": "백업 파일이 삭제되었습니다."
@@ -128,4 +189,3 @@ async def delete_backup(filename: str, current_user: User = Depends(get_current_
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"백업 삭제 실패: {str(e)}")
-
@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import CLIENTS, client_to_dict
+from app.db.pagination import paginate
+from app.db.conditional import detail_version, list_version
+from app.db.client_search import client_search_filter, client_search_rank
 from app.db.dependencies import get_current_user
 from app.models.client import Client, ClientType
 from pydantic import BaseModel
@@ -40,82 +46,108 @@ class ClientResponse(ClientBase):
 
 @router.get("/", response_model=List[ClientResponse])
 async def get_clients(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """거래처 목록 조회 (거래처명으로 검색 가능)"""
-    query = db.query(Client)
+    """거래처 목록 조회 (거래처명, 회사명, 대표자명, 주소로 검색 가능, fields로 응답 필드 지정)"""
+    projection = CLIENTS.project(fields)
+    query = select(Client).options(*projection.options())
+    rank = None
     
+    # 검색 색인으로 후보를 좁히고 일치 정도 순으로 정렬
     if search:
-        query = query.filter(Client.name.contains(search))
+        query = query.where(client_search_filter(search))
+        rank = client_search_rank(search)
     
-    clients = query.offset(skip).limit(limit).all()
-    return clients
+    # 필터 결과가 바뀌지 않았으면 페이지를 조회/직렬화하지 않고 304
+    version = await list_version(db, query, projection, request, current_user, skip, limit, cursor, with_total, rank=rank)
+    if version.matches(request):
+        return version.not_modified()
+    version.apply(response)
+    
+    clients = await paginate(db, query, Client, response, skip, limit, cursor, with_total, rank=rank)
+    return json_response([projection.serialize(row) for row in clients], response)
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
 async def get_client(
     client_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """거래처 상세 조회"""
-    client = db.query(Client).filter(Client.id == client_id).first()
+    projection = CLIENTS.project(fields)
+    version = await detail_version(db, projection, request, current_user, Client.id == client_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="거래처를 찾을 수 없습니다")
+    if version.matches(request):
+        return version.not_modified()
+    
+    client = await db.scalar(select(Client).options(*projection.options()).where(Client.id == client_id))
     if not client:
         raise HTTPException(status_code=404, detail="거래처를 찾을 수 없습니다")
-    return client
+    version.apply(response)
+    return json_response(projection.serialize(client), response)
 
 
 @router.post("/", response_model=ClientResponse)
 async def create_client(
     client_data: ClientCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """거래처 등록"""
     new_client = Client(**client_data.dict())
     db.add(new_client)
-    db.commit()
-    db.refresh(new_client)
-    return new_client
+    await db.commit()
+    await db.refresh(new_client)
+    return json_response(client_to_dict(new_client))
 
 
 @router.put("/{client_id}", response_model=ClientResponse)
 async def update_client(
     client_id: int,
     client_data: ClientCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """거래처 정보 수정"""
-    client = db.query(Client).filter(Client.id == client_id).first()
+    client = await db.get(Client, client_id)
     if not client:
         raise HTTPException(status_code=404, detail="거래처를 찾을 수 없습니다")
     
     for key, value in client_data.dict().items():
         setattr(client, key, value)
     
-    db.commit()
-    db.refresh(client)
-    return client
+    await db.commit()
+    await db.refresh(client)
+    return json_response(client_to_dict(client))
 
 
 @router.delete("/{client_id}")
 async def delete_client(
     client_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """거래처 삭제"""
-    client = db.query(Client).filter(Client.id == client_id).first()
+    client = await db.get(Client, client_id)
     if not client:
         raise HTTPException(status_code=404, detail="거래처를 찾을 수 없습니다")
     
-    db.delete(client)
-    db.commit()
+    await db.delete(client)
+    await db.commit()
     return {"message": "거래처가 삭제되었습니다"}
 
 
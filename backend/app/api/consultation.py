@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import CONSULTATIONS, CONSULTATION_FULL, Projection, consultation_to_dict
+from app.db.pagination import paginate
+from app.db.conditional import detail_version, list_version
+from app.db.client_search import client_search_filter
 from app.db.dependencies import get_current_user
 from app.models.consultation import Consultation
 from app.models.user import User
@@ -50,105 +56,82 @@ class ConsultationResponse(ConsultationBase):
         from_attributes = True
 
 
+def _consultation_query(projection: Projection = CONSULTATION_FULL):
+    """응답에 필요한 컬럼과 관계(거래처/영업자)만 로딩하는 상담 조회 쿼리"""
+    return select(Consultation).options(*projection.options())
+
+
 @router.get("/")
 async def get_consultations(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
     client_name: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """상담 목록 조회 (거래처명으로 검색 가능)"""
-    query = db.query(Consultation)
+    """상담 목록 조회 (거래처명으로 검색 가능, fields/expand로 응답 필드 지정)"""
+    projection = CONSULTATIONS.project(fields, expand)
+    query = _consultation_query(projection)
     
+    # 거래처 검색 색인으로 필터링 (조인 불필요)
     if client_name:
-        from app.models.client import Client
-        query = query.join(Client).filter(Client.name.contains(client_name))
+        query = query.where(client_search_filter(client_name, Consultation.client_id))
     
     # 영업자는 자신의 상담만 조회
     if current_user.role.value == "sales" and not current_user.is_admin:
-        query = query.filter(Consultation.salesperson_id == current_user.id)
-    
-    consultations = query.options(
-        joinedload(Consultation.client),
-        joinedload(Consultation.salesperson)
-    ).offset(skip).limit(limit).all()
-    
-    # 관계 데이터를 수동으로 포함
-    result = []
-    for consultation in consultations:
-        consultation_dict = {
-            "id": consultation.id,
-            "client_id": consultation.client_id,
-            "salesperson_id": consultation.salesperson_id,
-            "consultation_date": consultation.consultation_date,
-            "content": consultation.content,
-            "notes": consultation.notes,
-            "created_at": consultation.created_at,
-            "updated_at": consultation.updated_at,
-        }
-        if consultation.client:
-            consultation_dict["client"] = {
-                "id": consultation.client.id,
-                "name": consultation.client.name,
-            }
-        if consultation.salesperson:
-            consultation_dict["salesperson"] = {
-                "id": consultation.salesperson.id,
-                "full_name": consultation.salesperson.full_name,
-            }
-        result.append(consultation_dict)
-    
-    return result
+        query = query.where(Consultation.salesperson_id == current_user.id)
+    
+    # 필터 결과가 바뀌지 않았으면 페이지를 조회/직렬화하지 않고 304
+    version = await list_version(db, query, projection, request, current_user, skip, limit, cursor, with_total)
+    if version.matches(request):
+        return version.not_modified()
+    version.apply(response)
+    
+    consultations = await paginate(db, query, Consultation, response, skip, limit, cursor, with_total)
+    return json_response([projection.serialize(consultation) for consultation in consultations], response)
 
 
 @router.get("/{consultation_id}", response_model=ConsultationResponse)
 async def get_consultation(
     consultation_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """상담 상세 조회"""
-    consultation = db.query(Consultation).options(
-        joinedload(Consultation.client),
-        joinedload(Consultation.salesperson)
-    ).filter(Consultation.id == consultation_id).first()
-    if not consultation:
+    projection = CONSULTATIONS.project(fields, expand)
+    version = await detail_version(db, projection, request, current_user, Consultation.id == consultation_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="상담을 찾을 수 없습니다")
     
-    # 영업자는 자신의 상담만 조회 가능
+    # 영업자는 자신의 상담만 조회 가능 (304 응답보다 먼저 확인)
     if current_user.role.value == "sales" and not current_user.is_admin:
-        if consultation.salesperson_id != current_user.id:
+        if version.row.salesperson_id != current_user.id:
             raise HTTPException(status_code=403, detail="권한이 없습니다")
+    if version.matches(request):
+        return version.not_modified()
     
-    consultation_dict = {
-        "id": consultation.id,
-        "client_id": consultation.client_id,
-        "salesperson_id": consultation.salesperson_id,
-        "consultation_date": consultation.consultation_date,
-        "content": consultation.content,
-        "notes": consultation.notes,
-        "created_at": consultation.created_at,
-        "updated_at": consultation.updated_at,
-    }
-    if consultation.client:
-        consultation_dict["client"] = {
-            "id": consultation.client.id,
-            "name": consultation.client.name,
-        }
-    if consultation.salesperson:
-        consultation_dict["salesperson"] = {
-            "id": consultation.salesperson.id,
-            "full_name": consultation.salesperson.full_name,
-        }
-    
-    return consultation_dict
+    consultation = await db.scalar(_consultation_query(projection).where(Consultation.id == consultation_id))
+    if not consultation:
+        raise HTTPException(status_code=404, detail="상담을 찾을 수 없습니다")
+    version.apply(response)
+    
+    return json_response(projection.serialize(consultation), response)
 
 
 @router.post("/", response_model=ConsultationResponse)
 async def create_consultation(
     consultation_data: ConsultationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """상담 등록"""
@@ -157,20 +140,24 @@ async def create_consultation(
         salesperson_id=current_user.id
     )
     db.add(new_consultation)
-    db.commit()
-    db.refresh(new_consultation)
-    return new_consultation
+    await db.commit()
+    
+    # 관계 데이터를 함께 로딩하여 반환
+    new_consultation = await db.scalar(
+        _consultation_query().where(Consultation.id == new_consultation.id).execution_options(populate_existing=True)
+    )
+    return json_response(consultation_to_dict(new_consultation))
 
 
 @router.put("/{consultation_id}", response_model=ConsultationResponse)
 async def update_consultation(
     consultation_id: int,
     consultation_data: ConsultationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """상담 수정"""
-    consultation = db.query(Consultation).filter(Consultation.id == consultation_id).first()
+    consultation = await db.get(Consultation, consultation_id)
     if not consultation:
         raise HTTPException(status_code=404, detail="상담을 찾을 수 없습니다")
     
@@ -182,19 +169,22 @@ async def update_consultation(
     for key, value in consultation_data.dict().items():
         setattr(consultation, key, value)
     
-    db.commit()
-    db.refresh(consultation)
-    return consultation
+    await db.commit()
+    
+    consultation = await db.scalar(
+        _consultation_query().where(Consultation.id == consultation_id).execution_options(populate_existing=True)
+    )
+    return json_response(consultation_to_dict(consultation))
 
 
 @router.delete("/{consultation_id}")
 async def delete_consultation(
     consultation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """상담 삭제"""
-    consultation = db.query(Consultation).filter(Consultation.id == consultation_id).first()
+    consultation = await db.get(Consultation, consultation_id)
     if not consultation:
         raise HTTPException(status_code=404, detail="상담을 찾을 수 없습니다")
     
@@ -203,7 +193,7 @@ async def delete_consultation(
         if consultation.salesperson_id != current_user.id:
             raise HTTPException(status_code=403, detail="권한이 없습니다")
     
-    db.delete(consultation)
-    db.commit()
+    await db.delete(consultation)
+    await db.commit()
     return {"message": "상담이 삭제되었습니다"}
 
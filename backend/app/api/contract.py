@@ -1,7 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import CONTRACTS, CONTRACT_FULL, Projection, contract_to_dict
+from app.db.pagination import paginate
+from app.core.export import date_range, export_response
+from app.db.line_items import apply_line_items, line_total
+from app.db import references
+from app.db.conditional import detail_version, list_version
+from app.db.client_search import client_search_filter
 from app.db.dependencies import get_current_user
 from app.models.contract import Contract, ContractItem, ContractStatus
 from app.models.user import User
@@ -23,6 +32,11 @@ class ContractItemCreate(ContractItemBase):
     pass
 
 
+class ContractItemUpdate(ContractItemBase):
+    # 기존 항목 ID (없으면 같은 품목의 기존 항목과 짝짓거나 새로 추가)
+    id: Optional[int] = None
+
+
 class ContractItemResponse(ContractItemBase):
     id: int
     total_price: Decimal
@@ -45,6 +59,24 @@ class ContractCreate(ContractBase):
     pass
 
 
+class ContractUpdate(ContractBase):
+    items: List[ContractItemUpdate] = []
+
+
+class ContractPatch(BaseModel):
+    """계약 머리글만 수정 (보낸 필드만 반영, 항목은 그대로)"""
+    contract_number: Optional[str] = None
+    client_id: Optional[int] = None
+    quotation_id: Optional[int] = None
+    status: Optional[ContractStatus] = None
+    contract_date: Optional[date] = None
+    notes: Optional[str] = None
+
+
+# PATCH에서 null로 보낼 수 없는 필드
+NOT_NULL_FIELDS = ("contract_number", "client_id", "status", "contract_date")
+
+
 class ClientInfo(BaseModel):
     id: int
     name: str
@@ -75,117 +107,118 @@ class ContractResponse(ContractBase):
         from_attributes = True
 
 
+def _contract_query(projection: Projection = CONTRACT_FULL):
+    """응답에 필요한 컬럼과 관계(거래처/영업자/항목)만 로딩하는 계약 조회 쿼리"""
+    return select(Contract).options(*projection.options())
+
+
 @router.get("/")
 async def get_contracts(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
     client_name: Optional[str] = None,
-    db: Session = Depends(get_db),
+    include_items: bool = True,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """계약 목록 조회"""
-    query = db.query(Contract)
+    """계약 목록 조회 (include_items=false이면 항목 제외, fields/expand로 응답 필드 지정)"""
+    default_expand = None if include_items else ("client", "salesperson")
+    projection = CONTRACTS.project(fields, expand, default_expand)
+    query = _contract_query(projection)
     
+    # 거래처 검색 색인으로 필터링 (조인 불필요)
     if client_name:
-        from app.models.client import Client
-        query = query.join(Client).filter(Client.name.contains(client_name))
+        query = query.where(client_search_filter(client_name, Contract.client_id))
     
     # 영업자는 자신의 계약만 조회
     if current_user.role.value == "sales" and not current_user.is_admin:
-        query = query.filter(Contract.salesperson_id == current_user.id)
+        query = query.where(Contract.salesperson_id == current_user.id)
+    
+    # 필터 결과가 바뀌지 않았으면 페이지를 조회/직렬화하지 않고 304
+    version = await list_version(db, query, projection, request, current_user, skip, limit, cursor, with_total)
+    if version.matches(request):
+        return version.not_modified()
+    version.apply(response)
     
-    contracts = query.options(
-        joinedload(Contract.client),
-        joinedload(Contract.salesperson)
-    ).offset(skip).limit(limit).all()
+    contracts = await paginate(db, query, Contract, response, skip, limit, cursor, with_total)
+    return json_response([projection.serialize(contract) for contract in contracts], response)
+
+
+@router.get("/export")
+async def export_contracts(
+    format: str = "csv",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    status: Optional[ContractStatus] = None,
+    client_name: Optional[str] = None,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    계약 내보내기 (format: csv, xlsx, ndjson)
+    date_from/date_to는 계약일 기준(당일 포함)입니다. 목록 조회와 달리 페이지 없이 조건에 맞는 전체를
+    스트리밍으로 응답합니다. csv/xlsx는 거래처/영업자를 열로 펼치고, 항목은 ndjson에서만 포함합니다.
+    """
+    default_expand = None if format == "ndjson" else ("client", "salesperson")
+    projection = CONTRACTS.project(fields, expand, default_expand)
+    query = _contract_query(projection).where(*date_range(Contract.contract_date, date_from, date_to))
     
-    # 관계 데이터를 수동으로 포함
-    result = []
-    for contract in contracts:
-        contract_dict = {
-            "id": contract.id,
-            "contract_number": contract.contract_number,
-            "client_id": contract.client_id,
-            "quotation_id": contract.quotation_id,
-            "salesperson_id": contract.salesperson_id,
-            "status": contract.status,
-            "contract_date": contract.contract_date,
-            "total_amount": contract.total_amount,
-            "notes": contract.notes,
-            "created_at": contract.created_at,
-            "updated_at": contract.updated_at,
-            "items": [{"id": item.id, "item_id": item.item_id, "quantity": item.quantity, 
-                      "unit_price": item.unit_price, "total_price": item.total_price, 
-                      "notes": item.notes} for item in contract.items],
-        }
-        if contract.client:
-            contract_dict["client"] = {
-                "id": contract.client.id,
-                "name": contract.client.name,
-            }
-        if contract.salesperson:
-            contract_dict["salesperson"] = {
-                "id": contract.salesperson.id,
-                "full_name": contract.salesperson.full_name,
-            }
-        result.append(contract_dict)
+    if status:
+        query = query.where(Contract.status == status)
+    if client_name:
+        query = query.where(client_search_filter(client_name, Contract.client_id))
     
-    return result
+    # 영업자는 자신의 계약만 내보내기
+    if current_user.role.value == "sales" and not current_user.is_admin:
+        query = query.where(Contract.salesperson_id == current_user.id)
+    
+    return export_response(query, projection, format, "contracts")
 
 
 @router.get("/{contract_id}", response_model=ContractResponse)
 async def get_contract(
     contract_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """계약 상세 조회"""
-    contract = db.query(Contract).options(
-        joinedload(Contract.client),
-        joinedload(Contract.salesperson),
-        joinedload(Contract.items)
-    ).filter(Contract.id == contract_id).first()
-    if not contract:
+    projection = CONTRACTS.project(fields, expand)
+    version = await detail_version(db, projection, request, current_user, Contract.id == contract_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다")
+    if version.matches(request):
+        return version.not_modified()
     
-    contract_dict = {
-        "id": contract.id,
-        "contract_number": contract.contract_number,
-        "client_id": contract.client_id,
-        "quotation_id": contract.quotation_id,
-        "salesperson_id": contract.salesperson_id,
-        "status": contract.status,
-        "contract_date": contract.contract_date,
-        "total_amount": contract.total_amount,
-        "notes": contract.notes,
-        "created_at": contract.created_at,
-        "updated_at": contract.updated_at,
-        "items": [{"id": item.id, "item_id": item.item_id, "quantity": item.quantity, 
-                  "unit_price": item.unit_price, "total_price": item.total_price, 
-                  "notes": item.notes} for item in contract.items],
-    }
-    if contract.client:
-        contract_dict["client"] = {
-            "id": contract.client.id,
-            "name": contract.client.name,
-        }
-    if contract.salesperson:
-        contract_dict["salesperson"] = {
-            "id": contract.salesperson.id,
-            "full_name": contract.salesperson.full_name,
-        }
+    contract = await db.scalar(_contract_query(projection).where(Contract.id == contract_id))
+    if not contract:
+        raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다")
+    version.apply(response)
     
-    return contract_dict
+    return json_response(projection.serialize(contract), response)
 
 
 @router.post("/", response_model=ContractResponse)
 async def create_contract(
     contract_data: ContractCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """계약 등록"""
     items_data = contract_data.items
+    # 품목 ID는 참조 데이터 캐시에서 한 번에 확인 (없는 품목이면 400)
+    references.check_items(item.item_id for item in items_data)
     contract_dict = contract_data.dict()
     contract_dict.pop("items")
     
@@ -197,7 +230,7 @@ async def create_contract(
         total_amount=total_amount
     )
     db.add(new_contract)
-    db.flush()
+    await db.flush()
     
     # 계약 항목 추가
     for item_data in items_data:
@@ -212,65 +245,94 @@ async def create_contract(
         )
         db.add(contract_item)
     
-    db.commit()
-    db.refresh(new_contract)
-    return new_contract
+    await db.commit()
+    
+    # 관계 데이터를 함께 로딩하여 반환
+    new_contract = await db.scalar(
+        _contract_query().where(Contract.id == new_contract.id).execution_options(populate_existing=True)
+    )
+    return json_response(contract_to_dict(new_contract))
 
 
 @router.put("/{contract_id}", response_model=ContractResponse)
 async def update_contract(
     contract_id: int,
-    contract_data: ContractCreate,
-    db: Session = Depends(get_db),
+    contract_data: ContractUpdate,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """계약 수정"""
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
+    """
+    계약 수정
+    항목은 기존 항목과 비교해 바뀐 항목만 수정/추가/삭제하고, 합계 금액은 요청 항목 전체로 다시 계산합니다.
+    """
+    contract = await db.get(Contract, contract_id)
     if not contract:
         raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다")
     
     items_data = contract_data.items
+    # 품목 ID는 참조 데이터 캐시에서 한 번에 확인 (없는 품목이면 400)
+    references.check_items(item.item_id for item in items_data)
     contract_dict = contract_data.dict()
     contract_dict.pop("items")
     
-    total_amount = sum(item.quantity * item.unit_price for item in items_data)
+    changes = await apply_line_items(db, ContractItem, ContractItem.contract_id, contract.id, items_data)
     
     for key, value in contract_dict.items():
         setattr(contract, key, value)
-    contract.total_amount = total_amount
+    contract.total_amount = line_total(items_data)
+    # 항목만 바뀌어도 응답 버전(ETag)이 바뀌도록 수정 시각 갱신 (바뀐 것이 없으면 쓰지 않음)
+    if changes or db.is_modified(contract):
+        contract.updated_at = datetime.utcnow()
     
-    # 기존 항목 삭제 후 새로 추가
-    db.query(ContractItem).filter(ContractItem.contract_id == contract_id).delete()
+    await db.commit()
     
-    for item_data in items_data:
-        total_price = item_data.quantity * item_data.unit_price
-        contract_item = ContractItem(
-            contract_id=contract.id,
-            item_id=item_data.item_id,
-            quantity=item_data.quantity,
-            unit_price=item_data.unit_price,
-            total_price=total_price,
-            notes=item_data.notes
-        )
-        db.add(contract_item)
+    contract = await db.scalar(
+        _contract_query().where(Contract.id == contract_id).execution_options(populate_existing=True)
+    )
+    return json_response(contract_to_dict(contract))
+
+
+@router.patch("/{contract_id}", response_model=ContractResponse)
+async def patch_contract(
+    contract_id: int,
+    contract_data: ContractPatch,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """계약 머리글 수정 (상태, 메모 등 보낸 필드만 반영, 항목은 읽거나 쓰지 않음)"""
+    contract = await db.get(Contract, contract_id)
+    if not contract:
+        raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다")
+    
+    contract_dict = contract_data.dict(exclude_unset=True)
+    empty = [key for key, value in contract_dict.items() if value is None and key in NOT_NULL_FIELDS]
+    if empty:
+        raise HTTPException(status_code=400, detail=f"비울 수 없는 항목입니다: {', '.join(empty)}")
+    
+    for key, value in contract_dict.items():
+        setattr(contract, key, value)
+    if db.is_modified(contract):
+        contract.updated_at = datetime.utcnow()
+        await db.commit()
     
-    db.commit()
-    db.refresh(contract)
-    return contract
+    contract = await db.scalar(
+        _contract_query().where(Contract.id == contract_id).execution_options(populate_existing=True)
+    )
+    return json_response(contract_to_dict(contract))
 
 
 @router.delete("/{contract_id}")
 async def delete_contract(
     contract_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """계약 삭제"""
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
+    contract = await db.get(Contract, contract_id)
     if not contract:
         raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다")
     
-    db.delete(contract)
-    db.commit()
+    await db.delete(contract)
+    await db.commit()
     return {"message": "계약이 삭제되었습니다"}
 
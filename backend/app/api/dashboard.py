@@ -0,0 +1,118 @@
+"""
+대시보드 요약 API
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, date, timedelta, timezone
+from typing import Tuple
+from zoneinfo import ZoneInfo
+import threading
+import time
+from app.db.database import get_db
+from app.db.dependencies import get_current_user
+from app.models.consultation import Consultation
+from app.models.contract import Contract, ContractStatus
+from app.models.installation import Installation, InstallationStatus
+from app.models.inventory import LOW_STOCK, Inventory
+from app.schemas.auth import CurrentUser
+from app.core.config import settings
+
+router = APIRouter()
+
+# 요약 결과 캐시: {scope_key: (만료시각, 결과)}
+_summary_cache = {}
+_summary_cache_lock = threading.Lock()
+
+
+def _today() -> date:
+    """오늘 날짜 (업무 시간대 TIMEZONE 기준)"""
+    return datetime.now(ZoneInfo(settings.TIMEZONE)).date()
+
+
+def _day_range(day: date) -> Tuple[datetime, datetime]:
+    """업무 시간대의 하루를 저장 형식(UTC, 시간대 없음)의 [시작, 끝) 범위로 변환"""
+    zone = ZoneInfo(settings.TIMEZONE)
+
+    def to_utc(moment: date) -> datetime:
+        local = datetime.combine(moment, datetime.min.time(), tzinfo=zone)
+        return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return to_utc(day), to_utc(day + timedelta(days=1))
+
+
+def _scope_key(user: CurrentUser) -> tuple:
+    """목록 라우터와 동일한 역할 범위를 캐시 키로 변환 (날짜가 바뀌면 새로 집계)"""
+    if user.is_admin:
+        return ("admin", _today())
+    return (user.role.value, user.id, _today())
+
+
+async def _compute_summary(db: AsyncSession, user: CurrentUser) -> dict:
+    """COUNT/GROUP BY 집계로 대시보드 수치 계산"""
+    is_sales = user.role.value == "sales" and not user.is_admin
+    is_technician = user.role.value == "technician" and not user.is_admin
+
+    # 오늘의 상담 (업무 시간대의 오늘 0시 ~ 내일 0시를 UTC로 변환해 비교)
+    today_start, today_end = _day_range(_today())
+    consultation_query = select(func.count(Consultation.id)).where(
+        Consultation.consultation_date >= today_start,
+        Consultation.consultation_date < today_end
+    )
+    if is_sales:
+        consultation_query = consultation_query.where(Consultation.salesperson_id == user.id)
+    today_consultations = await db.scalar(consultation_query) or 0
+
+    # 계약 상태별 건수
+    contract_query = select(Contract.status, func.count(Contract.id))
+    if is_sales:
+        contract_query = contract_query.where(Contract.salesperson_id == user.id)
+    contract_rows = await db.execute(contract_query.group_by(Contract.status))
+    contracts_by_status = {status.value: count for status, count in contract_rows}
+    in_progress_contracts = (
+        contracts_by_status.get(ContractStatus.IN_PROGRESS.value, 0)
+        + contracts_by_status.get(ContractStatus.SIGNED.value, 0)
+    )
+
+    # 대기 중인 작업
+    installation_query = select(func.count(Installation.id)).where(
+        Installation.status == InstallationStatus.PENDING
+    )
+    if is_technician:
+        installation_query = installation_query.where(Installation.technician_id == user.id)
+    pending_tasks = await db.scalar(installation_query) or 0
+
+    # 재고 알림 (재고는 관리자만 조회 가능)
+    low_stock_items = None
+    if user.is_admin:
+        # 부족 재고 부분 인덱스만 읽음
+        low_stock_items = await db.scalar(select(func.count(Inventory.id)).where(LOW_STOCK)) or 0
+
+    return {
+        "today_consultations": today_consultations,
+        "in_progress_contracts": in_progress_contracts,
+        "contracts_by_status": contracts_by_status,
+        "pending_tasks": pending_tasks,
+        "low_stock_items": low_stock_items,
+        "generated_at": datetime.utcnow(),
+    }
+
+
+@router.get("/summary")
+async def get_dashboard_summary(
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """대시보드 요약 조회 (짧은 TTL 캐시 적용)"""
+    key = _scope_key(current_user)
+    now = time.monotonic()
+
+    with _summary_cache_lock:
+        cached = _summary_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    summary = await _compute_summary(db, current_user)
+    with _summary_cache_lock:
+        _summary_cache[key] = (now + settings.DASHBOARD_CACHE_TTL_SECONDS, summary)
+    return summary
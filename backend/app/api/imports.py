@@ -0,0 +1,127 @@
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.client import ClientCreate
+from app.api.item import ItemCreate
+from app.db import bulk_import
+from app.db.dependencies import get_current_user
+from app.models.import_job import ImportJob
+from app.models.user import User
+from pydantic import BaseModel
+
+router = APIRouter()
+
+
+class InventoryImportRow(BaseModel):
+    item_code: str
+    quantity: int
+    min_stock_level: int = 0
+    location: Optional[str] = None
+    notes: Optional[str] = None
+
+
+# 가져오기 대상 (첫 행에는 필드명 또는 한글 열 이름)
+TARGETS = {
+    "clients": bulk_import.ClientImport(ClientCreate, {
+        "name": "거래처명", "client_type": "구분",
+        "personal_name": "성명", "personal_phone": "휴대폰", "personal_email": "이메일",
+        "company_name": "회사명", "business_number": "사업자번호", "representative_name": "대표자명",
+        "company_phone": "회사전화", "company_email": "회사이메일", "address": "주소", "notes": "메모",
+    }),
+    "items": bulk_import.ItemImport(ItemCreate, {
+        "code": "품목코드", "name": "품목명", "description": "설명", "unit_price": "단가", "unit": "단위",
+    }),
+    "inventory": bulk_import.InventoryImport(InventoryImportRow, {
+        "item_code": "품목코드", "quantity": "수량", "min_stock_level": "최소재고", "location": "위치", "notes": "메모",
+    }),
+}
+
+JOB_COLUMNS = (
+    "id", "target", "filename", "status", "total_rows", "inserted_rows", "error_count",
+    "message", "created_by", "created_at", "started_at", "finished_at",
+)
+
+
+def _job_to_dict(job: ImportJob, include_errors: bool = False) -> dict:
+    data = {name: getattr(job, name) for name in JOB_COLUMNS}
+    if include_errors:
+        data["errors"] = job.errors or []
+    return data
+
+
+def _job_query(current_user: User):
+    """관리자가 아니면 자신이 올린 작업만"""
+    query = select(ImportJob)
+    if not current_user.is_admin:
+        query = query.where(ImportJob.created_by == current_user.id)
+    return query
+
+
+async def _fail_stale_jobs(db: AsyncSession):
+    """맡은 프로세스가 종료되어 멈춘 작업은 조회 전에 실패로 처리 (대상이 있을 때만 쓰기)"""
+    if await db.scalar(select(ImportJob.id).where(bulk_import.stale_jobs()).limit(1)) is not None:
+        await db.execute(bulk_import.fail_stale_jobs_statement())
+        await db.commit()
+
+
+@router.post("/{target}", status_code=202)
+async def create_import(
+    target: str,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    CSV/XLSX 파일 가져오기 (clients, items, inventory)
+    파일을 저장한 뒤 바로 작업 ID를 응답하고 백그라운드에서 가져옵니다.
+    진행 상황과 행별 오류는 GET /api/imports/{job_id}로 조회합니다.
+    """
+    if target not in TARGETS:
+        raise HTTPException(status_code=404, detail="가져올 수 없는 항목입니다")
+    import_target = TARGETS[target]
+    if import_target.admin_only and not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
+
+    try:
+        suffix = bulk_import.file_format(file.filename)
+        path = await run_in_threadpool(bulk_import.save_upload, file.file, suffix)
+    except bulk_import.BulkImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    job = ImportJob(target=target, filename=file.filename, created_by=current_user.id)
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+
+    bulk_import.submit(job.id, import_target, path)
+    return json_response(_job_to_dict(job), status_code=202)
+
+
+@router.get("/")
+async def get_imports(
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """최근 가져오기 작업 목록"""
+    await _fail_stale_jobs(db)
+    jobs = await db.scalars(_job_query(current_user).order_by(ImportJob.id.desc()).limit(limit))
+    return json_response([_job_to_dict(job) for job in jobs])
+
+
+@router.get("/{job_id}")
+async def get_import(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """가져오기 작업 상태와 행별 오류"""
+    await _fail_stale_jobs(db)
+    job = await db.scalar(_job_query(current_user).where(ImportJob.id == job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="가져오기 작업을 찾을 수 없습니다")
+    return json_response(_job_to_dict(job, include_errors=True))
@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Response, Request
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import INSTALLATIONS, INSTALLATION_FULL, Projection, installation_to_dict
+from app.db.pagination import paginate
+from app.core.export import date_range, export_response
+from app.db.conditional import detail_version, list_version
 from app.db.dependencies import get_current_user
+from app.db import stock
+from app.core import uploads
 from app.models.installation import Installation, InstallationType, InstallationStatus
 from app.models.user import User
 from pydantic import BaseModel
 from datetime import datetime, date
-import os
-import shutil
-from app.core.config import settings
 
 router = APIRouter()
 
@@ -50,6 +55,8 @@ class InstallationResponse(InstallationBase):
     completed_date: Optional[datetime] = None
     photo_url_1: Optional[str] = None
     photo_url_2: Optional[str] = None
+    photo_thumb_url_1: Optional[str] = None
+    photo_thumb_url_2: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     client: Optional[ClientInfo] = None
@@ -59,124 +66,118 @@ class InstallationResponse(InstallationBase):
         from_attributes = True
 
 
+def _installation_query(projection: Projection = INSTALLATION_FULL):
+    """응답에 필요한 컬럼과 관계(거래처/기사)만 로딩하는 설치/AS 조회 쿼리"""
+    return select(Installation).options(*projection.options())
+
+
 @router.get("/")
 async def get_installations(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
     status: Optional[InstallationStatus] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """설치/AS 목록 조회"""
-    query = db.query(Installation)
+    """설치/AS 목록 조회 (fields/expand로 응답 필드 지정)"""
+    projection = INSTALLATIONS.project(fields, expand)
+    query = _installation_query(projection)
     
     if status:
-        query = query.filter(Installation.status == status)
+        query = query.where(Installation.status == status)
     
     # 기사는 자신의 작업만 조회
     if current_user.role.value == "technician" and not current_user.is_admin:
-        query = query.filter(Installation.technician_id == current_user.id)
+        query = query.where(Installation.technician_id == current_user.id)
+    
+    # 필터 결과가 바뀌지 않았으면 페이지를 조회/직렬화하지 않고 304
+    version = await list_version(db, query, projection, request, current_user, skip, limit, cursor, with_total)
+    if version.matches(request):
+        return version.not_modified()
+    version.apply(response)
+    
+    installations = await paginate(db, query, Installation, response, skip, limit, cursor, with_total)
+    return json_response([projection.serialize(installation) for installation in installations], response)
+
+
+@router.get("/export")
+async def export_installations(
+    format: str = "csv",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    status: Optional[InstallationStatus] = None,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    설치/AS 내보내기 (format: csv, xlsx, ndjson)
+    date_from/date_to는 예정일 기준(당일 포함)입니다. 목록 조회와 달리 페이지 없이 조건에 맞는 전체를
+    스트리밍으로 응답합니다. csv/xlsx는 거래처/기사를 열로 펼칩니다.
+    """
+    projection = INSTALLATIONS.project(fields, expand)
+    query = _installation_query(projection).where(*date_range(Installation.scheduled_date, date_from, date_to))
     
-    installations = query.options(
-        joinedload(Installation.client),
-        joinedload(Installation.technician)
-    ).offset(skip).limit(limit).all()
+    if status:
+        query = query.where(Installation.status == status)
     
-    # 관계 데이터를 수동으로 포함
-    result = []
-    for installation in installations:
-        installation_dict = {
-            "id": installation.id,
-            "contract_id": installation.contract_id,
-            "client_id": installation.client_id,
-            "technician_id": installation.technician_id,
-            "installation_type": installation.installation_type,
-            "status": installation.status,
-            "scheduled_date": installation.scheduled_date,
-            "completed_date": installation.completed_date,
-            "result_text": installation.result_text,
-            "photo_url_1": installation.photo_url_1,
-            "photo_url_2": installation.photo_url_2,
-            "notes": installation.notes,
-            "created_at": installation.created_at,
-            "updated_at": installation.updated_at,
-        }
-        if installation.client:
-            installation_dict["client"] = {
-                "id": installation.client.id,
-                "name": installation.client.name,
-            }
-        if installation.technician:
-            installation_dict["technician"] = {
-                "id": installation.technician.id,
-                "full_name": installation.technician.full_name,
-            }
-        result.append(installation_dict)
+    # 기사는 자신의 작업만 내보내기
+    if current_user.role.value == "technician" and not current_user.is_admin:
+        query = query.where(Installation.technician_id == current_user.id)
     
-    return result
+    return export_response(query, projection, format, "installations")
 
 
 @router.get("/{installation_id}", response_model=InstallationResponse)
 async def get_installation(
     installation_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """설치/AS 상세 조회"""
-    installation = db.query(Installation).options(
-        joinedload(Installation.client),
-        joinedload(Installation.technician)
-    ).filter(Installation.id == installation_id).first()
-    if not installation:
+    projection = INSTALLATIONS.project(fields, expand)
+    version = await detail_version(db, projection, request, current_user, Installation.id == installation_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="설치/AS를 찾을 수 없습니다")
+    if version.matches(request):
+        return version.not_modified()
     
-    installation_dict = {
-        "id": installation.id,
-        "contract_id": installation.contract_id,
-        "client_id": installation.client_id,
-        "technician_id": installation.technician_id,
-        "installation_type": installation.installation_type,
-        "status": installation.status,
-        "scheduled_date": installation.scheduled_date,
-        "completed_date": installation.completed_date,
-        "result_text": installation.result_text,
-        "photo_url_1": installation.photo_url_1,
-        "photo_url_2": installation.photo_url_2,
-        "notes": installation.notes,
-        "created_at": installation.created_at,
-        "updated_at": installation.updated_at,
-    }
-    if installation.client:
-        installation_dict["client"] = {
-            "id": installation.client.id,
-            "name": installation.client.name,
-        }
-    if installation.technician:
-        installation_dict["technician"] = {
-            "id": installation.technician.id,
-            "full_name": installation.technician.full_name,
-        }
+    installation = await db.scalar(_installation_query(projection).where(Installation.id == installation_id))
+    if not installation:
+        raise HTTPException(status_code=404, detail="설치/AS를 찾을 수 없습니다")
+    version.apply(response)
     
-    return installation_dict
+    return json_response(projection.serialize(installation), response)
 
 
 @router.get("/client/{client_id}/history", response_model=List[InstallationResponse])
 async def get_client_installation_history(
     client_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """고객의 설치/AS 이력 조회"""
-    installations = db.query(Installation).filter(
+    installations = await db.scalars(_installation_query().where(
         Installation.client_id == client_id
-    ).order_by(Installation.created_at.desc()).all()
-    return installations
+    ).order_by(Installation.created_at.desc()))
+    return json_response([installation_to_dict(installation) for installation in installations])
 
 
 @router.post("/", response_model=InstallationResponse)
 async def create_installation(
     installation_data: InstallationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """설치/AS 등록 (관리자만)"""
@@ -188,9 +189,13 @@ async def create_installation(
         technician_id=current_user.id
     )
     db.add(new_installation)
-    db.commit()
-    db.refresh(new_installation)
-    return new_installation
+    await db.commit()
+    
+    # 관계 데이터를 함께 로딩하여 반환
+    new_installation = await db.scalar(
+        _installation_query().where(Installation.id == new_installation.id).execution_options(populate_existing=True)
+    )
+    return json_response(installation_to_dict(new_installation))
 
 
 @router.put("/{installation_id}/complete", response_model=InstallationResponse)
@@ -199,11 +204,16 @@ async def complete_installation(
     result_text: str,
     photo1: Optional[UploadFile] = File(None),
     photo2: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """설치/AS 완료 처리 (사진 최대 2장)"""
-    installation = db.query(Installation).filter(Installation.id == installation_id).first()
+    """
+    설치/AS 완료 처리 (사진 최대 2장)
+    계약이 연결된 설치 작업을 처음 완료하면 계약 항목 수량만큼 재고를 일괄 출고합니다
+    (재고가 부족한 품목이 있으면 400, 완료 처리도 취소).
+    사진은 검증이 모두 끝난 뒤에 공개 경로로 옮기므로, 실패한 요청의 사진은 남지 않습니다.
+    """
+    installation = await db.get(Installation, installation_id)
     if not installation:
         raise HTTPException(status_code=404, detail="설치/AS를 찾을 수 없습니다")
     
@@ -212,72 +222,83 @@ async def complete_installation(
         if installation.technician_id != current_user.id:
             raise HTTPException(status_code=403, detail="권한이 없습니다")
     
-    # 업로드 디렉토리 생성
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-    
-    # 사진 업로드 처리
-    photo_url_1 = None
-    photo_url_2 = None
-    
-    if photo1:
-        file_path = os.path.join(settings.UPLOAD_DIR, f"installation_{installation_id}_1.jpg")
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(photo1.file, buffer)
-        photo_url_1 = f"/uploads/installation_{installation_id}_1.jpg"
-    
-    if photo2:
-        file_path = os.path.join(settings.UPLOAD_DIR, f"installation_{installation_id}_2.jpg")
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(photo2.file, buffer)
-        photo_url_2 = f"/uploads/installation_{installation_id}_2.jpg"
+    # 사진 준비 (스레드에서 크기 제한을 확인하며 임시 파일로 복사, 프로세스 풀에서 EXIF 제거)
+    # 쓰기 트랜잭션을 시작하기 전에 처리해 이미지 처리 동안 DB 잠금을 잡지 않음
+    prepared = []
+    try:
+        for photo in (photo1, photo2):
+            prepared.append(await uploads.prepare_photo(photo) if photo else None)
+        
+        # 완료 전환은 조건부 UPDATE로 한 번만 성공하므로 동시에 완료해도 출고는 한 번
+        completed = await db.execute(
+            update(Installation)
+            .where(Installation.id == installation_id, Installation.status != InstallationStatus.COMPLETED)
+            .values(status=InstallationStatus.COMPLETED),
+            execution_options={"synchronize_session": False},
+        )
+        if (completed.rowcount and installation.installation_type == InstallationType.INSTALLATION
+                and installation.contract_id):
+            await stock.post_installation_out(db, installation, current_user.id)
+        
+        # 검증이 끝났으므로 사진 공개 (내용 해시 경로, 썸네일은 백그라운드 생성)
+        stored_1, stored_2 = (uploads.publish(photo) if photo else uploads.photo_urls(None) for photo in prepared)
+    finally:
+        for photo in prepared:
+            uploads.discard(photo)
     
     installation.status = InstallationStatus.COMPLETED
     installation.completed_date = datetime.utcnow()
     installation.result_text = result_text
-    installation.photo_url_1 = photo_url_1
-    installation.photo_url_2 = photo_url_2
+    installation.photo_url_1, installation.photo_thumb_url_1 = stored_1
+    installation.photo_url_2, installation.photo_thumb_url_2 = stored_2
+    
+    await db.commit()
     
-    db.commit()
-    db.refresh(installation)
-    return installation
+    installation = await db.scalar(
+        _installation_query().where(Installation.id == installation_id).execution_options(populate_existing=True)
+    )
+    return json_response(installation_to_dict(installation))
 
 
 @router.put("/{installation_id}", response_model=InstallationResponse)
 async def update_installation(
     installation_id: int,
     installation_data: InstallationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """설치/AS 수정"""
-    installation = db.query(Installation).filter(Installation.id == installation_id).first()
+    installation = await db.get(Installation, installation_id)
     if not installation:
         raise HTTPException(status_code=404, detail="설치/AS를 찾을 수 없습니다")
     
     for key, value in installation_data.dict().items():
         setattr(installation, key, value)
     
-    db.commit()
-    db.refresh(installation)
-    return installation
+    await db.commit()
+    
+    installation = await db.scalar(
+        _installation_query().where(Installation.id == installation_id).execution_options(populate_existing=True)
+    )
+    return json_response(installation_to_dict(installation))
 
 
 @router.delete("/{installation_id}")
 async def delete_installation(
     installation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """설치/AS 삭제"""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
     
-    installation = db.query(Installation).filter(Installation.id == installation_id).first()
+    installation = await db.get(Installation, installation_id)
     if not installation:
         raise HTTPException(status_code=404, detail="설치/AS를 찾을 수 없습니다")
     
-    db.delete(installation)
-    db.commit()
+    await db.delete(installation)
+    await db.commit()
     return {"message": "설치/AS가 삭제되었습니다"}
 
 
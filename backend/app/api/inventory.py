@@ -1,10 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response, Request
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import (
+    INVENTORY, INVENTORY_FULL, STOCK_MOVEMENTS, Projection, inventory_to_dict, stock_movement_to_dict,
+)
+from app.db.pagination import (
+    NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, decode_key_cursor, encode_key_cursor, paginate,
+)
+from app.db.conditional import detail_version, list_version
 from app.db.dependencies import get_current_admin
-from app.models.inventory import Inventory
+from app.db import stock
+from app.models.inventory import LOW_STOCK, STOCK_MARGIN, Inventory
 from app.models.item import Item
+from app.models.stock_movement import MovementType, StockMovement
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -33,114 +44,139 @@ class InventoryResponse(InventoryBase):
         from_attributes = True
 
 
+def _inventory_query(projection: Projection = INVENTORY_FULL):
+    """응답에 필요한 컬럼과 관계(품목)만 로딩하는 재고 조회 쿼리"""
+    return select(Inventory).options(*projection.options())
+
+
 @router.get("/")
 async def get_inventory(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    with_total: bool = False,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
-    """재고 목록 조회"""
-    inventory_list = db.query(Inventory).options(
-        joinedload(Inventory.item)
-    ).offset(skip).limit(limit).all()
+    """재고 목록 조회 (fields/expand로 응답 필드 지정)"""
+    projection = INVENTORY.project(fields, expand)
+    query = _inventory_query(projection)
+    # 필터 결과가 바뀌지 않았으면 페이지를 조회/직렬화하지 않고 304
+    version = await list_version(db, query, projection, request, current_user, skip, limit, cursor, with_total)
+    if version.matches(request):
+        return version.not_modified()
+    version.apply(response)
     
-    # 관계 데이터를 수동으로 포함
-    result = []
-    for inv in inventory_list:
-        inv_dict = {
-            "id": inv.id,
-            "item_id": inv.item_id,
-            "quantity": inv.quantity,
-            "min_stock_level": inv.min_stock_level,
-            "location": inv.location,
-            "notes": inv.notes,
-            "created_at": inv.created_at,
-            "updated_at": inv.updated_at,
-        }
-        if inv.item:
-            inv_dict["item"] = {
-                "id": inv.item.id,
-                "name": inv.item.name,
-                "code": inv.item.code,
-            }
-        result.append(inv_dict)
+    inventory_list = await paginate(db, query, Inventory, response, skip, limit, cursor, with_total)
+    return json_response([projection.serialize(inv) for inv in inventory_list], response)
+
+
+@router.get("/low-stock")
+async def get_low_stock(
+    response: Response,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    부족 재고 목록 (현재 수량 <= 최소 재고량, 부족량이 큰 순)
+    부족한 행만 담은 부분 인덱스를 여유 수량 순으로 읽으므로 전체 재고를 읽지 않으며,
+    항목마다 shortage(최소 재고량 - 현재 수량)를 함께 응답합니다. 다음 페이지는 X-Next-Cursor로 조회합니다.
+    """
+    projection = INVENTORY.project(fields, expand)
+    query = _inventory_query(projection).where(LOW_STOCK)
+    if with_total:
+        total = await db.scalar(query.with_only_columns(func.count(Inventory.id)))
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+    if cursor:
+        margin, last_id = decode_key_cursor(cursor, (int, int))
+        # 행 값 비교만으로는 식 인덱스의 시작 위치를 찾지 않으므로 범위 조건을 함께 지정
+        query = query.where(STOCK_MARGIN >= margin, tuple_(STOCK_MARGIN, Inventory.id) > tuple_(margin, last_id))
     
-    return result
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    rows = (await db.execute(
+        query.add_columns(STOCK_MARGIN).order_by(STOCK_MARGIN, Inventory.id).limit(limit + 1)
+    )).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if rows:
+            response.headers[NEXT_CURSOR_HEADER] = encode_key_cursor([rows[-1][1], rows[-1][0].id])
+    return json_response(
+        [{**projection.serialize(inventory), "shortage": -margin} for inventory, margin in rows], response
+    )
 
 
 @router.get("/{inventory_id}")
 async def get_inventory_item(
     inventory_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """재고 상세 조회"""
-    inventory = db.query(Inventory).options(
-        joinedload(Inventory.item)
-    ).filter(Inventory.id == inventory_id).first()
-    if not inventory:
+    projection = INVENTORY.project(fields, expand)
+    version = await detail_version(db, projection, request, current_user, Inventory.id == inventory_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="재고를 찾을 수 없습니다")
+    if version.matches(request):
+        return version.not_modified()
     
-    inventory_dict = {
-        "id": inventory.id,
-        "item_id": inventory.item_id,
-        "quantity": inventory.quantity,
-        "min_stock_level": inventory.min_stock_level,
-        "location": inventory.location,
-        "notes": inventory.notes,
-        "created_at": inventory.created_at,
-        "updated_at": inventory.updated_at,
-    }
-    if inventory.item:
-        inventory_dict["item"] = {
-            "id": inventory.item.id,
-            "name": inventory.item.name,
-            "code": inventory.item.code,
-        }
+    inventory = await db.scalar(_inventory_query(projection).where(Inventory.id == inventory_id))
+    if not inventory:
+        raise HTTPException(status_code=404, detail="재고를 찾을 수 없습니다")
+    version.apply(response)
     
-    return inventory_dict
+    return json_response(projection.serialize(inventory), response)
 
 
 @router.post("/")
 async def create_inventory(
     inventory_data: InventoryCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """재고 등록"""
     # 품목 확인
-    item = db.query(Item).filter(Item.id == inventory_data.item_id).first()
+    item = await db.get(Item, inventory_data.item_id)
     if not item:
         raise HTTPException(status_code=404, detail="품목을 찾을 수 없습니다")
     
     # 이미 재고가 있는지 확인
-    existing = db.query(Inventory).filter(Inventory.item_id == inventory_data.item_id).first()
+    existing = await db.scalar(select(Inventory).where(Inventory.item_id == inventory_data.item_id))
     if existing:
         raise HTTPException(status_code=400, detail="이미 재고가 등록된 품목입니다")
     
     new_inventory = Inventory(**inventory_data.dict())
     db.add(new_inventory)
-    db.commit()
-    db.refresh(new_inventory)
+    if new_inventory.quantity:
+        # 기초 재고 입고 기록
+        db.add(StockMovement(
+            item_id=new_inventory.item_id, movement_type=MovementType.IN, quantity=new_inventory.quantity,
+            balance=new_inventory.quantity, notes="재고 등록", created_by=current_user.id,
+        ))
+    await db.commit()
     
     # 관계 데이터 포함하여 반환
-    inventory_dict = {
-        "id": new_inventory.id,
-        "item_id": new_inventory.item_id,
-        "quantity": new_inventory.quantity,
-        "min_stock_level": new_inventory.min_stock_level,
-        "location": new_inventory.location,
-        "notes": new_inventory.notes,
-        "created_at": new_inventory.created_at,
-        "updated_at": new_inventory.updated_at,
-    }
-    
-    return inventory_dict
+    new_inventory = await db.scalar(
+        _inventory_query().where(Inventory.id == new_inventory.id).execution_options(populate_existing=True)
+    )
+    return json_response(inventory_to_dict(new_inventory))
 
 
 class InventoryUpdate(BaseModel):
     quantity: int
+    expected_quantity: Optional[int] = None  # 수정 화면에 불러온 수량 (수량을 바꿀 때 필수)
     min_stock_level: int = 0
     location: Optional[str] = None
     notes: Optional[str] = None
@@ -150,57 +186,99 @@ class InventoryUpdate(BaseModel):
 async def update_inventory(
     inventory_id: int,
     inventory_data: InventoryUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
-    """재고 수정 (품목은 변경 불가)"""
-    inventory = db.query(Inventory).options(
-        joinedload(Inventory.item)
-    ).filter(Inventory.id == inventory_id).first()
+    """
+    재고 수정 (품목은 변경 불가)
+    수량은 현재 수량이 expected_quantity(화면에 불러온 수량)와 같을 때만 지정한 값으로 바꾸고
+    차이를 조정으로 기록합니다 (그 사이 다른 수정이나 입출고가 있었으면 409, expected_quantity가 없으면 428).
+    입출고는 POST /{inventory_id}/movements를 사용하세요.
+    """
+    inventory = await db.get(Inventory, inventory_id)
     if not inventory:
         raise HTTPException(status_code=404, detail="재고를 찾을 수 없습니다")
     
+    await stock.set_quantity(db, inventory, inventory_data.quantity, inventory_data.expected_quantity,
+                             current_user.id)
     # item_id는 변경하지 않음 (품목은 변경 불가)
-    for key, value in inventory_data.dict().items():
+    for key, value in inventory_data.dict(exclude={"quantity", "expected_quantity"}).items():
         setattr(inventory, key, value)
     
-    db.commit()
-    db.refresh(inventory)
+    await db.commit()
     
     # 관계 데이터 포함하여 반환
-    inventory_dict = {
-        "id": inventory.id,
-        "item_id": inventory.item_id,
-        "quantity": inventory.quantity,
-        "min_stock_level": inventory.min_stock_level,
-        "location": inventory.location,
-        "notes": inventory.notes,
-        "created_at": inventory.created_at,
-        "updated_at": inventory.updated_at,
-    }
-    if inventory.item:
-        inventory_dict["item"] = {
-            "id": inventory.item.id,
-            "name": inventory.item.name,
-            "code": inventory.item.code,
-        }
+    inventory = await db.scalar(
+        _inventory_query().where(Inventory.id == inventory_id).execution_options(populate_existing=True)
+    )
+    return json_response(inventory_to_dict(inventory))
+
+
+class MovementCreate(BaseModel):
+    movement_type: MovementType
+    quantity: int  # 입고/출고는 1 이상, 조정은 증감 수량 (음수는 감소)
+    notes: Optional[str] = None
+
+
+@router.get("/{inventory_id}/movements")
+async def get_stock_movements(
+    inventory_id: int,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
+    movement_type: Optional[MovementType] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """재고 수불 내역 조회 (등록 순)"""
+    item_id = await db.scalar(select(Inventory.item_id).where(Inventory.id == inventory_id))
+    if item_id is None:
+        raise HTTPException(status_code=404, detail="재고를 찾을 수 없습니다")
+    
+    projection = STOCK_MOVEMENTS.project(fields)
+    query = select(StockMovement).options(*projection.options()).where(StockMovement.item_id == item_id)
+    if movement_type:
+        query = query.where(StockMovement.movement_type == movement_type)
     
-    return inventory_dict
+    movements = await paginate(db, query, StockMovement, response, skip, limit, cursor, with_total)
+    return json_response([projection.serialize(movement) for movement in movements], response)
+
+
+@router.post("/{inventory_id}/movements")
+async def create_stock_movement(
+    inventory_id: int,
+    movement_data: MovementCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    입고/출고/조정 (조건부 UPDATE로 현재 수량에 바로 반영)
+    출고/감소 후 수량이 0 미만이 되면 400이며, 응답의 balance가 반영 후 수량입니다.
+    """
+    quantity = stock.signed_quantity(movement_data.movement_type, movement_data.quantity)
+    movement = await stock.record_movement(
+        db, inventory_id, movement_data.movement_type, quantity, current_user.id, movement_data.notes
+    )
+    await db.commit()
+    return json_response(stock_movement_to_dict(movement))
 
 
 @router.delete("/{inventory_id}")
 async def delete_inventory(
     inventory_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """재고 삭제"""
-    inventory = db.query(Inventory).filter(Inventory.id == inventory_id).first()
+    inventory = await db.get(Inventory, inventory_id)
     if not inventory:
         raise HTTPException(status_code=404, detail="재고를 찾을 수 없습니다")
     
-    db.delete(inventory)
-    db.commit()
+    await db.delete(inventory)
+    await db.commit()
     return {"message": "재고가 삭제되었습니다"}
 
 
@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import ITEMS, ITEM_FULL, item_to_dict
+from app.db.pagination import paginate
+from app.db.conditional import detail_version, list_version
 from app.db.dependencies import get_current_admin
 from app.models.item import Item
 from pydantic import BaseModel
@@ -35,90 +40,111 @@ class ItemResponse(ItemBase):
 
 @router.get("/", response_model=List[ItemResponse])
 async def get_items(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
-    """품목 목록 조회"""
-    query = db.query(Item)
+    """품목 목록 조회 (fields로 응답 필드 지정)"""
+    projection = ITEMS.project(fields)
+    query = select(Item).options(*projection.options())
     
     if search:
-        query = query.filter(Item.name.contains(search))
+        query = query.where(Item.name.contains(search))
     
-    items = query.offset(skip).limit(limit).all()
-    return items
+    # 필터 결과가 바뀌지 않았으면 페이지를 조회/직렬화하지 않고 304
+    version = await list_version(db, query, projection, request, current_user, skip, limit, cursor, with_total)
+    if version.matches(request):
+        return version.not_modified()
+    version.apply(response)
+    
+    items = await paginate(db, query, Item, response, skip, limit, cursor, with_total)
+    return json_response([projection.serialize(row) for row in items], response)
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
 async def get_item(
     item_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """품목 상세 조회"""
-    item = db.query(Item).filter(Item.id == item_id).first()
+    version = await detail_version(db, ITEM_FULL, request, current_user, Item.id == item_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="품목을 찾을 수 없습니다")
+    if version.matches(request):
+        return version.not_modified()
+    
+    item = await db.get(Item, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="품목을 찾을 수 없습니다")
-    return item
+    version.apply(response)
+    return json_response(item_to_dict(item), response)
 
 
 @router.post("/", response_model=ItemResponse)
 async def create_item(
     item_data: ItemCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """품목 등록"""
-    if db.query(Item).filter(Item.code == item_data.code).first():
+    if await db.scalar(select(Item).where(Item.code == item_data.code)):
         raise HTTPException(status_code=400, detail="이미 사용 중인 품목 코드입니다")
     
     new_item = Item(**item_data.dict())
     db.add(new_item)
-    db.commit()
-    db.refresh(new_item)
-    return new_item
+    await db.commit()
+    await db.refresh(new_item)
+    return json_response(item_to_dict(new_item))
 
 
 @router.put("/{item_id}", response_model=ItemResponse)
 async def update_item(
     item_id: int,
     item_data: ItemCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """품목 수정"""
-    item = db.query(Item).filter(Item.id == item_id).first()
+    item = await db.get(Item, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="품목을 찾을 수 없습니다")
     
     # 코드 중복 확인
     if item_data.code != item.code:
-        if db.query(Item).filter(Item.code == item_data.code).first():
+        if await db.scalar(select(Item).where(Item.code == item_data.code)):
             raise HTTPException(status_code=400, detail="이미 사용 중인 품목 코드입니다")
     
     for key, value in item_data.dict().items():
         setattr(item, key, value)
     
-    db.commit()
-    db.refresh(item)
-    return item
+    await db.commit()
+    await db.refresh(item)
+    return json_response(item_to_dict(item))
 
 
 @router.delete("/{item_id}")
 async def delete_item(
     item_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """품목 삭제"""
-    item = db.query(Item).filter(Item.id == item_id).first()
+    item = await db.get(Item, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="품목을 찾을 수 없습니다")
     
     item.is_active = False
-    db.commit()
+    await db.commit()
     return {"message": "품목이 비활성화되었습니다"}
 
 
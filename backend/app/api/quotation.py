@@ -1,12 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response, Request
+from sqlalchemy import select, insert, literal
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import QUOTATIONS, QUOTATION_FULL, CONTRACT_FULL, Projection, quotation_to_dict, contract_to_dict
+from app.api.contract import ContractResponse
+from app.db.pagination import paginate
+from app.core.export import date_range, export_response
+from app.db.line_items import apply_line_items, line_total
+from app.db import references
+from app.db.conditional import detail_version, list_version
+from app.db.client_search import client_search_filter
 from app.db.dependencies import get_current_user
 from app.models.quotation import Quotation, QuotationItem, QuotationStatus
+from app.models.contract import Contract, ContractItem, ContractStatus
 from app.models.user import User
-from pydantic import BaseModel
-from datetime import datetime
+from pydantic import BaseModel, Field
+from datetime import datetime, date
 from decimal import Decimal
 
 router = APIRouter()
@@ -23,6 +34,11 @@ class QuotationItemCreate(QuotationItemBase):
     pass
 
 
+class QuotationItemUpdate(QuotationItemBase):
+    # 기존 항목 ID (없으면 같은 품목의 기존 항목과 짝짓거나 새로 추가)
+    id: Optional[int] = None
+
+
 class QuotationItemResponse(QuotationItemBase):
     id: int
     total_price: Decimal
@@ -45,6 +61,32 @@ class QuotationCreate(QuotationBase):
     pass
 
 
+class QuotationUpdate(QuotationBase):
+    items: List[QuotationItemUpdate] = []
+
+
+class QuotationPatch(BaseModel):
+    """견적 머리글만 수정 (보낸 필드만 반영, 항목은 그대로)"""
+    quotation_number: Optional[str] = None
+    client_id: Optional[int] = None
+    consultation_id: Optional[int] = None
+    status: Optional[QuotationStatus] = None
+    valid_until: Optional[datetime] = None
+    notes: Optional[str] = None
+
+
+class QuotationConvert(BaseModel):
+    """견적 → 계약 전환 (notes가 없으면 견적 메모를 그대로 사용)"""
+    contract_number: str
+    contract_date: date = Field(default_factory=date.today)
+    status: ContractStatus = ContractStatus.DRAFT
+    notes: Optional[str] = None
+
+
+# PATCH에서 null로 보낼 수 없는 필드
+NOT_NULL_FIELDS = ("quotation_number", "client_id", "status")
+
+
 class ClientInfo(BaseModel):
     id: int
     name: str
@@ -75,117 +117,118 @@ class QuotationResponse(QuotationBase):
         from_attributes = True
 
 
+def _quotation_query(projection: Projection = QUOTATION_FULL):
+    """응답에 필요한 컬럼과 관계(거래처/영업자/항목)만 로딩하는 견적 조회 쿼리"""
+    return select(Quotation).options(*projection.options())
+
+
 @router.get("/")
 async def get_quotations(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
     client_name: Optional[str] = None,
-    db: Session = Depends(get_db),
+    include_items: bool = True,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """견적 목록 조회"""
-    query = db.query(Quotation)
+    """견적 목록 조회 (include_items=false이면 항목 제외, fields/expand로 응답 필드 지정)"""
+    default_expand = None if include_items else ("client", "salesperson")
+    projection = QUOTATIONS.project(fields, expand, default_expand)
+    query = _quotation_query(projection)
     
+    # 거래처 검색 색인으로 필터링 (조인 불필요)
     if client_name:
-        from app.models.client import Client
-        query = query.join(Client).filter(Client.name.contains(client_name))
+        query = query.where(client_search_filter(client_name, Quotation.client_id))
     
     # 영업자는 자신의 견적만 조회
     if current_user.role.value == "sales" and not current_user.is_admin:
-        query = query.filter(Quotation.salesperson_id == current_user.id)
+        query = query.where(Quotation.salesperson_id == current_user.id)
     
-    quotations = query.options(
-        joinedload(Quotation.client),
-        joinedload(Quotation.salesperson)
-    ).offset(skip).limit(limit).all()
+    # 필터 결과가 바뀌지 않았으면 페이지를 조회/직렬화하지 않고 304
+    version = await list_version(db, query, projection, request, current_user, skip, limit, cursor, with_total)
+    if version.matches(request):
+        return version.not_modified()
+    version.apply(response)
     
-    # 관계 데이터를 수동으로 포함
-    result = []
-    for quotation in quotations:
-        quotation_dict = {
-            "id": quotation.id,
-            "quotation_number": quotation.quotation_number,
-            "client_id": quotation.client_id,
-            "consultation_id": quotation.consultation_id,
-            "salesperson_id": quotation.salesperson_id,
-            "status": quotation.status,
-            "total_amount": quotation.total_amount,
-            "valid_until": quotation.valid_until,
-            "notes": quotation.notes,
-            "created_at": quotation.created_at,
-            "updated_at": quotation.updated_at,
-            "items": [{"id": item.id, "item_id": item.item_id, "quantity": item.quantity, 
-                      "unit_price": item.unit_price, "total_price": item.total_price, 
-                      "notes": item.notes} for item in quotation.items],
-        }
-        if quotation.client:
-            quotation_dict["client"] = {
-                "id": quotation.client.id,
-                "name": quotation.client.name,
-            }
-        if quotation.salesperson:
-            quotation_dict["salesperson"] = {
-                "id": quotation.salesperson.id,
-                "full_name": quotation.salesperson.full_name,
-            }
-        result.append(quotation_dict)
+    quotations = await paginate(db, query, Quotation, response, skip, limit, cursor, with_total)
+    return json_response([projection.serialize(quotation) for quotation in quotations], response)
+
+
+@router.get("/export")
+async def export_quotations(
+    format: str = "csv",
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    status: Optional[QuotationStatus] = None,
+    client_name: Optional[str] = None,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    견적 내보내기 (format: csv, xlsx, ndjson)
+    date_from/date_to는 작성일 기준(당일 포함)입니다. 목록 조회와 달리 페이지 없이 조건에 맞는 전체를
+    스트리밍으로 응답합니다. csv/xlsx는 거래처/영업자를 열로 펼치고, 항목은 ndjson에서만 포함합니다.
+    """
+    default_expand = None if format == "ndjson" else ("client", "salesperson")
+    projection = QUOTATIONS.project(fields, expand, default_expand)
+    query = _quotation_query(projection).where(*date_range(Quotation.created_at, date_from, date_to))
+    
+    if status:
+        query = query.where(Quotation.status == status)
+    if client_name:
+        query = query.where(client_search_filter(client_name, Quotation.client_id))
     
-    return result
+    # 영업자는 자신의 견적만 내보내기
+    if current_user.role.value == "sales" and not current_user.is_admin:
+        query = query.where(Quotation.salesperson_id == current_user.id)
+    
+    return export_response(query, projection, format, "quotations")
 
 
 @router.get("/{quotation_id}", response_model=QuotationResponse)
 async def get_quotation(
     quotation_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """견적 상세 조회"""
-    quotation = db.query(Quotation).options(
-        joinedload(Quotation.client),
-        joinedload(Quotation.salesperson),
-        joinedload(Quotation.items)
-    ).filter(Quotation.id == quotation_id).first()
-    if not quotation:
+    projection = QUOTATIONS.project(fields, expand)
+    version = await detail_version(db, projection, request, current_user, Quotation.id == quotation_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="견적을 찾을 수 없습니다")
+    if version.matches(request):
+        return version.not_modified()
     
-    quotation_dict = {
-        "id": quotation.id,
-        "quotation_number": quotation.quotation_number,
-        "client_id": quotation.client_id,
-        "consultation_id": quotation.consultation_id,
-        "salesperson_id": quotation.salesperson_id,
-        "status": quotation.status,
-        "total_amount": quotation.total_amount,
-        "valid_until": quotation.valid_until,
-        "notes": quotation.notes,
-        "created_at": quotation.created_at,
-        "updated_at": quotation.updated_at,
-        "items": [{"id": item.id, "item_id": item.item_id, "quantity": item.quantity, 
-                  "unit_price": item.unit_price, "total_price": item.total_price, 
-                  "notes": item.notes} for item in quotation.items],
-    }
-    if quotation.client:
-        quotation_dict["client"] = {
-            "id": quotation.client.id,
-            "name": quotation.client.name,
-        }
-    if quotation.salesperson:
-        quotation_dict["salesperson"] = {
-            "id": quotation.salesperson.id,
-            "full_name": quotation.salesperson.full_name,
-        }
+    quotation = await db.scalar(_quotation_query(projection).where(Quotation.id == quotation_id))
+    if not quotation:
+        raise HTTPException(status_code=404, detail="견적을 찾을 수 없습니다")
+    version.apply(response)
     
-    return quotation_dict
+    return json_response(projection.serialize(quotation), response)
 
 
 @router.post("/", response_model=QuotationResponse)
 async def create_quotation(
     quotation_data: QuotationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """견적 등록"""
     items_data = quotation_data.items
+    # 품목 ID는 참조 데이터 캐시에서 한 번에 확인 (없는 품목이면 400)
+    references.check_items(item.item_id for item in items_data)
     quotation_dict = quotation_data.dict()
     quotation_dict.pop("items")
     
@@ -197,7 +240,7 @@ async def create_quotation(
         total_amount=total_amount
     )
     db.add(new_quotation)
-    db.flush()
+    await db.flush()
     
     # 견적 항목 추가
     for item_data in items_data:
@@ -212,65 +255,156 @@ async def create_quotation(
         )
         db.add(quotation_item)
     
-    db.commit()
-    db.refresh(new_quotation)
-    return new_quotation
+    await db.commit()
+    
+    # 관계 데이터를 함께 로딩하여 반환
+    new_quotation = await db.scalar(
+        _quotation_query().where(Quotation.id == new_quotation.id).execution_options(populate_existing=True)
+    )
+    return json_response(quotation_to_dict(new_quotation))
 
 
 @router.put("/{quotation_id}", response_model=QuotationResponse)
 async def update_quotation(
     quotation_id: int,
-    quotation_data: QuotationCreate,
-    db: Session = Depends(get_db),
+    quotation_data: QuotationUpdate,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """견적 수정"""
-    quotation = db.query(Quotation).filter(Quotation.id == quotation_id).first()
+    """
+    견적 수정
+    항목은 기존 항목과 비교해 바뀐 항목만 수정/추가/삭제하고, 합계 금액은 요청 항목 전체로 다시 계산합니다.
+    """
+    quotation = await db.get(Quotation, quotation_id)
     if not quotation:
         raise HTTPException(status_code=404, detail="견적을 찾을 수 없습니다")
     
     items_data = quotation_data.items
+    # 품목 ID는 참조 데이터 캐시에서 한 번에 확인 (없는 품목이면 400)
+    references.check_items(item.item_id for item in items_data)
     quotation_dict = quotation_data.dict()
     quotation_dict.pop("items")
     
-    total_amount = sum(item.quantity * item.unit_price for item in items_data)
+    changes = await apply_line_items(db, QuotationItem, QuotationItem.quotation_id, quotation.id, items_data)
     
     for key, value in quotation_dict.items():
         setattr(quotation, key, value)
-    quotation.total_amount = total_amount
+    quotation.total_amount = line_total(items_data)
+    # 항목만 바뀌어도 응답 버전(ETag)이 바뀌도록 수정 시각 갱신 (바뀐 것이 없으면 쓰지 않음)
+    if changes or db.is_modified(quotation):
+        quotation.updated_at = datetime.utcnow()
     
-    # 기존 항목 삭제 후 새로 추가
-    db.query(QuotationItem).filter(QuotationItem.quotation_id == quotation_id).delete()
+    await db.commit()
     
-    for item_data in items_data:
-        total_price = item_data.quantity * item_data.unit_price
-        quotation_item = QuotationItem(
-            quotation_id=quotation.id,
-            item_id=item_data.item_id,
-            quantity=item_data.quantity,
-            unit_price=item_data.unit_price,
-            total_price=total_price,
-            notes=item_data.notes
+    quotation = await db.scalar(
+        _quotation_query().where(Quotation.id == quotation_id).execution_options(populate_existing=True)
+    )
+    return json_response(quotation_to_dict(quotation))
+
+
+@router.patch("/{quotation_id}", response_model=QuotationResponse)
+async def patch_quotation(
+    quotation_id: int,
+    quotation_data: QuotationPatch,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """견적 머리글 수정 (상태, 메모 등 보낸 필드만 반영, 항목은 읽거나 쓰지 않음)"""
+    quotation = await db.get(Quotation, quotation_id)
+    if not quotation:
+        raise HTTPException(status_code=404, detail="견적을 찾을 수 없습니다")
+    
+    quotation_dict = quotation_data.dict(exclude_unset=True)
+    empty = [key for key, value in quotation_dict.items() if value is None and key in NOT_NULL_FIELDS]
+    if empty:
+        raise HTTPException(status_code=400, detail=f"비울 수 없는 항목입니다: {', '.join(empty)}")
+    
+    for key, value in quotation_dict.items():
+        setattr(quotation, key, value)
+    if db.is_modified(quotation):
+        quotation.updated_at = datetime.utcnow()
+        await db.commit()
+    
+    quotation = await db.scalar(
+        _quotation_query().where(Quotation.id == quotation_id).execution_options(populate_existing=True)
+    )
+    return json_response(quotation_to_dict(quotation))
+
+
+@router.post("/{quotation_id}/convert", response_model=ContractResponse)
+async def convert_quotation(
+    quotation_id: int,
+    convert_data: QuotationConvert,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    견적을 계약으로 전환 (한 트랜잭션)
+    계약을 만들고 견적 항목을 INSERT ... SELECT 한 번으로 계약 항목에 복사한 뒤 견적을 승인 상태로 바꿉니다.
+    계약의 담당 영업자와 거래처, 합계 금액은 견적을 따릅니다.
+    """
+    quotation = await db.get(Quotation, quotation_id)
+    if not quotation:
+        raise HTTPException(status_code=404, detail="견적을 찾을 수 없습니다")
+    if current_user.role.value == "sales" and not current_user.is_admin and quotation.salesperson_id != current_user.id:
+        raise HTTPException(status_code=403, detail="권한이 없습니다")
+    if quotation.status in (QuotationStatus.REJECTED, QuotationStatus.EXPIRED):
+        raise HTTPException(status_code=400, detail="거절되었거나 만료된 견적은 계약으로 전환할 수 없습니다")
+    
+    # 견적 행을 먼저 수정해 같은 견적의 동시 전환 요청을 직렬화 (쓰기 잠금을 잡은 뒤 중복 확인)
+    quotation.status = QuotationStatus.APPROVED
+    quotation.updated_at = datetime.utcnow()
+    await db.flush()
+    
+    if await db.scalar(select(Contract.id).where(Contract.quotation_id == quotation.id).limit(1)):
+        raise HTTPException(status_code=400, detail="이미 계약으로 전환된 견적입니다")
+    if await db.scalar(select(Contract.id).where(Contract.contract_number == convert_data.contract_number)):
+        raise HTTPException(status_code=400, detail="이미 사용 중인 계약번호입니다")
+    
+    convert_dict = convert_data.dict()
+    if convert_dict["notes"] is None:
+        convert_dict["notes"] = quotation.notes
+    contract = Contract(
+        **convert_dict,
+        client_id=quotation.client_id,
+        quotation_id=quotation.id,
+        salesperson_id=quotation.salesperson_id,
+        total_amount=quotation.total_amount
+    )
+    db.add(contract)
+    await db.flush()
+    
+    # 견적 항목을 행마다 읽고 쓰지 않고 DB 안에서 그대로 복사
+    await db.execute(
+        insert(ContractItem).from_select(
+            ["contract_id", "item_id", "quantity", "unit_price", "total_price", "notes"],
+            select(
+                literal(contract.id), QuotationItem.item_id, QuotationItem.quantity,
+                QuotationItem.unit_price, QuotationItem.total_price, QuotationItem.notes
+            ).where(QuotationItem.quotation_id == quotation.id).order_by(QuotationItem.id)
         )
-        db.add(quotation_item)
+    )
+    await db.commit()
     
-    db.commit()
-    db.refresh(quotation)
-    return quotation
+    contract = await db.scalar(
+        select(Contract).options(*CONTRACT_FULL.options()).where(Contract.id == contract.id)
+        .execution_options(populate_existing=True)
+    )
+    return json_response(contract_to_dict(contract))
 
 
 @router.delete("/{quotation_id}")
 async def delete_quotation(
     quotation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """견적 삭제"""
-    quotation = db.query(Quotation).filter(Quotation.id == quotation_id).first()
+    quotation = await db.get(Quotation, quotation_id)
     if not quotation:
         raise HTTPException(status_code=404, detail="견적을 찾을 수 없습니다")
     
-    db.delete(quotation)
-    db.commit()
+    await db.delete(quotation)
+    await db.commit()
     return {"message": "견적이 삭제되었습니다"}
 
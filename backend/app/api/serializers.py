@@ -0,0 +1,303 @@
+"""
+엔티티별 응답 직렬화
+ORM 객체를 한 번에 응답용 dict로 변환합니다. 결과는 app.core.responses.json_response()로
+바로 JSON 바이트가 되므로 값은 변환하지 않고 그대로 둡니다 (Decimal/datetime/Enum 포함).
+목록과 상세 응답이 같은 정의를 사용하므로 필드를 추가할 때는 여기만 수정합니다.
+
+?fields= / ?expand= (부분 응답)
+- fields=id,status,client.name : 지정한 컬럼만 응답하고, 점(.)으로 관계의 컬럼을 지정
+- expand=client,items : 함께 응답할 관계 (관계 컬럼은 기본 요약 필드)
+지정한 컬럼만 SELECT하고(load_only) 요청한 관계만 로딩하므로 좁은 요청일수록
+DB에서 읽고 전송하는 데이터가 줄어듭니다.
+둘 다 없으면 기존과 같은 전체 응답입니다.
+
+영업자/기사/품목 요약(N:1)은 JOIN 없이 참조 데이터 캐시(app.db.references)에서 붙입니다.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from app.db import references
+from app.models.client import Client
+from app.models.consultation import Consultation
+from app.models.contract import Contract, ContractItem
+from app.models.installation import Installation
+from app.models.inventory import Inventory
+from app.models.item import Item
+from app.models.quotation import Quotation, QuotationItem
+from app.models.stock_movement import StockMovement
+from app.models.user import User
+
+
+class Relation:
+    """
+    응답에 펼칠 수 있는 관계 (many: 1:N 관계는 IN 쿼리로, N:1 관계는 JOIN으로 로딩)
+    reference: 참조 데이터 캐시 (요청 컬럼이 모두 캐시에 있으면 JOIN 없이 외래 키로 찾음)
+    """
+
+    def __init__(self, entity: "Entity", default_fields: Iterable[str] = None, many: bool = False,
+                 reference: Optional[references.ReferenceTable] = None):
+        self.entity = entity
+        self.default_fields = tuple(default_fields or entity.columns)
+        self.many = many
+        self.reference = reference
+
+
+class Projection:
+    """조회/응답할 컬럼과 관계 (?fields=, ?expand= 해석 결과)"""
+    __slots__ = ("entity", "columns", "relations", "required")
+
+    def __init__(self, entity: "Entity", columns: Tuple[str, ...], relations: Dict[str, "Projection"],
+                 required: Tuple[str, ...] = ("id",)):
+        self.entity = entity
+        self.columns = columns
+        self.relations = relations
+        self.required = required
+
+    def cached(self, name: str) -> bool:
+        """관계를 참조 데이터 캐시에서 응답하는지"""
+        reference = self.entity.relations[name].reference
+        sub = self.relations[name]
+        return reference is not None and reference.covers(sub.required + sub.columns)
+
+    def load_columns(self) -> list:
+        """SELECT할 컬럼 (응답 컬럼 + 페이지네이션 등에 필요한 컬럼 + 캐시로 찾을 관계의 외래 키)"""
+        foreign_keys = tuple(self.entity.foreign_key(name) for name in self.relations if self.cached(name))
+        names = dict.fromkeys(self.required + self.columns + foreign_keys)
+        return [getattr(self.entity.model, name) for name in names]
+
+    def options(self) -> list:
+        """쿼리 로딩 옵션 (load_only + 요청한 관계 중 캐시에 없는 관계만 로딩)"""
+        options = [load_only(*self.load_columns())]
+        for name, sub in self.relations.items():
+            if self.cached(name):
+                continue
+            attribute = getattr(self.entity.model, name)
+            # 1:N 관계(항목)는 행마다 지연 로딩하지 않고 IN 쿼리 한 번으로 일괄 로딩
+            loader = selectinload(attribute) if self.entity.relations[name].many else joinedload(attribute)
+            options.append(loader.load_only(*sub.load_columns()))
+        return options
+
+    def serialize(self, obj) -> dict:
+        """ORM 객체를 응답용 dict로 변환"""
+        data = {name: getattr(obj, name) for name in self.columns}
+        for name, sub in self.relations.items():
+            relation = self.entity.relations[name]
+            if relation.many:
+                data[name] = [sub.serialize(child) for child in getattr(obj, name)]
+            elif name in obj.__dict__ or not self.cached(name):
+                # JOIN으로 로딩한 관계
+                value = getattr(obj, name)
+                data[name] = sub.serialize(value) if value is not None else None
+            else:
+                row = relation.reference.get(getattr(obj, self.entity.foreign_key(name)))
+                data[name] = {column: row[column] for column in sub.columns} if row is not None else None
+        return data
+
+
+class Entity:
+    """엔티티 응답 정의 (응답 컬럼, 펼칠 수 있는 관계, 기본으로 펼치는 관계)"""
+
+    def __init__(self, model, columns: Iterable[str], relations: Dict[str, Relation] = None,
+                 default_expand: Iterable[str] = (), required: Iterable[str] = ("id",)):
+        # required: 응답 여부와 관계없이 항상 SELECT할 컬럼 (목록 정렬/커서용 created_at 등)
+        self.model = model
+        self.columns = tuple(columns)
+        self.relations = relations or {}
+        self.default_expand = tuple(default_expand)
+        self.required = tuple(required)
+        self._foreign_keys: Dict[str, str] = {}
+
+    def foreign_key(self, name: str) -> str:
+        """N:1 관계의 외래 키 컬럼 이름 (salesperson -> salesperson_id)"""
+        if name not in self._foreign_keys:
+            column, = inspect(self.model).relationships[name].local_columns
+            self._foreign_keys[name] = column.key
+        return self._foreign_keys[name]
+
+    def _relation(self, name: str, columns: Optional[Tuple[str, ...]] = None) -> Projection:
+        relation = self.relations[name]
+        return Projection(relation.entity, columns or relation.default_fields, {})
+
+    def projection(self, expand: Iterable[str] = None) -> Projection:
+        """전체 컬럼 + 지정한 관계 (없으면 기본 관계)"""
+        if expand is None:
+            expand = self.default_expand
+        return Projection(self, self.columns, {name: self._relation(name) for name in expand}, self.required)
+
+    def project(self, fields: Optional[str] = None, expand: Optional[str] = None,
+                default_expand: Iterable[str] = None) -> Projection:
+        """
+        ?fields= / ?expand= 값을 해석합니다. 알 수 없는 이름은 400 오류입니다.
+        fields가 없으면 전체 컬럼과 expand 관계(expand도 없으면 기본 관계)를 응답하고,
+        fields가 있으면 fields에 적은 컬럼과 expand/fields에 적은 관계만 응답합니다.
+        """
+        expanded = _split(expand)
+        unknown = [name for name in expanded if name not in self.relations]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"펼칠 수 없는 관계입니다: {', '.join(unknown)}")
+
+        if fields is None:
+            return self.projection(expanded if expand is not None else default_expand)
+
+        columns = []
+        relation_columns: Dict[str, list] = {name: [] for name in expanded}
+        for field in _split(fields):
+            name, _, sub_field = field.partition(".")
+            if name in self.relations:
+                relation_fields = relation_columns.setdefault(name, [])
+                if sub_field:
+                    if sub_field not in self.relations[name].entity.columns:
+                        unknown.append(field)
+                    elif sub_field not in relation_fields:
+                        relation_fields.append(sub_field)
+            elif name in self.columns and not sub_field:
+                if name not in columns:
+                    columns.append(name)
+            else:
+                unknown.append(field)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+        # 응답 컬럼 순서는 엔티티 정의 순서를 따름
+        columns = tuple(name for name in self.columns if name in columns)
+        relations = {name: self._relation(name, tuple(sub_fields)) for name, sub_fields in relation_columns.items()}
+        return Projection(self, columns, relations, self.required)
+
+
+def _split(value: Optional[str]) -> list:
+    """쉼표로 구분된 목록 (공백/빈 항목 제거, 중복 제거)"""
+    if not value:
+        return []
+    return list(dict.fromkeys(part.strip() for part in value.split(",") if part.strip()))
+
+
+LINE_ITEM_COLUMNS = ("id", "item_id", "quantity", "unit_price", "total_price", "notes")
+PAGINATED = ("id", "created_at")
+
+CLIENTS = Entity(Client, (
+    "id", "name", "client_type",
+    "personal_name", "personal_phone", "personal_email",
+    "company_name", "business_number", "representative_name", "company_phone", "company_email",
+    "address", "notes", "created_at", "updated_at",
+), required=PAGINATED)
+
+# 비밀번호 해시는 응답 컬럼에 넣지 않음
+USERS = Entity(User, (
+    "id", "username", "email", "full_name", "phone", "role", "is_active", "is_admin", "is_super_admin",
+), required=PAGINATED)
+
+ITEMS = Entity(Item, (
+    "id", "code", "name", "description", "unit_price", "unit", "is_active", "created_at", "updated_at",
+), required=PAGINATED)
+
+QUOTATION_ITEMS = Entity(QuotationItem, LINE_ITEM_COLUMNS)
+CONTRACT_ITEMS = Entity(ContractItem, LINE_ITEM_COLUMNS)
+
+CLIENT_REF = ("id", "name")
+USER_REF = ("id", "full_name")
+ITEM_REF = ("id", "name", "code")
+
+CONSULTATIONS = Entity(Consultation, (
+    "id", "client_id", "salesperson_id", "consultation_date", "content", "notes", "created_at", "updated_at",
+), relations={
+    "client": Relation(CLIENTS, CLIENT_REF),
+    "salesperson": Relation(USERS, USER_REF, reference=references.users),
+}, default_expand=("client", "salesperson"), required=PAGINATED + ("salesperson_id",))  # 상세 조회 권한 확인용
+
+QUOTATIONS = Entity(Quotation, (
+    "id", "quotation_number", "client_id", "consultation_id", "salesperson_id", "status",
+    "total_amount", "valid_until", "notes", "created_at", "updated_at",
+), relations={
+    "client": Relation(CLIENTS, CLIENT_REF),
+    "salesperson": Relation(USERS, USER_REF, reference=references.users),
+    "items": Relation(QUOTATION_ITEMS, many=True),
+}, default_expand=("client", "salesperson", "items"), required=PAGINATED)
+
+CONTRACTS = Entity(Contract, (
+    "id", "contract_number", "client_id", "quotation_id", "salesperson_id", "status",
+    "contract_date", "total_amount", "notes", "created_at", "updated_at",
+), relations={
+    "client": Relation(CLIENTS, CLIENT_REF),
+    "salesperson": Relation(USERS, USER_REF, reference=references.users),
+    "items": Relation(CONTRACT_ITEMS, many=True),
+}, default_expand=("client", "salesperson", "items"), required=PAGINATED)
+
+INSTALLATIONS = Entity(Installation, (
+    "id", "contract_id", "client_id", "technician_id", "installation_type", "status",
+    "scheduled_date", "completed_date", "result_text", "photo_url_1", "photo_url_2",
+    "photo_thumb_url_1", "photo_thumb_url_2", "notes",
+    "created_at", "updated_at",
+), relations={
+    "client": Relation(CLIENTS, CLIENT_REF),
+    "technician": Relation(USERS, USER_REF, reference=references.users),
+}, default_expand=("client", "technician"), required=PAGINATED)
+
+INVENTORY = Entity(Inventory, (
+    "id", "item_id", "quantity", "min_stock_level", "location", "notes", "created_at", "updated_at",
+), relations={
+    "item": Relation(ITEMS, ITEM_REF, reference=references.items),
+}, default_expand=("item",), required=PAGINATED)
+
+STOCK_MOVEMENTS = Entity(StockMovement, (
+    "id", "item_id", "movement_type", "quantity", "balance", "contract_id", "installation_id", "notes",
+    "created_by", "created_at",
+), required=PAGINATED)
+
+# 기본 응답 (전체 컬럼 + 기본 관계)
+CLIENT_FULL = CLIENTS.projection()
+USER_FULL = USERS.projection()
+ITEM_FULL = ITEMS.projection()
+CONSULTATION_FULL = CONSULTATIONS.projection()
+QUOTATION_FULL = QUOTATIONS.projection()
+QUOTATION_HEADER = QUOTATIONS.projection(("client", "salesperson"))
+CONTRACT_FULL = CONTRACTS.projection()
+CONTRACT_HEADER = CONTRACTS.projection(("client", "salesperson"))
+INSTALLATION_FULL = INSTALLATIONS.projection()
+INVENTORY_FULL = INVENTORY.projection()
+STOCK_MOVEMENT_FULL = STOCK_MOVEMENTS.projection()
+
+
+def client_to_dict(client: Client) -> dict:
+    """거래처"""
+    return CLIENT_FULL.serialize(client)
+
+
+def user_to_dict(user: User) -> dict:
+    """직원/관리자 계정 (비밀번호 해시 제외)"""
+    return USER_FULL.serialize(user)
+
+
+def item_to_dict(item: Item) -> dict:
+    """품목"""
+    return ITEM_FULL.serialize(item)
+
+
+def consultation_to_dict(consultation: Consultation) -> dict:
+    """상담 (거래처/영업자 포함)"""
+    return CONSULTATION_FULL.serialize(consultation)
+
+
+def quotation_to_dict(quotation: Quotation, include_items: bool = True) -> dict:
+    """견적 (거래처/영업자, include_items이면 항목 포함)"""
+    return (QUOTATION_FULL if include_items else QUOTATION_HEADER).serialize(quotation)
+
+
+def contract_to_dict(contract: Contract, include_items: bool = True) -> dict:
+    """계약 (거래처/영업자, include_items이면 항목 포함)"""
+    return (CONTRACT_FULL if include_items else CONTRACT_HEADER).serialize(contract)
+
+
+def installation_to_dict(installation: Installation) -> dict:
+    """설치/AS (거래처/기사 포함)"""
+    return INSTALLATION_FULL.serialize(installation)
+
+
+def inventory_to_dict(inventory: Inventory) -> dict:
+    """재고 (품목 요약 포함)"""
+    return INVENTORY_FULL.serialize(inventory)
+
+
+def stock_movement_to_dict(movement: StockMovement) -> dict:
+    """재고 수불 기록"""
+    return STOCK_MOVEMENT_FULL.serialize(movement)
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.db.database import get_db
+from app.core.responses import json_response
+from app.api.serializers import CLIENTS, CONSULTATIONS, QUOTATIONS, CONTRACTS, INSTALLATIONS
+from app.db.sync import SYNCED_MODELS, change_feed
+from app.db.dependencies import get_current_user
+from app.models.user import User
+
+router = APIRouter()
+
+MAX_LIMIT = 1000
+
+# 피드 이름 -> (응답 정의, 담당자로 범위를 제한할 역할)
+FEEDS = {
+    "clients": (CLIENTS, None),
+    "consultations": (CONSULTATIONS, "sales"),
+    "quotations": (QUOTATIONS, "sales"),
+    "contracts": (CONTRACTS, "sales"),
+    "installations": (INSTALLATIONS, "technician"),
+}
+
+
+@router.get("/{feed}")
+async def get_changes(
+    feed: str,
+    since: Optional[str] = None,
+    limit: int = 500,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    변경 피드 조회 (since 토큰 이후 등록/수정/삭제된 항목)
+    응답의 next를 다음 요청의 since로 보내고, has_more가 true이면 바로 이어서 요청합니다.
+    deleted(삭제된 ID)를 먼저 반영한 뒤 changes를 반영합니다.
+    """
+    if feed not in FEEDS:
+        raise HTTPException(status_code=404, detail="동기화할 수 없는 항목입니다")
+    entity, scoped_role = FEEDS[feed]
+    projection = entity.project(fields, expand)
+    model = entity.model
+    query = select(model).options(*projection.options())
+
+    # 영업자는 자신의 상담/견적/계약만, 기사는 자신의 작업만 (목록 조회와 같은 범위)
+    owner_id = None
+    if scoped_role and current_user.role.value == scoped_role and not current_user.is_admin:
+        owner_id = current_user.id
+        query = query.where(getattr(model, SYNCED_MODELS[model]) == owner_id)
+
+    page = await change_feed(db, query, model, since, min(max(limit, 1), MAX_LIMIT), owner_id)
+    return json_response({
+        "changes": [projection.serialize(row) for row in page.changes],
+        "deleted": page.deleted,
+        "next": page.token,
+        "has_more": page.has_more,
+    })
@@ -0,0 +1,111 @@
+"""
+인증 캐시
+검증된 토큰 → 사용자 스냅샷을 TTL과 최대 크기 제한을 두고 보관해
+요청마다 반복되는 JWT 디코딩과 사용자 조회 쿼리를 생략합니다.
+
+각 항목에는 저장 당시 인증 버전(reference_versions의 auth)을 함께 기록합니다. 어느 워커에서든
+직원의 역할/관리자 권한/활성 여부/비밀번호가 바뀌거나 계정이 삭제되면 이 버전이 올라가고,
+다른 워커는 AUTH_CACHE_VERSION_CHECK_SECONDS마다 한 번 버전을 읽어(미적중 시에는 매번)
+버전이 달라진 항목을 무효(stale)로 처리하고 DB에서 다시 조회합니다.
+그 사이의 캐시 적중은 SQL을 실행하지 않습니다. 이름 등 그 밖의 변경은 TTL 안에서 늦게 반영될 수 있습니다.
+적중/미적중/무효 횟수는 Prometheus 카운터(auth_cache_lookups)로도 기록합니다.
+"""
+from collections import OrderedDict
+from typing import Optional
+import threading
+import time
+from app.core.config import settings
+from app.core.metrics import AUTH_CACHE_LOOKUPS
+from app.schemas.auth import CurrentUser
+
+
+class TokenUserCache:
+    """토큰별 사용자 스냅샷 LRU 캐시 (TTL 적용, 스레드 안전)"""
+
+    def __init__(self, max_size: int, ttl_seconds: int, version_check_seconds: float = 0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self.version: Optional[int] = None  # 마지막으로 읽은 인증 버전
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._entries = OrderedDict()  # {token: (만료시각, 인증 버전, CurrentUser)}
+        self._lock = threading.Lock()
+
+    def version_due(self) -> bool:
+        """인증 버전을 다시 읽을 때가 되었는지 (아직 읽지 않았거나 확인 간격이 지남)"""
+        return self.version is None or time.monotonic() - self._checked_at >= self.version_check_seconds
+
+    def set_version(self, version: int):
+        """DB에서 읽은 인증 버전 기록"""
+        self.version = version
+        self._checked_at = time.monotonic()
+
+    def get(self, token: str, version: Optional[int] = None) -> Optional[CurrentUser]:
+        """캐시된 사용자 스냅샷 조회 (만료되었거나 저장 이후 인증 버전이 바뀌었으면 제거)"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[token]
+                self.misses += 1
+                result = "miss"
+            elif entry[1] != version:
+                del self._entries[token]
+                self.stale += 1
+                result = "stale"
+            else:
+                self._entries.move_to_end(token)
+                self.hits += 1
+                result = "hit"
+        AUTH_CACHE_LOOKUPS.labels(result).inc()
+        return entry[2] if result == "hit" else None
+
+    def set(self, token: str, user: CurrentUser, version: Optional[int] = None,
+            token_expires_at: Optional[float] = None):
+        """사용자 스냅샷 저장 (version: 사용자 조회 전에 읽은 인증 버전, 토큰 만료 시각을 넘지 않도록 제한)"""
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+        with self._lock:
+            self._entries[token] = (expires_at, version, user)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int):
+        """
+        특정 사용자의 모든 토큰 캐시 제거 (수정/비활성화/삭제 시 호출)
+        이 프로세스에서만 즉시 제거하며, 다른 워커는 인증 버전 비교로 무효화됩니다.
+        """
+        with self._lock:
+            stale = [token for token, (_, _, user) in self._entries.items() if user.id == user_id]
+            for token in stale:
+                del self._entries[token]
+
+    def clear(self):
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """적중/미적중 통계"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+            }
+
+
+user_cache = TokenUserCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+    version_check_seconds=settings.AUTH_CACHE_VERSION_CHECK_SECONDS,
+)
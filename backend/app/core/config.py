@@ -7,11 +7,41 @@ class Settings(BaseSettings):
     # 데이터베이스 설정
     DATABASE_URL: str = "sqlite:///./nexo_crm.db"  # 기본값: SQLite (개발용)
     
+    # 연결 풀 설정 (워커 프로세스당)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    
+    # SQLite 엔진 프로파일 (연결 시 PRAGMA로 적용)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # 읽기가 쓰기를 기다리지 않음
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL에서는 NORMAL로도 손상 없음
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 잠금 대기 시간
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 256MB
+    SQLITE_CACHE_SIZE: int = -64000  # 음수는 KB 단위 (약 64MB)
+    SQLITE_FOREIGN_KEYS: bool = True
+    
+    # 잠금 충돌(database is locked) 재시도
+    DB_LOCK_RETRIES: int = 5
+    DB_LOCK_RETRY_BASE_MS: int = 25
+    DB_LOCK_RETRY_MAX_MS: int = 1000
+    
     # JWT 설정
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # 인증 캐시 설정 (토큰 → 사용자 스냅샷)
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_SIZE: int = 1024
+    # 다른 워커의 권한/비활성화/비밀번호 변경을 확인하는 간격 (이 간격 안의 캐시 적중은 DB를 읽지 않음)
+    AUTH_CACHE_VERSION_CHECK_SECONDS: int = 5
+    
+    # 비밀번호 해시 설정
+    # BCRYPT_ROUNDS를 바꾸면 기존 해시는 다음 로그인 시 새 비용으로 재해시됨
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # 해시 전용 스레드 수
+    PASSWORD_HASH_MAX_PENDING: int = 64  # 대기 작업 한도 (초과 시 503)
+    
     # CORS 설정
     # 환경 변수에서 쉼표로 구분된 문자열을 받아서 리스트로 변환
     # 예: ALLOWED_ORIGINS=https://example.com,https://another.com
@@ -40,6 +70,36 @@ class Settings(BaseSettings):
     # 파일 업로드 설정
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
+    PHOTO_THUMBNAIL_SIZE: int = 320  # 설치 사진 썸네일 긴 변 (px)
+    PHOTO_WORKERS: int = 1  # 워커 프로세스당 썸네일/EXIF 처리 프로세스 수
+    
+    # 백업 설정
+    BACKUP_DIR: str = "backups"
+    BACKUP_COMPRESSION: str = "gzip"  # gzip, zstd (zstandard 설치 시), none
+    BACKUP_PAGES_PER_STEP: int = 1024  # 백업 API 단계당 복사할 페이지 수
+    BACKUP_STEP_SLEEP_MS: int = 5  # 단계 사이 쓰기 작업에 양보하는 시간
+    BACKUP_LOCK_STALE_SECONDS: int = 300  # 이 시간 동안 갱신되지 않은 백업 잠금은 비정상 종료로 보고 회수
+    
+    # 대량 가져오기 (CSV/XLSX)
+    IMPORT_DIR: str = "imports"  # 업로드 파일 임시 보관 디렉토리
+    IMPORT_MAX_SIZE: int = 100 * 1024 * 1024  # 100MB
+    IMPORT_CHUNK_SIZE: int = 1000  # 트랜잭션당 행 수
+    IMPORT_MAX_ERRORS: int = 1000  # 작업에 보관할 행 오류 수
+    IMPORT_STALE_SECONDS: int = 300  # 이 시간 동안 진행 기록이 없는 대기/진행 작업은 중단된 것으로 보고 실패 처리
+    
+    # 느린 쿼리 기록 (기준 시간 초과 SQL을 로그와 /api/admin/slow-queries에 남김)
+    SLOW_QUERY_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    SLOW_QUERY_LOG_SIZE: int = 100  # 보관할 최근 기록 수
+    SLOW_QUERY_EXPLAIN: bool = True  # 실행 계획 수집 여부
+    
+    # /metrics 엔드포인트 및 요청 메트릭 수집 여부
+    METRICS_ENABLED: bool = True
+    
+    # 대시보드 요약 캐시 유지 시간 (초)
+    DASHBOARD_CACHE_TTL_SECONDS: int = 10
+    # 업무 기준 시간대 (대시보드의 "오늘"은 이 시간대의 하루, 저장된 시각은 UTC)
+    TIMEZONE: str = "Asia/Seoul"
     
     class Config:
         env_file = ".env"
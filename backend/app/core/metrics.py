@@ -0,0 +1,164 @@
+"""
+Prometheus 메트릭
+- 경로 템플릿/메서드/상태 코드별 지연시간 히스토그램, 처리 중 요청 수, 응답 크기
+- 요청당 SQL 실행 횟수와 총 실행 시간 (SQLAlchemy 엔진 이벤트로 수집)
+- 인증 캐시 조회 결과별 횟수 (hit / miss / stale)
+
+여러 uvicorn 워커로 실행할 때는 PROMETHEUS_MULTIPROC_DIR 환경 변수를 지정하면
+각 워커가 같은 디렉토리에 값을 기록하고 /metrics가 전체 워커를 합산해 응답합니다.
+(run-production.py에서 설정)
+"""
+from contextvars import ContextVar
+from typing import Optional
+import os
+import re
+import time
+from prometheus_client import (
+    CollectorRegistry, Counter, Gauge, Histogram, CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+UNMATCHED_ROUTE = "<unmatched>"
+PATH_PARAM_PATTERN = re.compile(r"{(\w+)(?::\w+)?}")
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수",
+    ["method"], multiprocess_mode="livesum"
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "HTTP 응답 본문 크기",
+    ["method", "route"], buckets=SIZE_BUCKETS
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "요청당 SQL 실행 횟수",
+    ["method", "route"], buckets=QUERY_COUNT_BUCKETS
+)
+REQUEST_QUERY_TIME = Histogram(
+    "http_request_db_duration_seconds", "요청당 SQL 총 실행 시간",
+    ["method", "route"], buckets=LATENCY_BUCKETS
+)
+DB_QUERIES = Counter("db_queries", "실행된 SQL 구문 수")
+AUTH_CACHE_LOOKUPS = Counter("auth_cache_lookups", "인증 캐시 조회 수 (결과별)", ["result"])
+
+
+class QueryStats:
+    """요청 하나의 SQL 실행 통계"""
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    DB_QUERIES.inc()
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+def _handle_error(exception_context):
+    # 실패한 구문도 시작 시각 스택에서 제거
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine):
+    """엔진에 SQL 실행 통계 이벤트 등록 (비동기 엔진은 sync_engine 전달)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def route_template(scope) -> str:
+    """매칭된 라우트의 전체 경로 템플릿 (/api/clients/{client_id}), 없으면 <unmatched>"""
+    route_path = getattr(scope.get("route"), "path", None)
+    if route_path is None:
+        return UNMATCHED_ROUTE
+    # 라우터 prefix 포함 여부가 FastAPI 버전마다 달라, 실제 경로에서 prefix를 복원
+    params = scope.get("path_params", {})
+    rendered = PATH_PARAM_PATTERN.sub(lambda m: str(params.get(m.group(1), m.group(0))), route_path)
+    path = scope.get("path", "")
+    if path.endswith(rendered):
+        return path[:len(path) - len(rendered)] + route_path
+    return route_path
+
+
+class MetricsMiddleware:
+    """요청 지연시간/응답 크기/SQL 통계를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+        size = {"bytes": 0}
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            elif message["type"] == "http.response.body":
+                size["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            _query_stats.reset(token)
+            route = route_template(scope)
+            REQUEST_LATENCY.labels(method, route, str(status["code"])).observe(elapsed)
+            RESPONSE_SIZE.labels(method, route).observe(size["bytes"])
+            REQUEST_QUERIES.labels(method, route).observe(stats.count)
+            REQUEST_QUERY_TIME.labels(method, route).observe(stats.seconds)
+
+
+def is_multiprocess() -> bool:
+    """멀티 프로세스 수집 모드 여부"""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics():
+    """Prometheus 텍스트 형식 출력 (멀티 프로세스면 전체 워커 합산)"""
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead():
+    """워커 종료 시 livesum 게이지에서 해당 프로세스 값 제거"""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
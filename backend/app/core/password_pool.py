@@ -0,0 +1,70 @@
+"""
+비밀번호 해시 작업 풀
+bcrypt 해시/검증은 요청당 수백 ms의 CPU를 사용하므로 이벤트 루프가 아닌
+전용 스레드 풀에서 실행합니다. (bcrypt는 해시 계산 중 GIL을 해제합니다)
+대기 작업 수가 한도를 넘으면 즉시 거절해 로그인 폭주 시 지연이 무한히 쌓이지 않게 합니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+import asyncio
+import threading
+from app.core.config import settings
+
+
+class PasswordPoolBusy(Exception):
+    """대기 중인 해시 작업이 한도를 초과함"""
+
+
+class PasswordHashPool:
+    """크기와 대기열 길이가 제한된 비밀번호 해시 스레드 풀"""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max_pending
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    async def run(self, func: Callable, *args):
+        """풀에서 함수 실행 (대기열이 가득 차면 PasswordPoolBusy)"""
+        with self._lock:
+            if self.max_pending > 0 and self._pending >= self.max_pending:
+                raise PasswordPoolBusy()
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def stats(self) -> dict:
+        """실행/대기 중인 작업 수"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+            }
+
+    def shutdown(self):
+        """풀 종료 (앱 종료 시 호출)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
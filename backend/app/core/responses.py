@@ -0,0 +1,47 @@
+"""
+JSON 응답 (orjson)
+datetime/date/Enum은 orjson이 직접 변환하고 Decimal은 jsonable_encoder와 같은 규칙으로
+숫자로 변환합니다 (소수점이 없으면 int, 있으면 float).
+
+dict/list를 그대로 반환하면 FastAPI가 jsonable_encoder(또는 response_model 검증)를
+한 번 더 거치므로, 이미 직렬화용 dict를 만든 엔드포인트는 json_response()로
+응답 객체를 직접 반환합니다.
+"""
+from decimal import Decimal
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value):
+    """orjson이 직접 처리하지 못하는 타입 변환"""
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(value).__name__}")
+
+
+def dumps(content) -> bytes:
+    """JSON 바이트로 직렬화"""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (앱 기본 응답 클래스)"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def json_response(content, response: Response = None, status_code: int = 200) -> ORJSONResponse:
+    """
+    직렬화용 dict/list를 jsonable_encoder 없이 바로 JSON 응답으로 반환합니다.
+    response: 엔드포인트에 주입된 Response (페이지네이션 헤더 등을 그대로 옮김)
+    """
+    result = ORJSONResponse(content, status_code=status_code)
+    if response is not None:
+        result.headers.raw.extend(response.headers.raw)
+    return result
@@ -0,0 +1,241 @@
+"""
+설치/AS 사진 업로드
+업로드 파일을 이벤트 루프가 아닌 스레드에서 청크 단위로 공개되지 않는 임시 디렉토리에 복사하면서
+크기(MAX_UPLOAD_SIZE)와 형식을 확인하고, 프로세스 풀에서 EXIF(촬영 위치 등)를 제거한 뒤
+제거된 내용의 SHA-256으로 정한 경로(uploads/photos/ab/cd/<해시>.jpg)로 옮깁니다.
+같은 사진을 다시 올려도 한 벌만 남고, 다른 설치/AS의 사진이나 이전 사진을 덮어쓰지 않습니다.
+
+- 형식: 파일 앞부분의 시그니처로 판별 (JPEG/PNG/WEBP, 파일 이름과 Content-Type은 보지 않음)
+- 준비(prepare_photo)와 공개(publish)를 나눠, 검증이 실패한 요청의 사진은 공개 경로에 남지 않음
+- 썸네일은 응답과 별도로 프로세스 풀에서 생성 (경로는 원본 경로에서 정해지므로 응답에 바로 포함되며,
+  처리가 끝나기 전 잠시는 파일이 없을 수 있음)
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Optional
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from fastapi import HTTPException, UploadFile
+from PIL import Image, ImageOps
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+COPY_CHUNK_SIZE = 1024 * 1024
+PHOTO_DIR = "photos"
+THUMBNAIL_SUFFIX = "_thumb.jpg"
+
+# 파일 시그니처 → 확장자
+SIGNATURES = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+)
+
+# 제거할 메타데이터 (EXIF, XMP)
+METADATA_KEYS = ("exif", "xmp", "XML:com.adobe.xmp")
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class StoredPhoto(NamedTuple):
+    """저장한 사진의 URL"""
+    url: Optional[str]
+    thumbnail_url: Optional[str]
+
+
+class PreparedPhoto(NamedTuple):
+    """EXIF를 제거해 임시 파일로 준비한 사진 (publish 전까지 공개 경로에 없음)"""
+    temp: Path
+    path: Path
+
+
+def _extension(head: bytes) -> Optional[str]:
+    """파일 앞부분으로 이미지 형식 판별 (지원하지 않으면 None)"""
+    for signature, extension in SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413, detail=f"파일이 너무 큽니다 (최대 {settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB)"
+    )
+
+
+def _url(path: Path) -> str:
+    return "/uploads/" + path.relative_to(settings.UPLOAD_DIR).as_posix()
+
+
+def _photo_root() -> Path:
+    return Path(settings.UPLOAD_DIR) / PHOTO_DIR
+
+
+def staging_dir() -> Path:
+    """처리 전 사진을 두는 임시 디렉토리 (/uploads로 제공되지 않도록 UPLOAD_DIR 옆, 같은 파일 시스템)"""
+    upload_dir = Path(settings.UPLOAD_DIR)
+    path = upload_dir.parent / f".{upload_dir.name}_staging"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _copy(source) -> Path:
+    """업로드 파일을 임시 파일로 복사하며 형식/크기 확인 (스레드에서 실행)"""
+    size = 0
+    extension = None
+    fd, temp_name = tempfile.mkstemp(dir=staging_dir(), prefix="upload_")
+    temp = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as dest:
+            while chunk := source.read(COPY_CHUNK_SIZE):
+                if extension is None:
+                    extension = _extension(chunk)
+                    if extension is None:
+                        raise HTTPException(status_code=400, detail="이미지 파일만 올릴 수 있습니다 (JPEG, PNG, WEBP)")
+                size += len(chunk)
+                if size > settings.MAX_UPLOAD_SIZE:
+                    raise _too_large()
+                dest.write(chunk)
+        if extension is None:
+            raise HTTPException(status_code=400, detail="빈 파일입니다")
+        return temp.rename(temp.with_name(temp.name + extension))
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def _has_metadata(image) -> bool:
+    return bool(image.getexif()) or any(key in image.info for key in METADATA_KEYS)
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _strip(temp: str, root: str) -> tuple:
+    """
+    EXIF/XMP 제거(회전 정보는 먼저 반영) 후 제거된 내용의 해시로 저장 경로 결정 (프로세스 풀에서 실행)
+    메타데이터가 없으면 다시 인코딩하지 않고 원본 그대로 사용. 반환값: (임시 파일, 저장 경로)
+    """
+    source = Path(temp)
+    with Image.open(source) as original:
+        if _has_metadata(original):
+            image_format = original.format
+            image = ImageOps.exif_transpose(original)
+            for key in METADATA_KEYS:
+                image.info.pop(key, None)
+            fd, stripped_name = tempfile.mkstemp(dir=source.parent, prefix="strip_", suffix=source.suffix)
+            try:
+                with os.fdopen(fd, "wb") as dest:
+                    image.save(dest, format=image_format, quality=90, exif=b"",
+                               icc_profile=image.info.get("icc_profile"))
+                os.replace(stripped_name, source)
+            finally:
+                Path(stripped_name).unlink(missing_ok=True)
+
+    name = _sha256(source)
+    path = Path(root) / name[:2] / name[2:4] / f"{name}{source.suffix}"
+    return str(source), str(path)
+
+
+def _thumbnail(path: str, thumbnail: str, size: int):
+    """JPEG 썸네일 생성 (프로세스 풀에서 실행)"""
+    target = Path(thumbnail)
+    with Image.open(path) as original:
+        image = original.copy()
+    image.thumbnail((size, size))
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".thumb_", suffix=".jpg")
+    try:
+        with os.fdopen(fd, "wb") as dest:
+            image.save(dest, format="JPEG", quality=80, optimize=True)
+        os.replace(temp_name, target)
+    finally:
+        Path(temp_name).unlink(missing_ok=True)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # 스레드가 있는 서버 프로세스를 fork하지 않도록 spawn으로 시작
+            _executor = ProcessPoolExecutor(
+                max_workers=max(1, settings.PHOTO_WORKERS), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
+
+
+def _log_failure(future: Future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"사진 썸네일 생성 실패: {future.exception()!r}")
+
+
+async def prepare_photo(upload: UploadFile) -> PreparedPhoto:
+    """
+    사진을 임시 파일로 복사하고 EXIF 제거 (공개 경로에는 아직 없음)
+    검증이 끝난 뒤 publish, 실패하면 discard로 임시 파일 삭제
+    """
+    if upload.size is not None and upload.size > settings.MAX_UPLOAD_SIZE:
+        raise _too_large()
+    temp = await run_in_threadpool(_copy, upload.file)
+    try:
+        future = _get_executor().submit(_strip, str(temp), str(_photo_root()))
+        temp_name, path = await asyncio.wrap_future(future)
+    except (OSError, Image.DecompressionBombError) as e:
+        temp.unlink(missing_ok=True)
+        logger.info(f"사진을 읽을 수 없음: {e!r}")
+        raise HTTPException(status_code=400, detail="이미지를 읽을 수 없습니다")
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    return PreparedPhoto(Path(temp_name), Path(path))
+
+
+def photo_urls(photo: Optional[PreparedPhoto]) -> StoredPhoto:
+    """공개 후 사진/썸네일 URL (사진이 없으면 None)"""
+    if photo is None:
+        return StoredPhoto(None, None)
+    return StoredPhoto(_url(photo.path), _url(photo.path.with_name(photo.path.stem + THUMBNAIL_SUFFIX)))
+
+
+def publish(photo: PreparedPhoto) -> StoredPhoto:
+    """준비한 사진을 해시 경로로 이동 (같은 내용이면 기존 파일 사용) 후 썸네일이 없으면 백그라운드 처리 요청"""
+    path = photo.path
+    if path.exists():
+        photo.temp.unlink(missing_ok=True)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(photo.temp, path)
+
+    thumbnail = path.with_name(path.stem + THUMBNAIL_SUFFIX)
+    if not thumbnail.exists():
+        future = _get_executor().submit(_thumbnail, str(path), str(thumbnail), settings.PHOTO_THUMBNAIL_SIZE)
+        future.add_done_callback(_log_failure)
+    return photo_urls(photo)
+
+
+def discard(photo: Optional[PreparedPhoto]):
+    """공개하지 않은 준비 사진 삭제"""
+    if photo is not None:
+        photo.temp.unlink(missing_ok=True)
+
+
+def shutdown():
+    """대기 중인 처리를 취소하고 프로세스 풀 종료 (앱 종료 시 호출)"""
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
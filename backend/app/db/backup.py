@@ -0,0 +1,213 @@
+"""
+온라인 데이터베이스 백업
+sqlite3 백업 API로 운영 중인 DB를 페이지 단위로 복사해 일관된 스냅샷을 만들고
+(WAL에 있는 커밋된 내용까지 포함), 압축 파일과 체크섬 매니페스트를 생성합니다.
+모든 함수는 동기 함수이므로 API에서는 스레드 풀에서 호출해야 합니다.
+
+여러 워커 프로세스가 동시에 백업하지 않도록 백업 디렉토리의 잠금 파일(O_EXCL로 생성)을
+사용합니다. 백업 중에는 단계마다 잠금 파일의 수정 시각을 갱신하며, BACKUP_LOCK_STALE_SECONDS 동안
+갱신되지 않은 잠금은 비정상 종료한 프로세스의 것으로 보고 회수합니다.
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import gzip
+import hashlib
+import json
+import os
+import secrets
+import sqlite3
+import time
+from sqlalchemy.engine import make_url
+from app.core.config import settings
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 gzip 사용
+    zstandard = None
+
+BACKUP_PREFIX = "nexo_crm_backup_"
+MANIFEST_SUFFIX = ".manifest.json"
+EXTENSIONS = {"none": ".db", "gzip": ".db.gz", "zstd": ".db.zst"}
+MEDIA_TYPES = {".db": "application/vnd.sqlite3", ".gz": "application/gzip", ".zst": "application/zstd"}
+CHUNK_SIZE = 1024 * 1024
+
+# 동시에 하나의 백업만 실행 (모든 워커 프로세스 공통)
+LOCK_FILENAME = ".backup.lock"
+
+
+class BackupError(Exception):
+    """백업을 만들 수 없는 상태 (메시지는 사용자에게 그대로 표시)"""
+
+
+class BackupInProgress(BackupError):
+    """다른 백업이 진행 중"""
+
+
+def backup_dir() -> Path:
+    """백업 디렉토리 (없으면 생성)"""
+    path = Path(settings.BACKUP_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def database_path() -> Path:
+    """settings.DATABASE_URL에서 SQLite 파일 경로 추출"""
+    url = make_url(settings.DATABASE_URL)
+    if url.get_backend_name() != "sqlite":
+        raise BackupError("SQLite 데이터베이스만 백업할 수 있습니다.")
+    if not url.database or url.database == ":memory:":
+        raise BackupError("메모리 데이터베이스는 백업할 수 없습니다.")
+    return Path(url.database)
+
+
+def compression() -> str:
+    """사용할 압축 방식 (zstd 요청 시 모듈이 없으면 gzip으로 대체)"""
+    method = settings.BACKUP_COMPRESSION.lower()
+    if method == "zstd" and zstandard is None:
+        return "gzip"
+    return method if method in EXTENSIONS else "gzip"
+
+
+def is_backup_file(filename: str) -> bool:
+    """백업 산출물 파일명 여부 (매니페스트/임시 파일 제외)"""
+    return filename.startswith(BACKUP_PREFIX) and filename.endswith(tuple(EXTENSIONS.values()))
+
+
+def media_type(filename: str) -> str:
+    """다운로드 응답용 MIME 타입"""
+    return MEDIA_TYPES.get(Path(filename).suffix, "application/octet-stream")
+
+
+def manifest_path(artifact: Path) -> Path:
+    """백업 산출물의 매니페스트 경로 (<파일명>.manifest.json)"""
+    return artifact.with_name(artifact.name + MANIFEST_SUFFIX)
+
+
+def read_manifest(artifact: Path) -> Optional[dict]:
+    """백업 매니페스트 조회 (없거나 손상되었으면 None)"""
+    try:
+        return json.loads(manifest_path(artifact).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _acquire_lock(directory: Path) -> Path:
+    """백업 잠금 파일 생성 (다른 프로세스/스레드가 백업 중이면 BackupInProgress)"""
+    lock = directory / LOCK_FILENAME
+    for _ in range(2):
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return lock
+        except FileExistsError:
+            try:
+                idle = time.time() - lock.stat().st_mtime
+            except FileNotFoundError:
+                continue  # 그 사이 해제됨
+            if idle < settings.BACKUP_LOCK_STALE_SECONDS:
+                raise BackupInProgress("다른 백업이 진행 중입니다. 잠시 후 다시 시도하세요.")
+            lock.unlink(missing_ok=True)
+    raise BackupInProgress("다른 백업이 진행 중입니다. 잠시 후 다시 시도하세요.")
+
+
+def _touch(lock: Optional[Path]):
+    """백업 진행 중임을 잠금 파일 수정 시각으로 표시"""
+    if lock is not None:
+        os.utime(lock)
+
+
+def _snapshot(source: Path, target: Path, lock: Optional[Path] = None) -> dict:
+    """백업 API로 source를 target에 복사하고 검사 결과 반환"""
+    src = sqlite3.connect(source, timeout=settings.SQLITE_BUSY_TIMEOUT_MS / 1000)
+    dst = sqlite3.connect(target)
+    try:
+        # 페이지 단위로 나눠 복사해 쓰기 작업이 중간에 끼어들 수 있게 함
+        src.backup(
+            dst, pages=settings.BACKUP_PAGES_PER_STEP, sleep=settings.BACKUP_STEP_SLEEP_MS / 1000,
+            progress=lambda status, remaining, total: _touch(lock)
+        )
+        # 백업 파일은 WAL 없이 단일 파일로 열리도록 저널 모드 변경
+        dst.execute("PRAGMA journal_mode = DELETE")
+        integrity = dst.execute("PRAGMA quick_check").fetchone()[0]
+        page_count = dst.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        dst.close()
+        src.close()
+    if integrity != "ok":
+        raise BackupError(f"백업 무결성 검사 실패: {integrity}")
+    return {"page_count": page_count, "integrity_check": integrity}
+
+
+def _open_writer(path: Path, method: str):
+    """압축 방식에 맞는 쓰기 스트림"""
+    if method == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if method == "zstd":
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"), closefd=True)
+    return open(path, "wb")
+
+
+def _compress(snapshot: Path, artifact: Path, method: str, lock: Optional[Path] = None) -> dict:
+    """스냅샷을 압축 저장하며 원본/압축본 SHA-256 계산"""
+    raw_hash = hashlib.sha256()
+    raw_size = 0
+    with open(snapshot, "rb") as src, _open_writer(artifact, method) as dst:
+        while chunk := src.read(CHUNK_SIZE):
+            raw_hash.update(chunk)
+            raw_size += len(chunk)
+            dst.write(chunk)
+            _touch(lock)
+    return {
+        "database_sha256": raw_hash.hexdigest(),
+        "database_size": raw_size,
+        "sha256": file_sha256(artifact),
+        "size": artifact.stat().st_size,
+    }
+
+
+def file_sha256(path: Path) -> str:
+    """파일 SHA-256 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def create_backup() -> dict:
+    """온라인 백업 생성 후 매니페스트 반환 (동기, 스레드 풀에서 호출)"""
+    source = database_path()
+    if not source.exists():
+        raise FileNotFoundError(str(source))
+    directory = backup_dir()
+    lock = _acquire_lock(directory)
+    try:
+        method = compression()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 같은 초에 만든 백업끼리 겹치지 않도록 무작위 접미사
+        artifact = directory / f"{BACKUP_PREFIX}{timestamp}_{secrets.token_hex(4)}{EXTENSIONS[method]}"
+        snapshot = directory / f".{artifact.name}.snapshot"
+        partial = directory / f".{artifact.name}.part"
+        try:
+            checks = _snapshot(source, snapshot, lock)
+            hashes = _compress(snapshot, partial, method, lock)
+            os.replace(partial, artifact)
+        finally:
+            for leftover in (snapshot, partial):
+                if leftover.exists():
+                    leftover.unlink()
+
+        manifest = {
+            "filename": artifact.name,
+            "timestamp": timestamp,
+            "created_at": datetime.now().isoformat(),
+            "compression": method,
+            "source": source.name,
+            **hashes,
+            **checks,
+        }
+        manifest_path(artifact).write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        return manifest
+    finally:
+        lock.unlink(missing_ok=True)
+
@@ -0,0 +1,419 @@
+"""
+대량 가져오기 (CSV/XLSX)
+업로드한 파일을 한 행씩 읽어(CSV: csv 모듈, XLSX: openpyxl 읽기 전용 모드)
+IMPORT_CHUNK_SIZE 행마다 검증 → executemany INSERT → 커밋합니다.
+오류가 있는 행은 건너뛰고 행 번호와 사유를 작업(import_jobs)에 기록합니다.
+
+- 작업은 백그라운드 스레드 하나에서 차례로 실행되어 요청 시간 제한과 관계없고,
+  청크마다 커밋하므로 다른 요청의 쓰기가 가져오기 전체를 기다리지 않습니다
+- 진행 상황은 청크와 같은 트랜잭션으로 기록되어 어느 워커 프로세스에서나 조회할 수 있습니다
+- 대량 INSERT는 매퍼 이벤트를 거치지 않으므로 거래처 검색 색인은 여기서 함께 기록합니다
+- 작업을 맡은 프로세스는 청크마다 대기/진행 작업의 heartbeat_at을 갱신하고, IMPORT_STALE_SECONDS 동안
+  갱신되지 않은 작업(서버 재시작 등으로 중단)은 시작 시와 조회 시 실패로 처리합니다
+모든 함수는 동기 함수이므로 API에서는 스레드 풀에서 호출해야 합니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+import codecs
+import csv
+import logging
+import threading
+import uuid
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import and_, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.client_search import SEARCH_FIELDS, text_grams
+from app.db import references
+from app.db.database import SessionLocal
+from app.models.client import Client, ClientSearchGram
+from app.models.import_job import ImportJob, ImportStatus
+from app.models.inventory import Inventory
+from app.models.item import Item
+from app.models.stock_movement import MovementType, StockMovement
+
+try:
+    import openpyxl
+except ImportError:  # 선택 의존성: 없으면 CSV만 가져오기
+    openpyxl = None
+
+logger = logging.getLogger(__name__)
+
+FORMATS = (".csv", ".xlsx")
+COPY_CHUNK_SIZE = 1024 * 1024
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+ACTIVE_STATUSES = (ImportStatus.PENDING, ImportStatus.RUNNING)
+STALE_MESSAGE = "가져오기 작업이 중단되었습니다 (서버 재시작 등). 파일을 다시 올려주세요."
+
+# SQLite 쓰기는 한 번에 하나이므로 가져오기 작업도 하나씩 실행
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bulk-import")
+
+# 이 프로세스가 맡은 작업 (실행 중 + 대기 중, 하트비트 대상)
+_jobs: set = set()
+_jobs_lock = threading.Lock()
+
+
+class BulkImportError(Exception):
+    """가져올 수 없는 파일 (메시지는 사용자에게 그대로 표시)"""
+
+
+class RowError(Exception):
+    """가져올 수 없는 행 (메시지는 행 오류로 기록)"""
+
+
+def import_dir() -> Path:
+    """업로드 파일 임시 디렉토리 (없으면 생성)"""
+    path = Path(settings.IMPORT_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def file_format(filename: str) -> str:
+    """업로드 파일 확장자 확인 (.csv / .xlsx)"""
+    suffix = Path(filename or "").suffix.lower()
+    if suffix not in FORMATS:
+        raise BulkImportError("CSV 또는 XLSX 파일만 가져올 수 있습니다.")
+    if suffix == ".xlsx" and openpyxl is None:
+        raise BulkImportError("XLSX 가져오기에는 openpyxl 패키지가 필요합니다. CSV로 저장해 올려주세요.")
+    return suffix
+
+
+def save_upload(source, suffix: str) -> Path:
+    """업로드 파일을 청크 단위로 임시 디렉토리에 복사 (IMPORT_MAX_SIZE 초과 시 BulkImportError)"""
+    path = import_dir() / f"import_{uuid.uuid4().hex}{suffix}"
+    size = 0
+    try:
+        with open(path, "wb") as dest:
+            while chunk := source.read(COPY_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.IMPORT_MAX_SIZE:
+                    raise BulkImportError(
+                        f"파일이 너무 큽니다 (최대 {settings.IMPORT_MAX_SIZE // (1024 * 1024)}MB)."
+                    )
+                dest.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _csv_encoding(path: Path) -> str:
+    """CSV 인코딩 (UTF-8이 아니면 엑셀 한글 기본 인코딩 cp949)"""
+    with open(path, "rb") as f:
+        sample = f.read(ENCODING_SAMPLE_SIZE)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def _cell(value):
+    """셀 값 정리 (앞뒤 공백 제거, 빈 값은 None, 정수로 저장된 실수는 정수)"""
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _raw_rows(path: Path) -> Iterator[tuple]:
+    """파일의 행을 차례로 읽기 (메모리에 전체를 올리지 않음)"""
+    if path.suffix == ".xlsx":
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    else:
+        with open(path, newline="", encoding=_csv_encoding(path)) as f:
+            yield from csv.reader(f)
+
+
+class ImportTarget:
+    """가져오기 대상 (행 검증 스키마, 열 이름, 중복 검사, INSERT)"""
+    model = None
+    admin_only = True
+
+    def __init__(self, schema: Type[BaseModel], labels: Dict[str, str]):
+        self.schema = schema
+        # 첫 행(헤더)에는 필드명과 한글 열 이름 모두 사용 가능
+        self.headers = {name: name for name in schema.model_fields}
+        self.headers.update({label: name for name, label in labels.items()})
+        # XLSX 숫자 셀(품목 코드, 전화번호 등)을 문자열 필드에 넣을 수 있도록 변환할 필드
+        self.text_fields = {
+            name for name, field in schema.model_fields.items() if field.annotation in (str, Optional[str])
+        }
+
+    def read_rows(self, path: Path) -> Iterator[Tuple[int, dict]]:
+        """(스프레드시트 행 번호, 필드 값) 순서대로 읽기 (빈 행과 알 수 없는 열은 건너뜀)"""
+        rows = _raw_rows(path)
+        header = next(rows, None)
+        if header is None:
+            raise BulkImportError("빈 파일입니다.")
+        fields = [self.headers.get(str(name).strip()) if name is not None else None for name in header]
+        required = [name for name, field in self.schema.model_fields.items() if field.is_required()]
+        missing = [name for name in required if name not in fields]
+        if missing:
+            raise BulkImportError(f"필수 열이 없습니다: {', '.join(missing)}")
+
+        for number, values in enumerate(rows, start=2):
+            row = {field: _cell(value) for field, value in zip(fields, values) if field}
+            row = {
+                field: str(value) if field in self.text_fields and isinstance(value, (int, float)) else value
+                for field, value in row.items() if value is not None
+            }
+            if row:
+                yield number, row
+
+    def validate(self, row: dict) -> dict:
+        """스키마로 행 검증 (오류는 RowError)"""
+        try:
+            return self.schema.model_validate(row).model_dump()
+        except ValidationError as e:
+            raise RowError(", ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+            ))
+
+    def check(self, db: Session, rows: List[Tuple[int, dict]], seen: set) -> Tuple[list, list]:
+        """청크 단위 중복/참조 검사 → (가져올 행, [(행 번호, 오류)])"""
+        return rows, []
+
+    def insert(self, db: Session, values: List[dict]):
+        """executemany INSERT (ORM 대량 INSERT보다 가벼운 Core INSERT)"""
+        db.execute(insert(self.model.__table__), values)
+
+
+class ClientImport(ImportTarget):
+    model = Client
+    admin_only = False
+
+    def insert(self, db: Session, values: List[dict]):
+        # 대량 INSERT는 after_insert 이벤트가 없으므로 검색 색인도 함께 기록
+        # (RETURNING 순서는 보장되지 않으므로 ID와 검색 필드를 함께 받아 색인 행 생성,
+        #  순서를 맞추는 sort_by_parameter_order는 SQLite에서 행마다 INSERT를 실행함)
+        table = Client.__table__
+        inserted = db.execute(
+            insert(table).returning(table.c.id, *(table.c[field] for field in SEARCH_FIELDS)), values
+        )
+        grams = [
+            {"gram": gram, "client_id": row.id}
+            for row in inserted
+            for gram in set().union(*(text_grams(getattr(row, field)) for field in SEARCH_FIELDS))
+        ]
+        if grams:
+            db.execute(insert(ClientSearchGram.__table__), grams)
+
+
+class ItemImport(ImportTarget):
+    model = Item
+
+    def insert(self, db: Session, values: List[dict]):
+        super().insert(db, values)
+        # Core INSERT는 매퍼 이벤트가 없으므로 참조 데이터 캐시 버전을 직접 올림
+        references.bump(db.connection(), Item.__tablename__)
+
+    def check(self, db: Session, rows: List[Tuple[int, dict]], seen: set) -> Tuple[list, list]:
+        codes = [row["code"] for _, row in rows]
+        existing = set(db.scalars(select(Item.code).where(Item.code.in_(codes))))
+        accepted, errors = [], []
+        for number, row in rows:
+            if row["code"] in existing:
+                errors.append((number, f"이미 사용 중인 품목 코드입니다: {row['code']}"))
+            elif row["code"] in seen:
+                errors.append((number, f"파일 안에서 중복된 품목 코드입니다: {row['code']}"))
+            else:
+                seen.add(row["code"])
+                accepted.append((number, row))
+        return accepted, errors
+
+
+class InventoryImport(ImportTarget):
+    """재고 (품목은 item_code로 지정)"""
+    model = Inventory
+
+    def insert(self, db: Session, values: List[dict]):
+        super().insert(db, values)
+        # 기초 재고 입고 기록 (품목별 재고는 한 행이므로 요청 값으로 바로 생성)
+        movements = [
+            {
+                "item_id": row["item_id"], "movement_type": MovementType.IN, "quantity": row["quantity"],
+                "balance": row["quantity"], "notes": "일괄 가져오기", "created_at": datetime.utcnow(),
+            }
+            for row in values if row.get("quantity")
+        ]
+        if movements:
+            db.execute(insert(StockMovement.__table__), movements)
+
+    def check(self, db: Session, rows: List[Tuple[int, dict]], seen: set) -> Tuple[list, list]:
+        codes = [row["item_code"] for _, row in rows]
+        item_ids = dict(db.execute(select(Item.code, Item.id).where(Item.code.in_(codes))).all())
+        stocked = set(db.scalars(select(Inventory.item_id).where(Inventory.item_id.in_(item_ids.values()))))
+        accepted, errors = [], []
+        for number, row in rows:
+            code = row.pop("item_code")
+            item_id = item_ids.get(code)
+            if item_id is None:
+                errors.append((number, f"품목을 찾을 수 없습니다: {code}"))
+            elif item_id in stocked or item_id in seen:
+                errors.append((number, f"이미 재고가 등록된 품목입니다: {code}"))
+            else:
+                seen.add(item_id)
+                accepted.append((number, {**row, "item_id": item_id}))
+        return accepted, errors
+
+
+class _Progress:
+    """작업 진행 상황 (청크마다 import_jobs에 기록)"""
+
+    def __init__(self):
+        self.total_rows = 0
+        self.inserted_rows = 0
+        self.error_count = 0
+        self.errors: List[dict] = []
+
+    def error(self, number: int, message: str):
+        self.error_count += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append({"row": number, "message": message})
+
+    def values(self) -> dict:
+        return {
+            "total_rows": self.total_rows,
+            "inserted_rows": self.inserted_rows,
+            "error_count": self.error_count,
+            "errors": list(self.errors),
+        }
+
+
+def _update_job(db: Session, job_id: int, **values) -> bool:
+    """
+    작업 상태 갱신 + 이 프로세스가 맡은 작업의 하트비트
+    중단된 것으로 처리된(대기/진행 상태가 아닌) 작업은 갱신하지 않고 False
+    """
+    updated = db.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id, ImportJob.status.in_(ACTIVE_STATUSES))
+        .values(**values)
+    ).rowcount
+    with _jobs_lock:
+        job_ids = list(_jobs)
+    if job_ids:
+        db.execute(
+            update(ImportJob)
+            .where(ImportJob.id.in_(job_ids), ImportJob.status.in_(ACTIVE_STATUSES))
+            .values(heartbeat_at=datetime.utcnow())
+        )
+    return updated > 0
+
+
+def stale_jobs():
+    """IMPORT_STALE_SECONDS 동안 하트비트가 없는 대기/진행 작업 조건 (맡은 프로세스가 종료됨)"""
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.IMPORT_STALE_SECONDS)
+    return and_(ImportJob.status.in_(ACTIVE_STATUSES), ImportJob.heartbeat_at < cutoff)
+
+
+def fail_stale_jobs_statement():
+    """중단된 작업을 실패로 처리하는 UPDATE (동기/비동기 세션 공용)"""
+    return update(ImportJob).where(stale_jobs()).values(
+        status=ImportStatus.FAILED, message=STALE_MESSAGE, finished_at=datetime.utcnow()
+    )
+
+
+def fail_stale_jobs() -> int:
+    """중단된 작업 실패 처리 (앱 시작 시 호출), 반환값: 처리한 작업 수"""
+    with SessionLocal() as db:
+        count = db.execute(fail_stale_jobs_statement()).rowcount
+        db.commit()
+    if count:
+        logger.warning("중단된 가져오기 작업 %s건을 실패로 처리했습니다", count)
+    return count
+
+
+def _import_chunk(db: Session, job_id: int, target: ImportTarget, rows: List[Tuple[int, dict]],
+                  seen: set, progress: _Progress):
+    """청크 하나 검증 → INSERT → 진행 상황 기록 → 커밋"""
+    valid, errors = [], []
+    for number, row in rows:
+        try:
+            valid.append((number, target.validate(row)))
+        except RowError as e:
+            errors.append((number, str(e)))
+    accepted, rejected = target.check(db, valid, seen) if valid else ([], [])
+    for number, message in sorted(errors + rejected):
+        progress.error(number, message)
+
+    if accepted:
+        try:
+            target.insert(db, [row for _, row in accepted])
+            progress.inserted_rows += len(accepted)
+        except IntegrityError:
+            # 검사 이후 다른 요청이 같은 값을 등록한 경우: 행 단위로 다시 시도해 오류 행만 제외
+            db.rollback()
+            for number, row in accepted:
+                try:
+                    target.insert(db, [row])
+                    db.commit()
+                    progress.inserted_rows += 1
+                except IntegrityError as e:
+                    db.rollback()
+                    progress.error(number, f"저장할 수 없습니다: {e.orig}")
+
+    progress.total_rows += len(rows)
+    if not _update_job(db, job_id, **progress.values()):
+        # 하트비트가 늦어 실패로 처리된 작업은 더 진행하지 않음
+        db.rollback()
+        raise BulkImportError(STALE_MESSAGE)
+    db.commit()
+
+
+def run_import(job_id: int, target: ImportTarget, path: Path):
+    """가져오기 작업 실행 (백그라운드 스레드)"""
+    db = SessionLocal()
+    progress = _Progress()
+    try:
+        _update_job(db, job_id, status=ImportStatus.RUNNING, started_at=datetime.utcnow())
+        db.commit()
+
+        seen: set = set()
+        chunk: List[Tuple[int, dict]] = []
+        for number, row in target.read_rows(path):
+            chunk.append((number, row))
+            if len(chunk) >= settings.IMPORT_CHUNK_SIZE:
+                _import_chunk(db, job_id, target, chunk, seen, progress)
+                chunk = []
+        if chunk:
+            _import_chunk(db, job_id, target, chunk, seen, progress)
+
+        _update_job(db, job_id, status=ImportStatus.COMPLETED, finished_at=datetime.utcnow())
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        if isinstance(e, (BulkImportError, UnicodeDecodeError, csv.Error)):
+            message = str(e)
+        else:
+            logger.exception("가져오기 작업 %s 실패", job_id)
+            message = f"가져오기 실패: {e}"
+        _update_job(db, job_id, status=ImportStatus.FAILED, message=message, finished_at=datetime.utcnow())
+        db.commit()
+    finally:
+        with _jobs_lock:
+            _jobs.discard(job_id)
+        db.close()
+        path.unlink(missing_ok=True)
+
+
+def submit(job_id: int, target: ImportTarget, path: Path):
+    """가져오기 작업을 백그라운드에서 실행 (대기하는 동안에도 실행 중인 작업이 하트비트 갱신)"""
+    with _jobs_lock:
+        _jobs.add(job_id)
+    _executor.submit(run_import, job_id, target, path)
+
+
+def shutdown():
+    """진행 중인 작업을 기다리지 않고 대기 작업 취소 (앱 종료 시 호출)"""
+    _executor.shutdown(wait=False, cancel_futures=True)
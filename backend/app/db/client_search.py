@@ -0,0 +1,150 @@
+"""
+거래처 검색 색인
+거래처명, 회사명, 대표자명, 주소를 2-gram으로 분해해 client_search_grams 테이블에 보관합니다.
+거래처가 등록/수정/삭제될 때 매퍼 이벤트로 색인을 함께 갱신하며,
+한글 부분 검색도 선행 와일드카드 LIKE 전체 스캔 없이 색인으로 후보를 좁힙니다.
+"""
+from sqlalchemy import event, select, delete, insert, func, case, or_, inspect, true
+from sqlalchemy.orm import Session
+from typing import Set
+from app.models.client import Client, ClientSearchGram
+
+SEARCH_FIELDS = ("name", "company_name", "representative_name", "address")
+
+
+def normalize(text: str) -> str:
+    """소문자 변환 및 공백 정리"""
+    return " ".join((text or "").lower().split())
+
+
+def text_grams(text: str) -> Set[str]:
+    """문자열의 2-gram 집합 (마지막 글자도 색인되도록 끝에 공백을 덧붙임)"""
+    normalized = normalize(text)
+    if not normalized:
+        return set()
+    padded = normalized + " "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def client_grams(client: Client) -> Set[str]:
+    """거래처의 검색 대상 필드 전체 2-gram 집합"""
+    grams = set()
+    for field in SEARCH_FIELDS:
+        grams |= text_grams(getattr(client, field))
+    return grams
+
+
+def _write_grams(connection, client: Client):
+    """거래처 한 건의 색인 행을 교체"""
+    connection.execute(delete(ClientSearchGram).where(ClientSearchGram.client_id == client.id))
+    grams = client_grams(client)
+    if grams:
+        connection.execute(
+            insert(ClientSearchGram),
+            [{"gram": gram, "client_id": client.id} for gram in grams]
+        )
+
+
+@event.listens_for(Client, "after_insert")
+def _index_inserted_client(mapper, connection, target):
+    _write_grams(connection, target)
+
+
+@event.listens_for(Client, "after_update")
+def _index_updated_client(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in SEARCH_FIELDS):
+        _write_grams(connection, target)
+
+
+@event.listens_for(Client, "after_delete")
+def _unindex_deleted_client(mapper, connection, target):
+    connection.execute(delete(ClientSearchGram).where(ClientSearchGram.client_id == target.id))
+
+
+def rebuild_index(db: Session, batch_size: int = 1000) -> int:
+    """기존 거래처 전체로 색인 재구성 (색인 도입 이전 데이터베이스용)"""
+    db.execute(delete(ClientSearchGram))
+    count = 0
+    last_id = 0
+    while True:
+        clients = db.query(Client).filter(Client.id > last_id).order_by(Client.id).limit(batch_size).all()
+        if not clients:
+            break
+        rows = [
+            {"gram": gram, "client_id": client.id}
+            for client in clients
+            for gram in client_grams(client)
+        ]
+        if rows:
+            db.execute(insert(ClientSearchGram), rows)
+        count += len(clients)
+        last_id = clients[-1].id
+    db.commit()
+    return count
+
+
+def matching_client_ids(term: str):
+    """
+    검색어를 포함할 수 있는 거래처 id 서브쿼리 (색인 조회)
+    한 글자 검색은 해당 글자로 시작하는 2-gram의 범위 조회로 처리합니다.
+    """
+    normalized = normalize(term)
+    if len(normalized) == 1:
+        return (
+            select(ClientSearchGram.client_id)
+            .where(
+                ClientSearchGram.gram >= normalized,
+                ClientSearchGram.gram < chr(ord(normalized) + 1)
+            )
+            .distinct()
+        )
+
+    grams = {normalized[i:i + 2] for i in range(len(normalized) - 1)}
+    return (
+        select(ClientSearchGram.client_id)
+        .where(ClientSearchGram.gram.in_(grams))
+        .group_by(ClientSearchGram.client_id)
+        .having(func.count() == len(grams))
+    )
+
+
+def client_search_filter(term: str, client_id_column=Client.id):
+    """
+    검색어와 일치하는 거래처만 남기는 조건
+    색인으로 후보를 고른 뒤, 2-gram이 떨어져 있어 생기는 오탐을 실제 값과 비교해 제거합니다.
+    client_id_column으로 상담/견적/계약의 client_id를 넘기면 조인 없이 필터링됩니다.
+    """
+    normalized = normalize(term)
+    if not normalized:
+        return true()
+
+    candidates = matching_client_ids(normalized)
+    if len(normalized) == 1:
+        return client_id_column.in_(candidates)
+
+    verified = (
+        select(Client.id)
+        .where(
+            Client.id.in_(candidates),
+            or_(*[
+                func.lower(getattr(Client, field)).contains(normalized, autoescape=True)
+                for field in SEARCH_FIELDS
+            ])
+        )
+    )
+    return client_id_column.in_(verified)
+
+
+def client_search_rank(term: str):
+    """검색 결과 정렬 순위 (작을수록 우선: 거래처명 일치 > 접두 > 포함 > 회사명 > 대표자명 > 주소)"""
+    normalized = normalize(term)
+    name = func.lower(Client.name)
+    return case(
+        (name == normalized, 0),
+        (name.startswith(normalized, autoescape=True), 1),
+        (name.contains(normalized, autoescape=True), 2),
+        (func.lower(Client.company_name).contains(normalized, autoescape=True), 3),
+        (func.lower(Client.representative_name).contains(normalized, autoescape=True), 4),
+        else_=5
+    )
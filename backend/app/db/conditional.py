@@ -0,0 +1,132 @@
+"""
+조건부 조회 (ETag / Last-Modified)
+updated_at으로 응답 버전을 계산해 클라이언트가 가진 버전과 같으면
+본문을 조회/직렬화하지 않고 304 Not Modified로 응답합니다.
+
+- 상세: 대상 행과 함께 응답하는 관계 행(거래처/영업자 등)의 updated_at을 한 번에 조회 → 강한 ETag
+- 목록: 요청한 페이지 행(다음 페이지 확인용 한 행 포함)의 (id, updated_at)과 관계 행의 updated_at → 약한 ETag
+  목록 조회와 같은 정렬/커서/LIMIT로 인덱스 범위만 읽으므로 비용은 전체 건수가 아니라 페이지 크기에 비례합니다.
+  페이지에 행이 추가/삭제되거나 다음 페이지 유무가 바뀌어도 새 버전이 됩니다.
+  with_total이면 전체 건수도 버전에 포함합니다 (X-Total-Count가 바뀌므로).
+  (삭제는 updated_at에 드러나지 않으므로 목록은 If-Modified-Since를 지원하지 않습니다)
+ETag에는 요청 쿼리 문자열(fields/expand/페이지 등)과 사용자 ID가 포함되어 응답 형태별로 구분됩니다.
+견적/계약 항목처럼 updated_at이 없는 하위 행은 상위 행의 updated_at으로 버전을 관리합니다.
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+import hashlib
+from fastapi import Request, Response
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from app.db.pagination import count_rows, page_query
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    """DB의 UTC naive datetime을 초 단위 aware datetime으로 변환 (HTTP 날짜는 초 단위)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.replace(tzinfo=timezone.utc, microsecond=0)
+
+
+class Version:
+    """응답 버전 (ETag, Last-Modified)"""
+
+    def __init__(self, parts: tuple, last_modified: Optional[datetime], weak: bool, row=None):
+        digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+        self.etag = f'W/"{digest}"' if weak else f'"{digest}"'
+        self.last_modified = _utc(last_modified)
+        # 상세 조회 시 권한 확인 등에 쓰는 대상 행의 필수 컬럼 값
+        self.row = row
+
+    def headers(self) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def apply(self, response: Response):
+        """응답에 ETag/Last-Modified 헤더 설정"""
+        response.headers.update(self.headers())
+
+    def matches(self, request: Request) -> bool:
+        """클라이언트가 가진 버전과 같은지 (If-None-Match 우선, 없으면 If-Modified-Since)"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            # If-None-Match는 약한 비교 (W/ 접두어 무시)
+            opaque = self.etag.removeprefix("W/")
+            return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return self.last_modified <= since
+        return False
+
+    def not_modified(self) -> Response:
+        """본문 없는 304 응답"""
+        return Response(status_code=304, headers=self.headers())
+
+
+def _relation_targets(projection):
+    """응답에 포함되는 N:1 관계 중 updated_at이 있는 관계 (이름, 관계 속성, 모델)"""
+    entity = projection.entity
+    for name in projection.relations:
+        relation = entity.relations[name]
+        if relation.many or not hasattr(relation.entity.model, "updated_at"):
+            continue
+        yield name, getattr(entity.model, name), relation.entity.model
+
+
+async def detail_version(db: AsyncSession, projection, request: Request, user, *criteria) -> Optional[Version]:
+    """
+    상세 응답 버전 (대상 행이 없으면 None)
+    대상 행과 응답에 포함되는 관계 행의 updated_at만 조회합니다.
+    """
+    model = projection.entity.model
+    required = [getattr(model, name) for name in projection.entity.required]
+    columns = [model.updated_at]
+    query = select(model).where(*criteria)
+    for _, attribute, related in _relation_targets(projection):
+        alias = aliased(related)
+        query = query.outerjoin(attribute.of_type(alias))
+        columns.append(alias.updated_at)
+    row = (await db.execute(query.with_only_columns(*required, *columns))).first()
+    if row is None:
+        return None
+    timestamps = tuple(row[len(required):])
+    last_modified = max((value for value in timestamps if value is not None), default=None)
+    parts = (model.__tablename__, tuple(row[:len(required)]), timestamps, request.url.query, user.id)
+    return Version(parts, last_modified, weak=False, row=row)
+
+
+async def list_version(db: AsyncSession, query: Select, projection, request: Request, user,
+                       skip: int = 0, limit: int = 100, cursor: Optional[str] = None, with_total: bool = False,
+                       rank=None) -> Version:
+    """
+    목록 응답 버전 (인자는 paginate와 같음)
+    요청한 페이지 행과 응답에 포함되는 관계 행의 updated_at만 쿼리 한 번으로 조회합니다.
+    """
+    model = projection.entity.model
+    page = page_query(query, model, skip, limit, cursor, rank)
+    columns = [model.id, model.updated_at]
+    for _, attribute, related in _relation_targets(projection):
+        alias = aliased(related)
+        page = page.outerjoin(attribute.of_type(alias))
+        columns.append(alias.updated_at)
+    rows = tuple(tuple(row) for row in await db.execute(page.with_only_columns(*columns)))
+    total = await count_rows(db, query, model) if with_total else None
+    parts = (model.__tablename__, rows, total, request.url.query, user.id)
+    # 삭제는 updated_at에 드러나지 않으므로 목록은 Last-Modified 없이 ETag로만 비교
+    return Version(parts, None, weak=True)
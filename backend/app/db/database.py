@@ -1,20 +1,44 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.sqlite_profile import engine_options, install_sqlite_profile
+from app.db.slow_query import install_slow_query_log
 
-engine = create_engine(settings.DATABASE_URL)
+# 동기 엔진: 테이블 생성, init_db 등 스크립트용
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+install_sqlite_profile(engine)
+install_slow_query_log(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
-def get_db():
-    """데이터베이스 세션 의존성"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def get_async_database_url(database_url: str) -> str:
+    """DATABASE_URL을 비동기 드라이버(aiosqlite/asyncpg) URL로 변환"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    elif backend == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False)
+
 
+# 비동기 엔진: API 요청 처리용 (이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    **engine_options(settings.DATABASE_URL)
+)
+install_sqlite_profile(async_engine.sync_engine, is_async=True)
+# 실행 계획은 별도 스레드에서 동기 엔진으로 수집
+install_slow_query_log(async_engine.sync_engine, explain_engine=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
+
+async def get_db():
+    """데이터베이스 세션 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,18 +1,38 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
+from app.db import references
 from app.models.user import User
 from app.core.security import decode_access_token
+from app.core.auth_cache import user_cache
+from app.schemas.auth import CurrentUser
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+async def refresh_references(db: AsyncSession = Depends(get_db)):
+    """참조 데이터(직원/품목) 캐시를 최신 버전으로 (직원/품목 요약을 응답하는 라우터에 적용)"""
+    await references.refresh(db)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """현재 로그인한 사용자 가져오기"""
+    db: AsyncSession = Depends(get_db)
+) -> CurrentUser:
+    """
+    현재 로그인한 사용자 가져오기 (검증된 토큰은 캐시에서 바로 반환)
+    인증 버전은 AUTH_CACHE_VERSION_CHECK_SECONDS마다 한 번만 읽으므로 그 사이의 캐시 적중은 SQL 없이 처리하고,
+    다른 워커에서 권한 변경/비활성화/삭제가 있었으면 다음 확인 이후 캐시를 쓰지 않고 다시 조회
+    """
+    checked = user_cache.version_due()
+    if checked:
+        user_cache.set_version(await references.version(db, references.AUTH))
+    auth_version = user_cache.version
+    cached_user = user_cache.get(token, auth_version)
+    if cached_user is not None:
+        return cached_user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="인증 정보를 확인할 수 없습니다",
@@ -33,16 +53,22 @@ async def get_current_user(
     except (ValueError, TypeError):
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    # 사용자보다 버전을 먼저 읽어, 조회와 동시에 바뀐 내용은 다음 확인에서 무효화되도록
+    if not checked:
+        auth_version = await references.version(db, references.AUTH)
+        user_cache.set_version(auth_version)
+    user = await db.get(User, user_id)
     if user is None:
         raise credentials_exception
     
-    return user
+    current_user = CurrentUser.from_user(user)
+    user_cache.set(token, current_user, auth_version, token_expires_at=payload.get("exp"))
+    return current_user
 
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """현재 로그인한 관리자 확인"""
     if not current_user.is_admin:
         raise HTTPException(
@@ -53,8 +79,8 @@ async def get_current_admin(
 
 
 async def get_current_super_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """현재 로그인한 슈퍼관리자 확인"""
     if not current_user.is_super_admin:
         raise HTTPException(
@@ -62,5 +88,3 @@ async def get_current_super_admin(
             detail="슈퍼관리자 권한이 필요합니다"
         )
     return current_user
-
-
@@ -5,7 +5,9 @@
 from sqlalchemy.orm import Session
 from app.db.database import SessionLocal
 from app.models.user import User, UserRole
+from app.models.client import Client, ClientSearchGram
 from app.core.security import get_password_hash
+from app.db import client_search
 
 
 def init_db():
@@ -36,6 +38,11 @@ def init_db():
             print("   ⚠️  운영 환경에서는 반드시 비밀번호를 변경하세요!")
         else:
             print("ℹ️  슈퍼관리자 계정이 이미 존재합니다.")
+        
+        # 거래처 검색 색인이 비어 있으면 기존 거래처로 재구성
+        if db.query(ClientSearchGram).first() is None and db.query(Client).first() is not None:
+            count = client_search.rebuild_index(db)
+            print(f"✅ 거래처 검색 색인을 재구성했습니다. ({count}건)")
     
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
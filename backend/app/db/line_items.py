@@ -0,0 +1,89 @@
+"""
+견적/계약 항목 변경분 반영
+수정 요청의 항목 목록을 기존 항목과 비교해 바뀐 행만 UPDATE, 새 행만 INSERT, 빠진 행만 DELETE 합니다.
+전체 삭제 후 다시 등록하지 않으므로 항목 ID가 유지되고, 메모만 바꾼 수정은 항목 테이블에 쓰지 않습니다.
+
+- 요청 항목에 id가 있으면 그 항목과 비교
+- id가 없으면 아직 짝이 없는 기존 항목 중 같은 품목(item_id)과 순서대로 짝지음
+  (id를 보내지 않는 기존 화면에서 저장해도 바뀐 행만 반영되도록)
+- 짝이 없는 요청 항목은 추가, 요청에 없는 기존 항목은 삭제
+- 합계 금액은 변경분으로 조정하지 않고 호출한 쪽에서 요청 항목 전체로 다시 계산 (line_total)
+"""
+from collections import defaultdict, deque
+from decimal import Decimal
+from typing import Dict, List
+from fastapi import HTTPException
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+LINE_FIELDS = ("item_id", "quantity", "unit_price", "notes")
+
+
+class LineChanges:
+    """항목 변경 결과 (행 수)"""
+
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.deleted = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+
+def line_total(items_data: List) -> Decimal:
+    """요청 항목 전체의 합계 금액 (수정 요청은 모든 항목을 보내므로 기존 합계에 의존하지 않음)"""
+    return sum((item_data.quantity * item_data.unit_price for item_data in items_data), Decimal(0))
+
+
+def _match(existing: Dict[int, object], items_data: list) -> list:
+    """요청 항목별로 짝지은 기존 항목 (없으면 None)"""
+    matched = [None] * len(items_data)
+    claimed = set()
+    for index, item_data in enumerate(items_data):
+        if item_data.id is None:
+            continue
+        if item_data.id not in existing or item_data.id in claimed:
+            raise HTTPException(status_code=400, detail=f"수정할 항목을 찾을 수 없습니다: {item_data.id}")
+        matched[index] = existing[item_data.id]
+        claimed.add(item_data.id)
+
+    unclaimed = defaultdict(deque)
+    for line_id in sorted(existing):
+        if line_id not in claimed:
+            unclaimed[existing[line_id].item_id].append(existing[line_id])
+    for index, item_data in enumerate(items_data):
+        if item_data.id is None and unclaimed[item_data.item_id]:
+            matched[index] = unclaimed[item_data.item_id].popleft()
+    return matched
+
+
+async def apply_line_items(db: AsyncSession, item_model, parent_column, parent_id: int,
+                           items_data: List) -> LineChanges:
+    """
+    요청 항목 목록을 기존 항목에 반영합니다 (커밋은 호출한 쪽에서).
+    item_model: QuotationItem / ContractItem, parent_column: 상위 문서 FK 컬럼
+    """
+    existing = {line.id: line for line in await db.scalars(select(item_model).where(parent_column == parent_id))}
+    changes = LineChanges()
+
+    for item_data, line in zip(items_data, _match(existing, items_data)):
+        total_price = item_data.quantity * item_data.unit_price
+        if line is None:
+            db.add(item_model(**{parent_column.key: parent_id}, **item_data.dict(include=set(LINE_FIELDS)),
+                              total_price=total_price))
+            changes.inserted += 1
+            continue
+
+        del existing[line.id]
+        if all(getattr(line, name) == getattr(item_data, name) for name in LINE_FIELDS):
+            continue
+        for name in LINE_FIELDS:
+            setattr(line, name, getattr(item_data, name))
+        line.total_price = total_price
+        changes.updated += 1
+
+    if existing:
+        await db.execute(delete(item_model).where(item_model.id.in_(existing)))
+        changes.deleted = len(existing)
+    return changes
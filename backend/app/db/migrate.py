@@ -0,0 +1,63 @@
+"""
+스키마 마이그레이션 (Alembic)
+앱 시작 시 DB를 최신 리비전(head)으로 올립니다.
+- 빈 DB: 모델 정의대로 테이블을 만들고 head로 표시
+- 마이그레이션 도입 이전 DB (alembic_version 없음): 빠진 테이블만 만들고
+  기준 리비전(0001)으로 표시한 뒤 나머지 마이그레이션 적용
+- 그 외: 적용되지 않은 마이그레이션만 적용
+"""
+import logging
+import os
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+from app.db.database import engine, Base
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(connection=None) -> Config:
+    """backend/alembic.ini 설정 (connection을 주면 해당 연결로 실행)"""
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    # 앱 로깅 설정을 덮어쓰지 않도록 alembic.ini 로거 설정은 CLI에서만 사용
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def current_revision(connection):
+    """DB에 기록된 리비전 (없으면 None)"""
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def head_revision() -> str:
+    """마이그레이션 파일의 최신 리비전"""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def upgrade_database():
+    """DB를 최신 리비전으로 마이그레이션"""
+    import app.models  # noqa: F401  모든 모델을 metadata에 등록
+
+    with engine.begin() as connection:
+        revision = current_revision(connection)
+        config = alembic_config(connection)
+        if revision is None:
+            table_names = set(inspect(connection).get_table_names())
+            if not table_names & set(Base.metadata.tables):
+                # 빈 DB: 모델에 인덱스까지 정의되어 있으므로 바로 최신 상태
+                Base.metadata.create_all(bind=connection)
+                command.stamp(config, "head")
+                logger.info("새 데이터베이스 스키마 생성")
+                return
+            Base.metadata.create_all(bind=connection)
+            command.stamp(config, BASELINE_REVISION)
+            logger.info(f"기존 데이터베이스를 기준 리비전 {BASELINE_REVISION}으로 표시")
+        command.upgrade(config, "head")
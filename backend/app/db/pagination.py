@@ -0,0 +1,140 @@
+"""
+목록 조회 페이지네이션
+(created_at, id) 기준 커서(keyset) 페이지네이션과 선택적 전체 건수 조회를 제공합니다.
+"""
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional
+import base64
+import json
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode(payload) -> str:
+    """커서 내용을 URL에 안전한 불투명 문자열로 변환"""
+    data = json.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str):
+    """불투명 커서 문자열을 원래 내용으로 복원"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(row) -> str:
+    """마지막 행의 (created_at, id)를 커서로 변환"""
+    return _encode([row.created_at.isoformat(), row.id])
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """커서를 (created_at, id)로 복원"""
+    try:
+        created_at, row_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+def encode_key_cursor(values) -> str:
+    """마지막 행의 정렬 키 값 목록을 커서로 변환 ((created_at, id)가 아닌 키로 정렬하는 목록)"""
+    return _encode(list(values))
+
+
+def decode_key_cursor(cursor: str, types: tuple) -> list:
+    """커서를 정렬 키 값 목록으로 복원 (types: 키별 변환 타입)"""
+    try:
+        values = _decode(cursor)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return [convert(value) for convert, value in zip(types, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """순위 정렬 결과의 다음 위치를 커서로 변환"""
+    return _encode({"offset": offset})
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """순위 정렬 커서를 위치로 복원"""
+    try:
+        return max(int(_decode(cursor)["offset"]), 0)
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+def _offset(skip: int, cursor: Optional[str]) -> int:
+    """순위 정렬 목록의 시작 위치"""
+    return decode_offset_cursor(cursor) if cursor else skip
+
+
+def page_query(
+    query: Select,
+    model,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    rank=None
+) -> Select:
+    """
+    쿼리에 안정적인 정렬과 커서/skip을 적용한 한 페이지 조회 쿼리
+    다음 페이지 존재 여부 확인을 위해 limit보다 한 행 더 조회합니다.
+    """
+    if rank is not None:
+        query = query.order_by(rank, model.created_at, model.id)
+        offset = _offset(skip, cursor)
+        if offset:
+            query = query.offset(offset)
+    else:
+        query = query.order_by(model.created_at, model.id)
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            query = query.where(tuple_(model.created_at, model.id) > tuple_(created_at, last_id))
+        elif skip:
+            query = query.offset(skip)
+    return query.limit(limit + 1)
+
+
+async def count_rows(db: AsyncSession, query: Select, model) -> int:
+    """필터 조건에 맞는 전체 행 수"""
+    return await db.scalar(query.order_by(None).with_only_columns(func.count(model.id)))
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    model,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
+    rank=None
+) -> list:
+    """
+    쿼리에 안정적인 정렬을 적용하고 한 페이지를 조회합니다.
+    cursor가 주어지면 skip 대신 (created_at, id) 이후의 행부터 조회하며,
+    다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담습니다.
+    with_total이면 별도의 COUNT 쿼리로 X-Total-Count 헤더를 채웁니다.
+    rank가 주어지면 (rank, created_at, id) 순으로 정렬하며,
+    순위 값은 커서에 담을 수 없으므로 위치 기반 커서를 사용합니다.
+    """
+    if with_total:
+        response.headers[TOTAL_COUNT_HEADER] = str(await count_rows(db, query, model))
+
+    rows = (await db.scalars(page_query(query, model, skip, limit, cursor, rank))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if rows:
+            if rank is not None:
+                response.headers[NEXT_CURSOR_HEADER] = encode_offset_cursor(_offset(skip, cursor) + limit)
+            else:
+                response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1])
+
+    return rows
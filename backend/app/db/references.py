@@ -0,0 +1,123 @@
+"""
+참조 데이터 캐시 (직원 / 품목)
+목록 응답마다 영업자/기사 이름과 품목 이름/코드를 붙이려고 users/items를 JOIN 하지 않고
+워커 프로세스 메모리의 스냅샷에서 찾습니다. 두 테이블은 작고 자주 바뀌지 않습니다.
+
+- 버전: users/items 행이 등록/수정/삭제되면 매퍼 이벤트가 같은 트랜잭션에서
+  reference_versions의 버전을 올림 (직원/관리자/품목 API, 회원가입, 초기 관리자 생성 포함,
+  매퍼 이벤트가 없는 Core 대량 INSERT는 bump()를 직접 호출)
+- 요청마다 버전을 한 번 읽어(refresh) 바뀐 테이블만 다시 읽으므로
+  다른 워커 프로세스에서 수정한 내용도 다음 요청부터 반영됨
+- 캐시에 없는 컬럼을 요청하면(fields=salesperson.email 등) 기존처럼 JOIN으로 로딩
+- 인증 캐시용 버전(auth)은 따로 두어, 직원의 권한/활성 여부/비밀번호가 바뀌거나 삭제될 때만 올림
+"""
+from typing import Dict, Iterable, Optional
+import asyncio
+from fastapi import HTTPException
+from sqlalchemy import event, insert, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.item import Item
+from app.models.reference_version import ReferenceVersion
+from app.models.user import User
+
+
+class ReferenceTable:
+    """한 테이블의 ID → 행(dict) 스냅샷"""
+
+    def __init__(self, model, columns: Iterable[str]):
+        self.model = model
+        self.name = model.__tablename__
+        self.columns = tuple(columns)
+        self.version: Optional[int] = None
+        self.rows: Dict[int, dict] = {}
+        self.loads = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.version is not None
+
+    def covers(self, columns: Iterable[str]) -> bool:
+        """요청한 컬럼을 모두 캐시에서 응답할 수 있는지"""
+        return self.ready and set(columns) <= set(self.columns)
+
+    def get(self, row_id: Optional[int]) -> Optional[dict]:
+        return self.rows.get(row_id)
+
+    async def refresh(self, db: AsyncSession, version: int):
+        """버전이 바뀌었으면 테이블 전체를 다시 읽기 (동시 요청은 한 번만 읽음)"""
+        if version == self.version:
+            return
+        async with self._lock:
+            if version == self.version:
+                return
+            result = await db.execute(select(*(getattr(self.model, name) for name in self.columns)))
+            self.rows = {row.id: dict(row._mapping) for row in result}
+            self.version = version
+            self.loads += 1
+
+    def stats(self) -> dict:
+        return {"version": self.version, "size": len(self.rows), "loads": self.loads}
+
+
+# 비밀번호 해시는 캐시하지 않음
+users = ReferenceTable(User, (
+    "id", "username", "email", "full_name", "phone", "role", "is_active", "is_admin", "is_super_admin",
+))
+items = ReferenceTable(Item, ("id", "code", "name", "unit", "unit_price", "is_active"))
+TABLES = (users, items)
+
+# 인증 캐시 버전 이름과, 바뀌면 버전을 올리는 users 컬럼
+# (로그인 시 재해시는 비밀번호가 같으므로 Core UPDATE로 저장해 버전을 올리지 않음)
+AUTH = "auth"
+AUTH_COLUMNS = ("role", "is_active", "is_admin", "is_super_admin", "hashed_password")
+
+
+async def refresh(db: AsyncSession):
+    """참조 데이터 버전을 확인하고 바뀐 테이블만 다시 읽기 (요청 시작 시 호출)"""
+    versions = dict((await db.execute(select(ReferenceVersion.name, ReferenceVersion.version))).all())
+    for table in TABLES:
+        await table.refresh(db, versions.get(table.name, 0))
+
+
+async def version(db: AsyncSession, name: str) -> int:
+    """버전 하나 읽기 (없으면 0)"""
+    return await db.scalar(select(ReferenceVersion.version).where(ReferenceVersion.name == name)) or 0
+
+
+def check_items(item_ids: Iterable[int]):
+    """견적/계약 항목의 품목 ID 검증 (캐시에서 한 번에 확인, refresh 이후 호출)"""
+    missing = sorted({item_id for item_id in item_ids if items.get(item_id) is None})
+    if missing:
+        raise HTTPException(
+            status_code=400, detail=f"존재하지 않는 품목입니다: {', '.join(str(item_id) for item_id in missing)}"
+        )
+
+
+def bump(connection, name: str):
+    """참조 데이터 버전 올리기 (변경과 같은 트랜잭션)"""
+    table = ReferenceVersion.__table__
+    result = connection.execute(update(table).where(table.c.name == name).values(version=table.c.version + 1))
+    if result.rowcount == 0:
+        connection.execute(insert(table).values(name=name, version=1))
+
+
+def _record_change(mapper, connection, target):
+    bump(connection, mapper.local_table.name)
+
+
+def _record_auth_update(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in AUTH_COLUMNS):
+        bump(connection, AUTH)
+
+
+def _record_auth_delete(mapper, connection, target):
+    bump(connection, AUTH)
+
+
+for _table in TABLES:
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_table.model, _event, _record_change)
+event.listen(User, "after_update", _record_auth_update)
+event.listen(User, "after_delete", _record_auth_delete)
@@ -0,0 +1,186 @@
+"""
+느린 쿼리 기록기 (SLOW_QUERY_ENABLED=true 일 때만 동작)
+기준 시간(SLOW_QUERY_THRESHOLD_MS)을 넘긴 SQL을 요청 경로, 마스킹한 파라미터와 함께
+로그에 남기고 최근 N건을 메모리에 보관합니다.
+실행 계획(EXPLAIN QUERY PLAN / EXPLAIN)은 요청이 더 늦어지지 않도록
+별도 스레드에서 따로 연결을 잡아 수집합니다.
+"""
+from collections import deque
+from contextvars import ContextVar
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+import itertools
+import logging
+import queue
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.core.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+# 그대로 남겨도 되는 파라미터 타입 (ID, 날짜, 수량 등), 문자열/바이너리는 마스킹
+SAFE_PARAM_TYPES = (bool, int, float, Decimal, date, datetime, type(None))
+EXPLAINABLE_PREFIXES = ("select", "with")
+
+_current_scope: ContextVar[Optional[dict]] = ContextVar("slow_query_scope", default=None)
+
+
+def redact(value):
+    """파라미터 값 마스킹 (문자열은 길이만 남김)"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, SAFE_PARAM_TYPES):
+        return value
+    if isinstance(value, str):
+        return f"<str:{len(value)}>"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(value)}>"
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return f"<{type(value).__name__}>"
+
+
+class SlowQueryLog:
+    """최근 느린 쿼리 보관 및 실행 계획 수집"""
+
+    def __init__(self, max_entries: int, explain: bool):
+        self.explain_enabled = explain
+        self._entries = deque(maxlen=max_entries)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max(1, max_entries))
+        self._worker: Optional[threading.Thread] = None
+        self.explain_engine: Optional[Engine] = None
+
+    def record(self, statement: str, parameters, duration: float, dialect_name: str, executemany: bool):
+        """느린 쿼리 한 건 기록 (실행 계획은 비동기로 채움)"""
+        scope = _current_scope.get()
+        entry = {
+            "id": next(self._ids),
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "duration_ms": round(duration * 1000, 2),
+            "statement": statement,
+            "parameters": redact(parameters),
+            "executemany": executemany,
+            "method": scope["method"] if scope else None,
+            "route": route_template(scope) if scope else None,
+            "plan": None,
+            "plan_status": "skipped",
+        }
+        explainable = (
+            self.explain_enabled
+            and not executemany
+            and statement.lstrip().lower().startswith(EXPLAINABLE_PREFIXES)
+        )
+        if explainable:
+            entry["plan_status"] = "pending"
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            f"느린 쿼리 {entry['duration_ms']}ms [{entry['method']} {entry['route']}] "
+            f"{statement} 파라미터={entry['parameters']}"
+        )
+        if explainable:
+            self._enqueue_explain(entry, statement, parameters, dialect_name)
+
+    def _enqueue_explain(self, entry: dict, statement: str, parameters, dialect_name: str):
+        # 원본 파라미터는 실행 계획 수집에만 쓰고 보관하지 않음
+        try:
+            self._queue.put_nowait((entry, statement, parameters, dialect_name))
+        except queue.Full:
+            entry["plan_status"] = "dropped"
+            return
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._explain_loop, name="slow-query-explain", daemon=True)
+                self._worker.start()
+
+    def _explain_loop(self):
+        while True:
+            entry, statement, parameters, dialect_name = self._queue.get()
+            prefix = "EXPLAIN QUERY PLAN " if dialect_name == "sqlite" else "EXPLAIN "
+            try:
+                with self.explain_engine.connect() as connection:
+                    rows = connection.exec_driver_sql(prefix + statement, parameters).fetchall()
+                entry["plan"] = [" | ".join(str(column) for column in row) for row in rows]
+                entry["plan_status"] = "ok"
+            except Exception as e:
+                entry["plan"] = [str(e)]
+                entry["plan_status"] = "error"
+            finally:
+                self._queue.task_done()
+
+    def entries(self, limit: int = 50) -> list:
+        """최근 느린 쿼리 (최신순)"""
+        with self._lock:
+            return list(reversed(self._entries))[:limit]
+
+    def clear(self):
+        """보관 중인 기록 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(
+    max_entries=settings.SLOW_QUERY_LOG_SIZE,
+    explain=settings.SLOW_QUERY_EXPLAIN
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["slow_query_started"].pop()
+    duration = time.perf_counter() - started
+    if duration * 1000 < settings.SLOW_QUERY_THRESHOLD_MS or statement.startswith("EXPLAIN"):
+        return
+    slow_query_log.record(statement, parameters, duration, conn.dialect.name, executemany)
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("slow_query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def install_slow_query_log(engine: Engine, explain_engine: Engine = None):
+    """엔진에 느린 쿼리 기록 이벤트 등록 (explain_engine: 실행 계획 수집에 쓸 동기 엔진)"""
+    if not settings.SLOW_QUERY_ENABLED:
+        return
+    if explain_engine is not None:
+        slow_query_log.explain_engine = explain_engine
+    elif slow_query_log.explain_engine is None:
+        slow_query_log.explain_engine = engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class SlowQueryContextMiddleware:
+    """느린 쿼리에 요청 경로를 남기기 위해 현재 요청 scope를 보관하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
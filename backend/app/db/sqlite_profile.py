@@ -0,0 +1,128 @@
+"""
+SQLite 엔진 프로파일
+여러 워커 프로세스가 같은 DB 파일을 사용할 때를 위한 설정입니다.
+- 연결 시 PRAGMA 적용 (WAL, synchronous, busy_timeout, mmap_size, cache_size, foreign_keys)
+- 연결 풀 크기 명시
+- 잠금 충돌(database is locked) 시 지터를 둔 제한적 재시도
+
+WAL 모드에서는 읽기가 쓰기를 기다리지 않고, 쓰기끼리는 busy_timeout 동안 대기합니다.
+드라이버는 SELECT에서는 트랜잭션을 열지 않고 첫 쓰기 구문에서 BEGIN 하므로,
+잠금 오류가 난 구문은 아직 아무것도 쓰지 않은 상태여서 그대로 다시 실행해도 안전합니다.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.util import await_only
+import asyncio
+import logging
+import random
+import sqlite3
+import time
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LOCK_ERROR_MESSAGES = ("database is locked", "database table is locked", "database is busy")
+
+
+def is_sqlite_url(database_url: str) -> bool:
+    """SQLite URL 여부"""
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+def _is_memory_url(database_url: str) -> bool:
+    database = make_url(database_url).database
+    return not database or database == ":memory:"
+
+
+def engine_options(database_url: str) -> dict:
+    """create_engine/create_async_engine에 넘길 풀/연결 옵션"""
+    if not is_sqlite_url(database_url) or _is_memory_url(database_url):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # 풀의 연결이 여러 스레드에서 사용되므로 스레드 검사 해제
+        "connect_args": {"check_same_thread": False},
+    }
+
+
+def _apply_pragmas(dbapi_connection, connection_record):
+    """새 연결마다 PRAGMA 적용"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA cache_size = {int(settings.SQLITE_CACHE_SIZE)}")
+        cursor.execute(f"PRAGMA foreign_keys = {'ON' if settings.SQLITE_FOREIGN_KEYS else 'OFF'}")
+    finally:
+        cursor.close()
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    """SQLite 잠금 충돌 오류 여부"""
+    message = str(exc).lower()
+    return isinstance(exc, sqlite3.OperationalError) and any(m in message for m in LOCK_ERROR_MESSAGES)
+
+
+def retry_delay(attempt: int) -> float:
+    """재시도 대기 시간 (초) - 지수 증가 상한 안에서 무작위 (full jitter)"""
+    cap = min(settings.DB_LOCK_RETRY_MAX_MS, settings.DB_LOCK_RETRY_BASE_MS * (2 ** attempt))
+    return random.uniform(0, cap) / 1000
+
+
+def max_lock_wait() -> float:
+    """한 문장이 잠금 때문에 기다릴 수 있는 최대 시간 (초) - 매 시도의 busy_timeout + 재시도 대기 상한의 합"""
+    attempts = settings.DB_LOCK_RETRIES + 1
+    delays = sum(
+        min(settings.DB_LOCK_RETRY_MAX_MS, settings.DB_LOCK_RETRY_BASE_MS * (2 ** attempt))
+        for attempt in range(settings.DB_LOCK_RETRIES)
+    )
+    return (attempts * settings.SQLITE_BUSY_TIMEOUT_MS + delays) / 1000
+
+
+def _make_execute_with_retry(is_async: bool):
+    def _sleep(seconds: float):
+        if is_async:
+            # 비동기 엔진에서는 greenlet 안에서 이벤트 루프에 양보하며 대기
+            await_only(asyncio.sleep(seconds))
+        else:
+            time.sleep(seconds)
+
+    def _execute(cursor, statement, parameters, context, many=False):
+        attempt = 0
+        while True:
+            try:
+                if many:
+                    cursor.executemany(statement, parameters)
+                else:
+                    cursor.execute(statement, parameters)
+                return True
+            except Exception as exc:
+                if attempt >= settings.DB_LOCK_RETRIES or not is_lock_error(exc):
+                    raise
+                delay = retry_delay(attempt)
+                attempt += 1
+                logger.warning(f"SQLite 잠금 충돌, {delay * 1000:.0f}ms 후 재시도 ({attempt}/{settings.DB_LOCK_RETRIES})")
+                _sleep(delay)
+
+    return _execute
+
+
+def install_sqlite_profile(engine: Engine, is_async: bool = False):
+    """엔진에 PRAGMA 적용과 잠금 재시도 이벤트 등록 (SQLite가 아니면 아무것도 하지 않음)"""
+    if engine.dialect.name != "sqlite":
+        return
+    event.listen(engine, "connect", _apply_pragmas)
+
+    execute = _make_execute_with_retry(is_async)
+
+    @event.listens_for(engine, "do_execute")
+    def _do_execute(cursor, statement, parameters, context):
+        return execute(cursor, statement, parameters, context)
+
+    @event.listens_for(engine, "do_executemany")
+    def _do_executemany(cursor, statement, parameters, context):
+        return execute(cursor, statement, parameters, context, many=True)
@@ -0,0 +1,148 @@
+"""
+재고 수불 (입고 / 출고 / 조정)
+재고 수량은 읽어서 계산한 값을 다시 쓰지 않고, 조건부 UPDATE 한 문장으로 증감합니다.
+
+    UPDATE inventory SET quantity = quantity - :n WHERE id = :id AND quantity >= :n
+
+동시에 출고해도 차감이 유실되지 않고 재고가 음수가 되지 않습니다. 증감할 때마다 같은 트랜잭션에서
+stock_movements에 한 행(증감 수량, 반영 후 수량)을 기록하며, 현재 수량은 기존처럼 inventory 한 행만 읽습니다.
+
+- 설치 완료: 계약 항목을 품목별로 합산해 UPDATE 한 문장으로 일괄 출고 (재고가 등록된 품목만)
+- 재고 수정(PUT)의 수량 지정: 화면에서 조회한 수량(expected_quantity)이 그대로일 때만 변경 (그 사이 변경되었으면 409)
+"""
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db import references
+from app.models.contract import ContractItem
+from app.models.installation import Installation
+from app.models.inventory import Inventory
+from app.models.stock_movement import MovementType, StockMovement
+
+
+def signed_quantity(movement_type: MovementType, quantity: int) -> int:
+    """요청 수량을 증감 수량으로 변환 (입고 +, 출고 -, 조정은 부호 그대로)"""
+    if movement_type == MovementType.ADJUST:
+        if quantity == 0:
+            raise HTTPException(status_code=400, detail="조정 수량은 0일 수 없습니다")
+        return quantity
+    if quantity <= 0:
+        raise HTTPException(status_code=400, detail="입고/출고 수량은 1 이상이어야 합니다")
+    return quantity if movement_type == MovementType.IN else -quantity
+
+
+async def record_movement(
+    db: AsyncSession,
+    inventory_id: int,
+    movement_type: MovementType,
+    quantity: int,
+    user_id: Optional[int] = None,
+    notes: Optional[str] = None,
+) -> StockMovement:
+    """
+    재고 한 건 증감 + 수불 기록 (커밋은 호출한 쪽에서)
+    quantity: 증감 수량 (signed_quantity 결과), 차감 후 음수가 되면 400
+    """
+    statement = update(Inventory).where(Inventory.id == inventory_id).values(
+        quantity=Inventory.quantity + quantity, updated_at=datetime.utcnow()
+    )
+    if quantity < 0:
+        statement = statement.where(Inventory.quantity >= -quantity)
+    row = (await db.execute(
+        statement.returning(Inventory.item_id, Inventory.quantity),
+        execution_options={"synchronize_session": False},
+    )).first()
+    if row is None:
+        if await db.scalar(select(Inventory.id).where(Inventory.id == inventory_id)) is None:
+            raise HTTPException(status_code=404, detail="재고를 찾을 수 없습니다")
+        raise HTTPException(status_code=400, detail="재고가 부족합니다")
+
+    movement = StockMovement(
+        item_id=row.item_id, movement_type=movement_type, quantity=quantity, balance=row.quantity,
+        notes=notes, created_by=user_id,
+    )
+    db.add(movement)
+    await db.flush()
+    return movement
+
+
+async def set_quantity(db: AsyncSession, inventory: Inventory, quantity: int, expected: Optional[int],
+                       user_id: Optional[int] = None) -> Optional[StockMovement]:
+    """
+    재고 수량 지정 (재고 수정 화면, 차이만큼 조정 기록)
+    expected: 클라이언트가 화면에 불러온 수량. 현재 수량이 이 값일 때만 바꾸므로,
+    화면을 연 뒤 다른 관리자의 수정이나 입출고가 있었으면 409 (덮어쓰지 않음)
+    """
+    if expected is None:
+        if quantity == inventory.quantity:
+            return None
+        raise HTTPException(status_code=428, detail="수량을 바꾸려면 조회한 수량(expected_quantity)을 함께 보내야 합니다")
+    if quantity == expected:
+        return None  # 수량은 수정하지 않음
+    if quantity < 0:
+        raise HTTPException(status_code=400, detail="재고 수량은 0 이상이어야 합니다")
+    result = await db.execute(
+        update(Inventory)
+        .where(Inventory.id == inventory.id, Inventory.quantity == expected)
+        .values(quantity=quantity, updated_at=datetime.utcnow()),
+        execution_options={"synchronize_session": False},
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=409, detail="다른 요청에서 재고 수량이 변경되었습니다. 다시 조회 후 수정해 주세요")
+
+    movement = StockMovement(
+        item_id=inventory.item_id, movement_type=MovementType.ADJUST, quantity=quantity - expected,
+        balance=quantity, notes="재고 수정", created_by=user_id,
+    )
+    db.add(movement)
+    return movement
+
+
+async def post_installation_out(db: AsyncSession, installation: Installation,
+                                user_id: Optional[int] = None) -> int:
+    """
+    설치 완료 출고: 계약 항목 수량을 품목별로 합산해 한 번에 차감 (커밋은 호출한 쪽에서)
+    한 품목이라도 재고가 부족하면 400 (호출한 쪽 트랜잭션은 커밋되지 않으므로 모두 취소)
+    반환값: 출고한 품목 수
+    """
+    needed_query = (
+        select(ContractItem.item_id, func.sum(ContractItem.quantity).label("quantity"))
+        .join(Inventory, Inventory.item_id == ContractItem.item_id)
+        .where(ContractItem.contract_id == installation.contract_id)
+        .group_by(ContractItem.item_id)
+    )
+    needed = dict((await db.execute(needed_query)).all())
+    if not needed:
+        return 0
+
+    lines = needed_query.subquery()
+    result = await db.execute(
+        update(Inventory)
+        .where(Inventory.item_id == lines.c.item_id, Inventory.quantity >= lines.c.quantity)
+        .values(quantity=Inventory.quantity - lines.c.quantity, updated_at=datetime.utcnow())
+        .returning(Inventory.item_id, Inventory.quantity),
+        execution_options={"synchronize_session": False},
+    )
+    balances = dict(result.all())
+    short = sorted(item_id for item_id in needed if item_id not in balances)
+    if short:
+        names = [(references.items.get(item_id) or {}).get("code") or str(item_id) for item_id in short]
+        raise HTTPException(status_code=400, detail=f"재고가 부족합니다: {', '.join(names)}")
+
+    await db.execute(insert(StockMovement), [
+        {
+            "item_id": item_id,
+            "movement_type": MovementType.OUT,
+            "quantity": -needed[item_id],
+            "balance": balance,
+            "contract_id": installation.contract_id,
+            "installation_id": installation.id,
+            "notes": "설치 완료 출고",
+            "created_by": user_id,
+            "created_at": datetime.utcnow(),
+        }
+        for item_id, balance in balances.items()
+    ])
+    return len(balances)
@@ -0,0 +1,150 @@
+"""
+모바일 동기화 변경 피드
+마지막 동기화 이후 등록/수정된 행(updated_at 기준)과 삭제된 행(삭제 기록)을 돌려줍니다.
+목록 전체를 다시 받지 않고 변경분만 받으므로 피드 조회 비용은 테이블 크기가 아니라
+변경 건수에 비례합니다 ((담당자, updated_at, id) / (엔티티, 담당자, deleted_at, id) 인덱스).
+
+- 삭제: 동기화 대상 모델이 삭제되면 매퍼 이벤트로 tombstones 테이블에 기록
+- 토큰: 변경/삭제 각각의 마지막 (시각, id)를 담은 불투명 문자열
+- updated_at은 문장 실행 전에 정해지므로, 잠금을 기다리다 늦게 커밋된 변경을 건너뛰지 않도록
+  잠금 대기 최대 시간(busy_timeout x 시도 횟수 + 재시도 대기)에 여유를 더한 settle_seconds() 이전까지만 응답
+- 변경과 삭제가 같은 시각 범위까지만 응답되므로, 클라이언트는 한 응답의 deleted를 먼저
+  반영하고 changes를 반영하면 됩니다
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+import base64
+import json
+from fastapi import HTTPException
+from sqlalchemy import Select, event, insert, select, tuple_
+from sqlalchemy.orm import undefer
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.sqlite_profile import max_lock_wait
+from app.models.client import Client
+from app.models.consultation import Consultation
+from app.models.contract import Contract
+from app.models.installation import Installation
+from app.models.quotation import Quotation
+from app.models.tombstone import Tombstone
+
+SETTLE_MARGIN_SECONDS = 2  # 잠금을 얻은 뒤 커밋까지 걸리는 시간 여유
+
+# 동기화 대상 모델 -> 담당자 컬럼 (역할별 피드와 삭제 기록의 owner_id)
+SYNCED_MODELS = {
+    Client: None,
+    Consultation: "salesperson_id",
+    Quotation: "salesperson_id",
+    Contract: "salesperson_id",
+    Installation: "technician_id",
+}
+
+
+def settle_seconds() -> float:
+    """
+    피드가 응답하지 않고 남겨두는 최근 구간 (초)
+    이보다 먼저 updated_at이 찍힌 트랜잭션은 잠금 대기와 재시도를 모두 거쳐도 이미 커밋되었거나 실패했습니다.
+    """
+    return max_lock_wait() + SETTLE_MARGIN_SECONDS
+
+
+def _record_deletion(mapper, connection, target):
+    """삭제된 행의 삭제 기록 추가 (삭제와 같은 트랜잭션)"""
+    owner = SYNCED_MODELS[mapper.class_]
+    connection.execute(insert(Tombstone.__table__).values(
+        entity=mapper.local_table.name,
+        entity_id=target.id,
+        owner_id=getattr(target, owner) if owner else None,
+        deleted_at=datetime.utcnow(),
+    ))
+
+
+for _model in SYNCED_MODELS:
+    event.listen(_model, "after_delete", _record_deletion)
+
+
+Position = Optional[Tuple[datetime, int]]
+
+
+def encode_token(changes: Position, deleted: Position) -> str:
+    """변경/삭제 피드의 마지막 위치를 토큰으로 변환"""
+    payload = [[value.isoformat(), row_id] if value else None for value, row_id in (changes or (None, 0), deleted)]
+    data = json.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_token(token: str) -> Tuple[Position, Position]:
+    """토큰을 변경/삭제 피드의 마지막 위치로 복원"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        changes, deleted = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return tuple(
+            (datetime.fromisoformat(position[0]), int(position[1])) if position else None
+            for position in (changes, deleted)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 동기화 토큰입니다")
+
+
+class FeedPage:
+    """변경 피드 한 번의 응답"""
+
+    def __init__(self, changes: list, deleted: List[int], token: str, has_more: bool):
+        self.changes = changes
+        self.deleted = deleted
+        self.token = token
+        self.has_more = has_more
+
+
+async def change_feed(
+    db: AsyncSession,
+    query: Select,
+    model,
+    token: Optional[str] = None,
+    limit: int = 500,
+    owner_id: Optional[int] = None
+) -> FeedPage:
+    """
+    토큰 이후 등록/수정된 행과 삭제된 행 ID를 조회합니다.
+    query: 역할별 조건(담당자)이 적용된 SELECT, owner_id: 삭제 기록에 적용할 담당자
+    토큰이 없으면 전체 행을 처음부터 응답하며(최초 동기화), 이전 삭제 기록은 응답하지 않습니다.
+    """
+    until = datetime.utcnow() - timedelta(seconds=settle_seconds())
+    if token:
+        change_position, deleted_position = decode_token(token)
+    else:
+        change_position, deleted_position = None, (until, 0)
+
+    # fields로 응답 컬럼을 좁혀도 토큰 위치 계산에 필요한 updated_at은 항상 로딩
+    query = query.options(undefer(model.updated_at)).where(model.updated_at <= until)
+    query = query.order_by(model.updated_at, model.id)
+    if change_position:
+        query = query.where(tuple_(model.updated_at, model.id) > tuple_(*change_position))
+    rows = (await db.scalars(query.limit(limit + 1))).all()
+
+    tombstones = select(Tombstone.deleted_at, Tombstone.id, Tombstone.entity_id).where(
+        Tombstone.entity == model.__tablename__,
+        Tombstone.deleted_at <= until,
+        tuple_(Tombstone.deleted_at, Tombstone.id) > tuple_(*deleted_position),
+    ).order_by(Tombstone.deleted_at, Tombstone.id)
+    if owner_id is not None:
+        tombstones = tombstones.where(Tombstone.owner_id == owner_id)
+    deleted = (await db.execute(tombstones.limit(limit + 1))).all()
+
+    # 한쪽이 limit을 넘으면 두 피드 모두 그 시각까지만 응답 (삭제/재등록 순서 보장)
+    horizon = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        horizon = rows[-1].updated_at
+    if len(deleted) > limit:
+        deleted = deleted[:limit]
+        horizon = min(horizon or deleted[-1].deleted_at, deleted[-1].deleted_at)
+    has_more = horizon is not None
+    if has_more:
+        rows = [row for row in rows if row.updated_at <= horizon]
+        deleted = [row for row in deleted if row.deleted_at <= horizon]
+
+    if rows:
+        change_position = (rows[-1].updated_at, rows[-1].id)
+    if deleted:
+        deleted_position = (deleted[-1].deleted_at, deleted[-1].id)
+    return FeedPage(rows, [row.entity_id for row in deleted], encode_token(change_position, deleted_position), has_more)
@@ -1,12 +1,22 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
-from app.db.database import engine, Base
-from app.api import auth, admin, employee, client, consultation, quotation, contract, installation, inventory, item, backup
+from app.core.password_pool import password_pool, PasswordPoolBusy
+from app.core.responses import ORJSONResponse
+from app.core.metrics import MetricsMiddleware, instrument_engine, render_metrics, mark_worker_dead
+from app.db.database import engine, async_engine
+from app.db.migrate import upgrade_database
+from app.db import bulk_import
+from app.core import uploads
+from app.db.slow_query import SlowQueryContextMiddleware
+from app.db.dependencies import refresh_references
+from app.api import auth, admin, employee, client, consultation, quotation, contract, installation, inventory, item, backup, dashboard, sync, imports
 from app.db.init_db import init_db
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 데이터베이스 스키마 생성/마이그레이션
+upgrade_database()
 
 # 데이터베이스 초기화 (관리자 계정 생성)
 try:
@@ -14,12 +24,20 @@ try:
 except Exception as e:
     print(f"⚠️  데이터베이스 초기화 중 오류 (무시 가능): {e}")
 
+# 이전 실행에서 중단된 가져오기 작업 실패 처리
+bulk_import.fail_stale_jobs()
+
 app = FastAPI(
     title="넥소코리아 고객관리 API",
     description="고객관리, 상담, 견적, 계약, 설치/AS 관리 시스템",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# SQL 실행 통계 수집 (요청별 쿼리 수/시간)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
 # CORS 설정
 # 내부 네트워크 사용을 위해 유연한 설정
 # ALLOWED_ORIGINS가 비어있으면 모든 origin 허용 (내부 네트워크용)
@@ -31,20 +49,58 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 페이지네이션/조건부 조회 헤더를 브라우저에서 읽을 수 있도록 노출
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
+# 느린 쿼리에 요청 경로를 남기기 위한 컨텍스트
+if settings.SLOW_QUERY_ENABLED:
+    app.add_middleware(SlowQueryContextMiddleware)
+
+# 요청 메트릭 (가장 바깥에서 전체 처리 시간을 측정하도록 마지막에 등록)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(PasswordPoolBusy)
+async def password_pool_busy_handler(request: Request, exc: PasswordPoolBusy):
+    """해시 작업 대기열이 가득 찬 경우 잠시 후 재시도하도록 안내"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "로그인 요청이 많습니다. 잠시 후 다시 시도하세요"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.on_event("shutdown")
+def shutdown_password_pool():
+    """비밀번호 해시 풀 종료"""
+    password_pool.shutdown()
+    bulk_import.shutdown()
+    uploads.shutdown()
+    mark_worker_dead()
+
+
 # API 라우터 등록
 app.include_router(auth.router, prefix="/api/auth", tags=["인증"])
 app.include_router(admin.router, prefix="/api/admin", tags=["관리자"])
 app.include_router(employee.router, prefix="/api/employees", tags=["직원"])
 app.include_router(client.router, prefix="/api/clients", tags=["거래처"])
-app.include_router(consultation.router, prefix="/api/consultations", tags=["상담"])
-app.include_router(quotation.router, prefix="/api/quotations", tags=["견적"])
-app.include_router(contract.router, prefix="/api/contracts", tags=["계약"])
-app.include_router(installation.router, prefix="/api/installations", tags=["설치/AS"])
-app.include_router(inventory.router, prefix="/api/inventory", tags=["재고"])
+# 영업자/기사/품목 요약을 JOIN 없이 참조 데이터 캐시에서 붙이는 라우터
+reference_cache = [Depends(refresh_references)]
+app.include_router(consultation.router, prefix="/api/consultations", tags=["상담"], dependencies=reference_cache)
+app.include_router(quotation.router, prefix="/api/quotations", tags=["견적"], dependencies=reference_cache)
+app.include_router(contract.router, prefix="/api/contracts", tags=["계약"], dependencies=reference_cache)
+app.include_router(installation.router, prefix="/api/installations", tags=["설치/AS"], dependencies=reference_cache)
+app.include_router(inventory.router, prefix="/api/inventory", tags=["재고"], dependencies=reference_cache)
 app.include_router(item.router, prefix="/api/items", tags=["품목"])
 app.include_router(backup.router, prefix="/api/backup", tags=["백업"])
+app.include_router(dashboard.router, prefix="/api/dashboard", tags=["대시보드"])
+app.include_router(sync.router, prefix="/api/sync", tags=["동기화"], dependencies=reference_cache)
+app.include_router(imports.router, prefix="/api/imports", tags=["가져오기"])
+
+# 업로드 파일 (설치/AS 사진과 썸네일, nginx가 /uploads를 이 서버로 프록시)
+app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR, check_dir=False), name="uploads")
 
 
 @app.get("/")
@@ -56,3 +112,11 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (전체 워커 합산)"""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
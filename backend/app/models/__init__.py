@@ -1,21 +1,37 @@
 from app.models.user import User
-from app.models.client import Client
+from app.models.client import Client, ClientSearchGram
 from app.models.item import Item
 from app.models.consultation import Consultation
 from app.models.quotation import Quotation
 from app.models.contract import Contract
 from app.models.installation import Installation
 from app.models.inventory import Inventory
+from app.models.tombstone import Tombstone
+from app.models.import_job import ImportJob
+from app.models.reference_version import ReferenceVersion
+from app.models.stock_movement import StockMovement
 
 __all__ = [
     "User",
     "Client",
+    "ClientSearchGram",
     "Item",
     "Consultation",
     "Quotation",
     "Contract",
     "Installation",
     "Inventory",
+    "Tombstone",
+    "ImportJob",
+    "ReferenceVersion",
+    "StockMovement",
 ]
 
+# 거래처 검색 색인 동기화 이벤트 등록
+import app.db.client_search  # noqa: E402,F401
 
+# 동기화 삭제 기록(tombstone) 이벤트 등록
+import app.db.sync  # noqa: E402,F401
+
+# 참조 데이터(직원/품목) 캐시 버전 이벤트 등록
+import app.db.references  # noqa: E402,F401
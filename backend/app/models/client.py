@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 import enum
@@ -13,6 +13,10 @@ class ClientType(str, enum.Enum):
 
 class Client(Base):
     __tablename__ = "clients"
+    __table_args__ = (
+        # 동기화 변경 피드 ((updated_at, id) 순)
+        Index("ix_clients_updated", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, index=True)
@@ -33,7 +37,7 @@ class Client(Base):
     
     # 공통 정보
     notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
@@ -46,3 +50,12 @@ class Client(Base):
         return f"<Client(id={self.id}, name={self.name}, type={self.client_type})>"
 
 
+class ClientSearchGram(Base):
+    """거래처 검색용 2-gram 색인 (거래처명, 회사명, 대표자명, 주소)"""
+    __tablename__ = "client_search_grams"
+
+    gram = Column(String(2), primary_key=True)
+    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+    def __repr__(self):
+        return f"<ClientSearchGram(gram={self.gram}, client_id={self.client_id})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 from datetime import datetime
@@ -6,14 +6,22 @@ from datetime import datetime
 
 class Consultation(Base):
     __tablename__ = "consultations"
+    __table_args__ = (
+        # 영업자별 목록 (created_at, id 순 페이지네이션)과 대시보드 오늘 상담 수
+        Index("ix_consultations_salesperson_created", "salesperson_id", "created_at", "id"),
+        Index("ix_consultations_salesperson_date", "salesperson_id", "consultation_date"),
+        # 동기화 변경 피드 ((updated_at, id) 순, 영업자별)
+        Index("ix_consultations_updated", "updated_at", "id"),
+        Index("ix_consultations_salesperson_updated", "salesperson_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(Integer, ForeignKey("clients.id"), nullable=False, index=True)
     salesperson_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    consultation_date = Column(DateTime, nullable=False, default=datetime.utcnow)
+    consultation_date = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     content = Column(Text, nullable=False)
     notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Enum, Date
+from sqlalchemy import Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Enum, Date, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 import enum
@@ -15,17 +15,25 @@ class ContractStatus(str, enum.Enum):
 
 class Contract(Base):
     __tablename__ = "contracts"
+    __table_args__ = (
+        # 영업자별 목록 (created_at, id 순 페이지네이션)과 대시보드 상태별 건수
+        Index("ix_contracts_salesperson_created", "salesperson_id", "created_at", "id"),
+        Index("ix_contracts_salesperson_status", "salesperson_id", "status"),
+        # 동기화 변경 피드 ((updated_at, id) 순, 영업자별)
+        Index("ix_contracts_updated", "updated_at", "id"),
+        Index("ix_contracts_salesperson_updated", "salesperson_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     contract_number = Column(String(50), unique=True, index=True, nullable=False)
     client_id = Column(Integer, ForeignKey("clients.id"), nullable=False, index=True)
-    quotation_id = Column(Integer, ForeignKey("quotations.id"))
+    quotation_id = Column(Integer, ForeignKey("quotations.id"), index=True)
     salesperson_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    status = Column(Enum(ContractStatus), default=ContractStatus.DRAFT, nullable=False)
+    status = Column(Enum(ContractStatus), default=ContractStatus.DRAFT, nullable=False, index=True)
     contract_date = Column(Date, nullable=False, default=date.today)
     total_amount = Column(Numeric(15, 2), default=0)
     notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
@@ -43,7 +51,7 @@ class ContractItem(Base):
     __tablename__ = "contract_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False)
+    contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False, index=True)
     item_id = Column(Integer, ForeignKey("items.id"), nullable=False)
     quantity = Column(Integer, nullable=False, default=1)
     unit_price = Column(Numeric(15, 2), nullable=False)
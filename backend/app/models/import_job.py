@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, JSON
+from app.db.database import Base
+import enum
+from datetime import datetime
+
+
+class ImportStatus(str, enum.Enum):
+    PENDING = "pending"  # 대기중
+    RUNNING = "running"  # 진행중
+    COMPLETED = "completed"  # 완료 (오류 행이 있어도 완료)
+    FAILED = "failed"  # 실패 (파일을 읽을 수 없음 등)
+
+
+class ImportJob(Base):
+    """대량 가져오기 작업 (여러 워커 프로세스에서 진행 상황을 조회할 수 있도록 DB에 보관)"""
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    target = Column(String(50), nullable=False)  # clients, items, inventory
+    filename = Column(String(255), nullable=False)
+    status = Column(Enum(ImportStatus), default=ImportStatus.PENDING, nullable=False)
+    total_rows = Column(Integer, default=0, nullable=False)  # 처리한 데이터 행 수
+    inserted_rows = Column(Integer, default=0, nullable=False)
+    error_count = Column(Integer, default=0, nullable=False)
+    errors = Column(JSON)  # 행별 오류 [{"row": 행 번호, "message": 내용}] (최대 IMPORT_MAX_ERRORS건)
+    message = Column(Text)  # 작업 실패 사유
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    # 작업을 맡은 프로세스가 청크마다 갱신 (오래 갱신되지 않은 대기/진행 작업은 중단된 것으로 보고 실패 처리)
+    heartbeat_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ImportJob(id={self.id}, target={self.target}, status={self.status})>"
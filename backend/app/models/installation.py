@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Date
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Date, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 import enum
@@ -19,6 +19,16 @@ class InstallationStatus(str, enum.Enum):
 
 class Installation(Base):
     __tablename__ = "installations"
+    __table_args__ = (
+        # 기사별 목록 (created_at, id 순 페이지네이션)과 기사별 대기 작업/일정
+        Index("ix_installations_technician_created", "technician_id", "created_at", "id"),
+        Index("ix_installations_technician_status_scheduled", "technician_id", "status", "scheduled_date"),
+        # 상태 필터와 대시보드 대기 작업 수 (관리자)
+        Index("ix_installations_status_scheduled", "status", "scheduled_date"),
+        # 동기화 변경 피드 ((updated_at, id) 순, 기사별)
+        Index("ix_installations_updated", "updated_at", "id"),
+        Index("ix_installations_technician_updated", "technician_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False)
@@ -26,13 +36,15 @@ class Installation(Base):
     technician_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     installation_type = Column(Enum(InstallationType), nullable=False)
     status = Column(Enum(InstallationStatus), default=InstallationStatus.PENDING, nullable=False)
-    scheduled_date = Column(Date)
+    scheduled_date = Column(Date, index=True)
     completed_date = Column(DateTime)
     result_text = Column(Text)
     photo_url_1 = Column(String(500))  # 사진 최대 2장
     photo_url_2 = Column(String(500))
+    photo_thumb_url_1 = Column(String(500))  # 사진 썸네일 (목록/미리보기용)
+    photo_thumb_url_2 = Column(String(500))
     notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Index, func, literal_column
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 from datetime import datetime
@@ -13,7 +13,7 @@ class Inventory(Base):
     min_stock_level = Column(Integer, default=0)  # 최소 재고량
     location = Column(String(100))  # 재고 위치
     notes = Column(String(500))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
@@ -23,3 +23,11 @@ class Inventory(Base):
         return f"<Inventory(id={self.id}, item_id={self.item_id}, quantity={self.quantity})>"
 
 
+
+# 여유 수량 (현재 수량 - 최소 재고량): 0 이하면 부족 재고, 작을수록 부족이 심함
+# 조회 조건이 부분 인덱스의 식과 그대로 같아야 인덱스를 쓰므로 0은 바인드 파라미터가 아닌 리터럴로 둠
+STOCK_MARGIN = Inventory.quantity - func.coalesce(Inventory.min_stock_level, literal_column("0"))
+LOW_STOCK = STOCK_MARGIN <= literal_column("0")
+
+# 부족 재고 목록/건수 (부족한 행만 담는 부분 인덱스, 여유 수량 순)
+Index("ix_inventory_low_stock", STOCK_MARGIN, Inventory.id, sqlite_where=LOW_STOCK, postgresql_where=LOW_STOCK)
@@ -14,7 +14,7 @@ class Item(Base):
     unit_price = Column(Numeric(15, 2), nullable=False)
     unit = Column(String(20), default="개")  # 단위
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 import enum
@@ -15,6 +15,13 @@ class QuotationStatus(str, enum.Enum):
 
 class Quotation(Base):
     __tablename__ = "quotations"
+    __table_args__ = (
+        # 영업자별 목록 (created_at, id 순 페이지네이션)
+        Index("ix_quotations_salesperson_created", "salesperson_id", "created_at", "id"),
+        # 동기화 변경 피드 ((updated_at, id) 순, 영업자별)
+        Index("ix_quotations_updated", "updated_at", "id"),
+        Index("ix_quotations_salesperson_updated", "salesperson_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     quotation_number = Column(String(50), unique=True, index=True, nullable=False)
@@ -25,7 +32,7 @@ class Quotation(Base):
     total_amount = Column(Numeric(15, 2), default=0)
     valid_until = Column(DateTime)
     notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # 관계
@@ -43,7 +50,7 @@ class QuotationItem(Base):
     __tablename__ = "quotation_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    quotation_id = Column(Integer, ForeignKey("quotations.id"), nullable=False)
+    quotation_id = Column(Integer, ForeignKey("quotations.id"), nullable=False, index=True)
     item_id = Column(Integer, ForeignKey("items.id"), nullable=False)
     quantity = Column(Integer, nullable=False, default=1)
     unit_price = Column(Numeric(15, 2), nullable=False)
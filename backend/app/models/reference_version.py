@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String
+from app.db.database import Base
+
+
+class ReferenceVersion(Base):
+    """참조 데이터(직원/품목) 변경 버전 (워커 프로세스별 참조 캐시 무효화용)"""
+    __tablename__ = "reference_versions"
+
+    name = Column(String(50), primary_key=True)  # 테이블 이름
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ReferenceVersion(name={self.name}, version={self.version})>"
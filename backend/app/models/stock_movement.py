@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index
+from app.db.database import Base
+import enum
+from datetime import datetime
+
+
+class MovementType(str, enum.Enum):
+    IN = "in"  # 입고
+    OUT = "out"  # 출고
+    ADJUST = "adjust"  # 조정 (실사, 직접 수정 등)
+
+
+class StockMovement(Base):
+    """재고 수불부 (입고/출고/조정 한 건마다 한 행, 현재 수량은 inventory.quantity)"""
+    __tablename__ = "stock_movements"
+    __table_args__ = (
+        # 품목별 수불 내역 (created_at, id 순 페이지네이션)
+        Index("ix_stock_movements_item_created", "item_id", "created_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    item_id = Column(Integer, ForeignKey("items.id"), nullable=False)
+    movement_type = Column(Enum(MovementType), nullable=False)
+    quantity = Column(Integer, nullable=False)  # 증감 수량 (출고/감소는 음수)
+    balance = Column(Integer, nullable=False)  # 반영 후 재고 수량
+    # 설치 완료 출고의 계약/작업 (계약이나 작업을 삭제해도 수불 기록은 남기고 연결만 해제)
+    contract_id = Column(Integer, ForeignKey("contracts.id", ondelete="SET NULL"))
+    installation_id = Column(Integer, ForeignKey("installations.id", ondelete="SET NULL"), index=True)
+    notes = Column(String(500))
+    # 등록한 직원 (계정을 삭제해도 수불 기록은 남김)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<StockMovement(item_id={self.item_id}, type={self.movement_type}, quantity={self.quantity})>"
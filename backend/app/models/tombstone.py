@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from app.db.database import Base
+from datetime import datetime
+
+
+class Tombstone(Base):
+    """삭제 기록 (모바일 동기화 변경 피드에서 삭제된 행을 알리기 위해 보관)"""
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        # 엔티티별 / 담당자별 삭제 피드 ((deleted_at, id) 순 키셋 조회)
+        Index("ix_tombstones_entity_deleted", "entity", "deleted_at", "id"),
+        Index("ix_tombstones_entity_owner_deleted", "entity", "owner_id", "deleted_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String(50), nullable=False)  # 테이블 이름
+    entity_id = Column(Integer, nullable=False)
+    owner_id = Column(Integer)  # 담당 영업자/기사 (역할별 피드 필터용)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<Tombstone(entity={self.entity}, entity_id={self.entity_id})>"
@@ -57,3 +57,14 @@ class UserResponse(UserBase):
         )
 
 
+class CurrentUser(UserResponse):
+    """인증된 사용자 스냅샷 (세션과 무관하게 여러 요청에서 공유 가능)"""
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
+    @classmethod
+    def from_user(cls, user) -> "CurrentUser":
+        """User 모델에서 검증 없이 스냅샷 생성 (지연 로딩 속성 없음)"""
+        return cls.model_construct(**{field: getattr(user, field) for field in cls.model_fields})
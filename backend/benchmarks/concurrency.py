@@ -0,0 +1,198 @@
+"""
+동시 접속 지연시간 벤치마크
+ASGI 앱을 프로세스 안에서 직접 호출해 단일 워커에 동시 클라이언트가 몰릴 때의
+경로별 지연시간(p50/p95/p99)을 측정합니다.
+DB 호출이 이벤트 루프를 막으면 DB를 쓰지 않는 /health 지연시간까지 함께 늘어납니다.
+
+--mode blocking은 비동기 전환 전의 기준선입니다. 같은 경로를 옛 방식 그대로(동기 Session 의존성,
+async def 핸들러 안에서 동기 조회) 처리하는 별도 앱을 같은 DB에 띄워 측정하므로 전후 비교를 다시 실행할 수 있습니다.
+결과에는 실행 명령과 환경(커밋, Python/SQLite 버전, CPU 수, 연결 풀 설정)이 함께 기록됩니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.concurrency --clients 100 --requests 3 --rows 2000 --mode blocking --output before.json
+    python -m benchmarks.concurrency --clients 100 --requests 3 --rows 2000 --output after.json --compare before.json
+"""
+from typing import Optional
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from benchmarks.database import use_database
+from benchmarks.report import compare_reports, run_metadata, summarize, write_report
+
+MODES = ("async", "blocking")
+
+ROUTES = [
+    ("clients", "/api/clients/", {"limit": 100}),
+    ("clients_search", "/api/clients/", {"search": "상사", "limit": 20}),
+    ("consultations", "/api/consultations/", {"limit": 100}),
+    ("health", "/health", {}),
+]
+
+
+def seed_clients(num_clients: int):
+    """측정용 데이터 생성 (거래처가 부족할 때만)"""
+    from sqlalchemy import func, select
+    from app.db.database import SessionLocal
+    from app.models.client import Client
+    from benchmarks.seed import seed
+
+    db = SessionLocal()
+    try:
+        existing = db.scalar(select(func.count(Client.id)))
+        if existing < num_clients:
+            seed(db, num_clients - existing)
+    finally:
+        db.close()
+
+
+def blocking_app():
+    """
+    기준선 앱: 비동기 전환 전 핸들러와 같은 방식으로 ROUTES를 처리
+    동기 제너레이터 의존성으로 Session을 열고, async def 핸들러에서 사용자/목록을 동기 조회 (이벤트 루프를 막음)
+    """
+    from fastapi import Depends, FastAPI, HTTPException
+    from fastapi.security import OAuth2PasswordBearer
+    from sqlalchemy.orm import Session, joinedload
+    from app.core.security import decode_access_token
+    from app.db.database import SessionLocal
+    from app.models.client import Client
+    from app.models.consultation import Consultation
+    from app.models.user import User
+
+    app = FastAPI()
+    oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+        payload = decode_access_token(token) or {}
+        user = db.query(User).filter(User.id == int(payload.get("sub") or 0)).first()
+        if user is None:
+            raise HTTPException(status_code=401)
+        return user
+
+    def columns(row) -> dict:
+        return {column.key: getattr(row, column.key) for column in row.__table__.columns}
+
+    @app.get("/api/clients/")
+    async def get_clients(limit: int = 100, search: Optional[str] = None, db: Session = Depends(get_db),
+                          current_user=Depends(get_current_user)):
+        query = db.query(Client)
+        if search:
+            query = query.filter(Client.name.contains(search))
+        return [columns(client) for client in query.limit(limit).all()]
+
+    @app.get("/api/consultations/")
+    async def get_consultations(limit: int = 100, db: Session = Depends(get_db),
+                                current_user=Depends(get_current_user)):
+        consultations = db.query(Consultation).options(
+            joinedload(Consultation.client), joinedload(Consultation.salesperson)
+        ).limit(limit).all()
+        return [
+            {**columns(row), "client": columns(row.client), "salesperson": {"full_name": row.salesperson.full_name}}
+            for row in consultations
+        ]
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    return app
+
+
+async def run(num_clients: int, requests_per_client: int, mode: str = "async") -> dict:
+    import httpx
+    from sqlalchemy import select
+    from app.core.security import create_access_token
+    from app.db.database import SessionLocal
+    from app.models.user import User
+
+    if mode == "blocking":
+        app = blocking_app()
+    else:
+        from app.main import app
+
+    # 로그인은 측정 대상이 아니므로 두 방식 모두 관리자 토큰을 직접 발급
+    with SessionLocal() as db:
+        admin_id = db.scalar(select(User.id).where(User.username == "admin"))
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin_id)})}"}
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        latencies = {name: [] for name, _, _ in ROUTES}
+        errors = {name: 0 for name, _, _ in ROUTES}
+
+        async def worker(worker_id: int):
+            for i in range(requests_per_client):
+                name, path, params = ROUTES[(worker_id + i) % len(ROUTES)]
+                started = time.perf_counter()
+                response = await client.get(path, params=params, headers=headers)
+                elapsed = (time.perf_counter() - started) * 1000
+                if response.status_code != 200:
+                    errors[name] += 1
+                latencies[name].append(elapsed)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(num_clients)))
+        total_seconds = time.perf_counter() - started
+
+    report = {
+        "mode": mode,
+        "clients": num_clients,
+        "requests": sum(len(v) for v in latencies.values()),
+        "seconds": round(total_seconds, 3),
+        "throughput_rps": round(sum(len(v) for v in latencies.values()) / total_seconds, 1),
+        "routes": {},
+    }
+    for name, values in latencies.items():
+        report["routes"][name] = {**summarize(values), "errors": errors[name]}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 접속 지연시간 벤치마크")
+    parser.add_argument("--clients", type=int, default=200, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=5, help="클라이언트당 요청 수")
+    parser.add_argument("--rows", type=int, default=5000, help="생성할 거래처 수")
+    parser.add_argument("--db", default=None, help="사용할 SQLite 파일 (기본: 임시 파일)")
+    parser.add_argument("--mode", choices=MODES, default="async",
+                        help="async: 현재 API, blocking: 비동기 전환 전 방식의 기준선")
+    parser.add_argument("--pool-timeout", type=int, default=None,
+                        help="DB_POOL_TIMEOUT (blocking 모드에서 연결 대기로 멈출 때 실패까지의 시간)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    if args.pool_timeout is not None:
+        os.environ["DB_POOL_TIMEOUT"] = str(args.pool_timeout)
+    use_database(args.db)
+    seed_clients(args.rows)
+
+    from app.core.config import settings
+
+    result = asyncio.run(run(args.clients, args.requests, args.mode))
+    report = {
+        **run_metadata(
+            clients=args.clients, requests=args.requests, rows=args.rows, mode=args.mode,
+            pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        ),
+        **result,
+    }
+    write_report(report, args.output)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare_reports(json.load(f), report), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+견적 → 계약 전환 벤치마크
+항목이 많은 견적(기본 200개)을 계약으로 만드는 두 가지 방식의 지연시간과 SQL 문 수를 비교합니다.
+- client: GET /api/quotations/{id} 후 항목을 다시 담아 POST /api/contracts/ (관리자 웹의 기존 방식)
+- convert: POST /api/quotations/{id}/convert (계약 항목을 INSERT ... SELECT 한 번으로 복사)
+--db를 주면 그 DB를 임시 파일로 복사해 측정하므로 원본 DB는 바뀌지 않습니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.convert --db bench.db --lines 200 --repeat 30
+"""
+import argparse
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+
+from benchmarks.database import use_database
+from benchmarks.report import run_metadata, summarize, write_report
+
+
+def copy_database(source: str, target: str):
+    """SQLite 백업 API로 복사 (WAL에만 있는 변경분 포함)"""
+    with sqlite3.connect(source) as src, sqlite3.connect(target) as dst:
+        src.backup(dst)
+
+
+async def prepare(client, headers: dict, lines: int, count: int) -> list:
+    """측정용 견적 count건 등록 (거래처/품목이 부족하면 함께 등록)"""
+    clients = (await client.get("/api/clients/", params={"limit": 1}, headers=headers)).json()
+    if not clients:
+        clients = [(await client.post(
+            "/api/clients/", json={"name": "벤치마크 거래처", "client_type": "company"}, headers=headers
+        )).json()]
+    items = (await client.get("/api/items/", params={"limit": lines}, headers=headers)).json()
+    for index in range(len(items), lines):
+        items.append((await client.post("/api/items/", json={
+            "code": f"BENCH-CONVERT-{index:04d}", "name": f"벤치마크 품목 {index}", "unit_price": "10000",
+        }, headers=headers)).json())
+
+    stamp = int(time.time())
+    quotation_ids = []
+    for number in range(count):
+        response = await client.post("/api/quotations/", json={
+            "quotation_number": f"BQC{stamp}-{number:04d}",
+            "client_id": clients[0]["id"],
+            "status": "approved",
+            "items": [
+                {"item_id": item["id"], "quantity": index % 5 + 1, "unit_price": str(item["unit_price"])}
+                for index, item in enumerate(items[:lines])
+            ],
+        }, headers=headers)
+        quotation_ids.append(response.json()["id"])
+    return quotation_ids
+
+
+async def client_copy(client, headers: dict, quotation_id: int, contract_number: str):
+    """기존 방식: 견적 조회 후 항목을 담아 계약 등록"""
+    quotation = (await client.get(f"/api/quotations/{quotation_id}", headers=headers)).json()
+    response = await client.post("/api/contracts/", json={
+        "contract_number": contract_number,
+        "client_id": quotation["client_id"],
+        "quotation_id": quotation_id,
+        "status": "draft",
+        "contract_date": time.strftime("%Y-%m-%d"),
+        "items": [
+            {key: line[key] for key in ("item_id", "quantity", "unit_price", "notes")}
+            for line in quotation["items"]
+        ],
+    }, headers=headers)
+    assert response.status_code == 200, response.text
+
+
+async def server_convert(client, headers: dict, quotation_id: int, contract_number: str):
+    """POST /api/quotations/{id}/convert"""
+    response = await client.post(
+        f"/api/quotations/{quotation_id}/convert", json={"contract_number": contract_number}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+
+
+async def run(lines: int, repeat: int) -> dict:
+    import httpx
+    from sqlalchemy import event
+    from app.db.database import async_engine
+    from app.main import app
+
+    statements = [0]
+
+    def count_statement(*args):
+        statements[0] += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        response = await client.post("/api/auth/login", data={"username": "admin", "password": "admin123"})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        quotation_ids = await prepare(client, headers, lines, 2 * (repeat + 1))
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+        routes = {}
+        for name, flow in (("client", client_copy), ("convert", server_convert)):
+            latencies = []
+            statements[0] = 0
+            for attempt in range(repeat + 1):
+                quotation_id = quotation_ids.pop()
+                started = time.perf_counter()
+                await flow(client, headers, quotation_id, f"BKC-{name}-{quotation_id}")
+                if attempt:  # 첫 회는 워밍업
+                    latencies.append((time.perf_counter() - started) * 1000)
+            routes[name] = {**summarize(latencies), "statements_per_contract": round(statements[0] / (repeat + 1), 1)}
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    return {**run_metadata(lines=lines, repeat=repeat), "routes": routes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="견적 → 계약 전환 벤치마크")
+    parser.add_argument("--db", default=None, help="복사해서 사용할 SQLite 파일 (기본: 빈 임시 DB)")
+    parser.add_argument("--lines", type=int, default=200, help="견적 항목 수")
+    parser.add_argument("--repeat", type=int, default=30, help="방식별 반복 횟수")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="nexo_bench_"), "bench.db")
+    if args.db:
+        copy_database(args.db, db_path)
+    use_database(db_path)
+    report = asyncio.run(run(args.lines, args.repeat))
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+벤치마크 DB 준비 공용 함수
+앱 설정(DATABASE_URL 등)은 app 모듈을 처음 import할 때 읽히므로 각 스크립트는 app을 import하기 전에 호출합니다.
+"""
+from typing import Optional
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_database(db_path: Optional[str] = None, prepare: bool = True) -> str:
+    """
+    벤치마크가 사용할 SQLite 파일 지정 (없으면 임시 파일) 후 backend를 import 경로에 추가
+    prepare: 스키마 생성/마이그레이션과 관리자 계정 생성 (app.main을 import하지 않고 직접 실행)
+    반환값: DB 파일 경로
+    """
+    db_path = db_path or os.path.join(tempfile.mkdtemp(prefix="nexo_bench_"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+
+    if prepare:
+        from app.db.init_db import init_db
+        from app.db.migrate import upgrade_database
+
+        upgrade_database()  # 스키마 생성/마이그레이션
+        init_db()  # 관리자 계정 생성
+    return db_path
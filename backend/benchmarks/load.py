@@ -0,0 +1,183 @@
+"""
+트래픽 혼합 부하 테스트
+ASGI 앱을 프로세스 안에서 직접 호출해 모바일 앱(영업자/기사)과 관리자 웹의
+요청 비율을 재현하고, 경로별 지연시간(p50/p95/p99)과 처리량을 JSON으로 출력합니다.
+--output으로 결과를 저장하고 --compare로 이전 커밋의 결과와 비교할 수 있습니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.seed --db bench.db --clients 20000
+    python -m benchmarks.load --db bench.db --users 100 --duration 30 --output after.json --compare before.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from benchmarks.database import use_database
+from benchmarks.report import compare_reports, run_metadata, summarize, write_report
+from benchmarks.seed import BENCH_PASSWORD
+
+# (가중치, 경로 이름, 메서드, 경로 생성 함수)
+# 경로 생성 함수는 (rng, ids) -> (path, params, json_body)
+MOBILE_SALES_MIX = [
+    (30, "GET /api/consultations/", "GET", lambda rng, ids: ("/api/consultations/", {"limit": 20}, None)),
+    (25, "GET /api/clients/?search", "GET", lambda rng, ids: ("/api/clients/", {"search": rng.choice(ids["terms"]), "limit": 20}, None)),
+    (15, "GET /api/clients/{id}", "GET", lambda rng, ids: (f"/api/clients/{rng.choice(ids['clients'])}", {}, None)),
+    (10, "GET /api/quotations/", "GET", lambda rng, ids: ("/api/quotations/", {"limit": 20, "include_items": "false"}, None)),
+    (10, "POST /api/consultations/", "POST", lambda rng, ids: ("/api/consultations/", {}, {
+        "client_id": rng.choice(ids["clients"]),
+        "consultation_date": "2026-01-01T10:00:00",
+        "content": "부하 테스트 상담 기록",
+    })),
+    (10, "GET /api/auth/me", "GET", lambda rng, ids: ("/api/auth/me", {}, None)),
+]
+MOBILE_TECHNICIAN_MIX = [
+    (50, "GET /api/installations/", "GET", lambda rng, ids: ("/api/installations/", {"limit": 20}, None)),
+    (25, "GET /api/installations/{id}", "GET", lambda rng, ids: (f"/api/installations/{rng.choice(ids['installations'])}", {}, None)),
+    (15, "GET /api/clients/{id}", "GET", lambda rng, ids: (f"/api/clients/{rng.choice(ids['clients'])}", {}, None)),
+    (10, "GET /api/auth/me", "GET", lambda rng, ids: ("/api/auth/me", {}, None)),
+]
+ADMIN_MIX = [
+    (20, "GET /api/dashboard/summary", "GET", lambda rng, ids: ("/api/dashboard/summary", {}, None)),
+    (15, "GET /api/clients/", "GET", lambda rng, ids: ("/api/clients/", {"limit": 50}, None)),
+    (10, "GET /api/clients/?search", "GET", lambda rng, ids: ("/api/clients/", {"search": rng.choice(ids["terms"]), "limit": 50}, None)),
+    (15, "GET /api/quotations/", "GET", lambda rng, ids: ("/api/quotations/", {"limit": 50}, None)),
+    (10, "GET /api/quotations/{id}", "GET", lambda rng, ids: (f"/api/quotations/{rng.choice(ids['quotations'])}", {}, None)),
+    (15, "GET /api/contracts/", "GET", lambda rng, ids: ("/api/contracts/", {"limit": 50}, None)),
+    (5, "GET /api/inventory/", "GET", lambda rng, ids: ("/api/inventory/", {"limit": 100}, None)),
+    (5, "GET /api/items/", "GET", lambda rng, ids: ("/api/items/", {"limit": 100}, None)),
+    (5, "GET /api/installations/", "GET", lambda rng, ids: ("/api/installations/", {"limit": 50}, None)),
+]
+# 가상 사용자 구성 비율 (영업자, 기사, 관리자)
+PROFILES = {
+    "mixed": (0.55, 0.30, 0.15),
+    "mobile": (0.65, 0.35, 0.0),
+    "admin": (0.0, 0.0, 1.0),
+}
+SEARCH_TERMS = ["상사", "산업", "한빛", "강남", "테크", "김", "서울", "에너지", "대한", "수원"]
+
+
+def load_ids(sample_size: int = 2000) -> dict:
+    """요청에 사용할 실제 ID 표본과 벤치마크 계정 조회"""
+    from sqlalchemy import func, select
+    from app.db.database import SessionLocal
+    from app.models.client import Client
+    from app.models.installation import Installation
+    from app.models.quotation import Quotation
+    from app.models.user import User
+
+    db = SessionLocal()
+    try:
+        def sample(column):
+            return list(db.scalars(select(column).order_by(func.random()).limit(sample_size)))
+
+        ids = {
+            "clients": sample(Client.id),
+            "quotations": sample(Quotation.id),
+            "installations": sample(Installation.id),
+            "sales": list(db.scalars(select(User.username).where(User.username.like("bench_sales%")))),
+            "technicians": list(db.scalars(select(User.username).where(User.username.like("bench_tech%")))),
+            "terms": SEARCH_TERMS,
+        }
+    finally:
+        db.close()
+    missing = [name for name in ("clients", "quotations", "installations", "sales", "technicians") if not ids[name]]
+    if missing:
+        raise SystemExit(f"데이터가 없습니다 ({', '.join(missing)}). 먼저 python -m benchmarks.seed 를 실행하세요.")
+    return ids
+
+
+async def run(users: int, duration: float, max_requests: int, profile: str, seed_value: int) -> dict:
+    import httpx
+    from app.main import app
+
+    ids = load_ids()
+    rng = random.Random(seed_value)
+    sales_share, technician_share, _ = PROFILES[profile]
+    latencies = {}
+    statuses = {}
+    issued = [0]
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def login(username: str, password: str) -> dict:
+            response = await client.post("/api/auth/login", data={"username": username, "password": password})
+            response.raise_for_status()
+            return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        # 가상 사용자마다 역할과 계정 배정 (같은 계정을 여러 단말이 공유할 수 있음)
+        sessions = []
+        tokens = {}
+        for index in range(users):
+            roll = rng.random()
+            if roll < sales_share:
+                username, password, mix = ids["sales"][index % len(ids["sales"])], BENCH_PASSWORD, MOBILE_SALES_MIX
+            elif roll < sales_share + technician_share:
+                username, password, mix = ids["technicians"][index % len(ids["technicians"])], BENCH_PASSWORD, MOBILE_TECHNICIAN_MIX
+            else:
+                username, password, mix = "admin", "admin123", ADMIN_MIX
+            if username not in tokens:
+                tokens[username] = await login(username, password)
+            sessions.append((tokens[username], mix, random.Random(seed_value + index)))
+
+        deadline = time.perf_counter() + duration
+
+        async def virtual_user(headers: dict, mix, user_rng: random.Random):
+            weights = [weight for weight, _, _, _ in mix]
+            while time.perf_counter() < deadline and (not max_requests or issued[0] < max_requests):
+                issued[0] += 1
+                _, name, method, build = user_rng.choices(mix, weights=weights)[0]
+                path, params, body = build(user_rng, ids)
+                started = time.perf_counter()
+                response = await client.request(method, path, params=params, json=body, headers=headers)
+                latencies.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+                route_statuses = statuses.setdefault(name, {})
+                route_statuses[response.status_code] = route_statuses.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(virtual_user(*session) for session in sessions))
+        total_seconds = time.perf_counter() - started
+
+    total = sum(len(values) for values in latencies.values())
+    report = {
+        **run_metadata(users=users, duration=duration, max_requests=max_requests, profile=profile, seed=seed_value),
+        "requests": total,
+        "seconds": round(total_seconds, 3),
+        "throughput_rps": round(total / total_seconds, 1) if total_seconds else 0.0,
+        "routes": {},
+    }
+    for name in sorted(latencies):
+        route_statuses = statuses[name]
+        report["routes"][name] = {
+            **summarize(latencies[name]),
+            "errors": sum(count for code, count in route_statuses.items() if code >= 400),
+            "statuses": {str(code): count for code, count in sorted(route_statuses.items())},
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트래픽 혼합 부하 테스트")
+    parser.add_argument("--db", required=True, help="benchmarks.seed로 생성한 SQLite 파일")
+    parser.add_argument("--users", type=int, default=50, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간 (초)")
+    parser.add_argument("--requests", type=int, default=0, help="최대 요청 수 (0이면 시간으로만 제한)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mixed", help="트래픽 구성")
+    parser.add_argument("--seed", type=int, default=7, help="난수 시드")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    use_database(args.db, prepare=False)
+
+    report = asyncio.run(run(args.users, args.duration, args.requests, args.profile, args.seed))
+    write_report(report, args.output)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare_reports(json.load(f), report), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+로그인 처리량 벤치마크
+동시 로그인 요청을 단일 워커(ASGI 앱 직접 호출)에 보내 초당 로그인 수와
+그 동안의 /health 지연시간을 측정합니다.
+bcrypt가 이벤트 루프에서 돌면 로그인이 몰리는 동안 /health도 함께 멈춥니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.login --concurrency 50 --logins 200 --rounds 12
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from benchmarks.database import use_database
+from benchmarks.report import summarize
+
+
+async def run(concurrency: int, total_logins: int) -> dict:
+    import httpx
+    from app.main import app
+    from app.core.password_pool import password_pool
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        login_latencies = []
+        health_latencies = []
+        statuses = {}
+        remaining = [total_logins]
+        done = asyncio.Event()
+
+        async def login_worker():
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                started = time.perf_counter()
+                response = await client.post(
+                    "/api/auth/login", data={"username": "admin", "password": "admin123"}
+                )
+                login_latencies.append((time.perf_counter() - started) * 1000)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        async def health_probe():
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe = asyncio.create_task(health_probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        total_seconds = time.perf_counter() - started
+        done.set()
+        await probe
+
+    successful = statuses.get(200, 0)
+    return {
+        "concurrency": concurrency,
+        "logins": total_logins,
+        "hash_workers": password_pool.max_workers,
+        "seconds": round(total_seconds, 3),
+        "logins_per_second": round(successful / total_seconds, 2),
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        "login": summarize(login_latencies),
+        "health": summarize(health_latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 처리량 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 로그인 클라이언트 수")
+    parser.add_argument("--logins", type=int, default=200, help="전체 로그인 요청 수")
+    parser.add_argument("--rounds", type=int, default=None, help="BCRYPT_ROUNDS (기본: 설정값)")
+    parser.add_argument("--workers", type=int, default=None, help="PASSWORD_HASH_WORKERS (기본: 설정값)")
+    parser.add_argument("--db", default=None, help="사용할 SQLite 파일 (기본: 임시 파일)")
+    args = parser.parse_args()
+
+    if args.rounds is not None:
+        os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    if args.workers is not None:
+        os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    use_database(args.db)
+    report = asyncio.run(run(args.concurrency, args.logins))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+목록/대시보드 SQL 실행 시간 측정
+API 목록 조회와 대시보드가 실행하는 것과 같은 조건(영업자/기사 범위, 상태, 날짜)의
+SQL을 DB에 직접 반복 실행해 쿼리별 p50/p95/p99와 실행 계획을 출력합니다.
+--revision으로 측정 전에 스키마 리비전을 맞출 수 있어
+같은 데이터로 인덱스 마이그레이션 전후를 비교할 수 있습니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.queries --db bench.db --revision 0001 --output before.json
+    python -m benchmarks.queries --db bench.db --revision head --output after.json --compare before.json
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+
+from benchmarks.database import use_database
+from benchmarks.report import compare_reports, run_metadata, summarize, write_report
+
+PAGE_SIZE = 20
+
+
+def busiest_user(db, column):
+    """가장 많은 행을 담당한 사용자 ID (영업자/기사 목록의 최악 조건)"""
+    from sqlalchemy import func, select
+
+    return db.execute(
+        select(column, func.count()).group_by(column).order_by(func.count().desc()).limit(1)
+    ).scalar()
+
+
+def middle_cursor(db, model, condition) -> tuple:
+    """조건에 맞는 행 중 가운데 행의 (created_at, id) - 커서 페이지 측정용"""
+    from sqlalchemy import func, select
+
+    total = db.scalar(select(func.count(model.id)).where(condition))
+    row = db.execute(
+        select(model.created_at, model.id).where(condition)
+        .order_by(model.created_at, model.id).offset(total // 2).limit(1)
+    ).first()
+    return tuple(row) if row else (datetime.min, 0)
+
+
+def build_queries(db) -> dict:
+    """측정할 쿼리 (이름 -> SELECT 구문)"""
+    from sqlalchemy import func, select, tuple_
+    from app.models.consultation import Consultation
+    from app.models.contract import Contract, ContractItem
+    from app.models.installation import Installation, InstallationStatus
+    from app.models.quotation import Quotation, QuotationItem
+
+    sales_id = busiest_user(db, Consultation.salesperson_id)
+    technician_id = busiest_user(db, Installation.technician_id)
+
+    def page(model, condition):
+        return select(model).where(condition).order_by(model.created_at, model.id).limit(PAGE_SIZE + 1)
+
+    def cursor_page(model, condition):
+        created_at, last_id = middle_cursor(db, model, condition)
+        return page(model, condition).where(tuple_(model.created_at, model.id) > tuple_(created_at, last_id))
+
+    own_consultations = Consultation.salesperson_id == sales_id
+    own_quotations = Quotation.salesperson_id == sales_id
+    own_contracts = Contract.salesperson_id == sales_id
+    own_installations = Installation.technician_id == technician_id
+    pending = Installation.status == InstallationStatus.PENDING
+
+    # 대시보드 "오늘"은 데이터가 있는 가장 최근 상담 날짜로 맞춤
+    latest = db.scalar(select(func.max(Consultation.consultation_date))) or datetime.now()
+    day_start = datetime.combine(latest.date(), datetime.min.time())
+    day_end = day_start + timedelta(days=1)
+    today = (Consultation.consultation_date >= day_start) & (Consultation.consultation_date < day_end)
+
+    quotation_ids = list(db.scalars(select(Quotation.id).where(own_quotations).limit(PAGE_SIZE)))
+    contract_ids = list(db.scalars(select(Contract.id).where(own_contracts).limit(PAGE_SIZE)))
+
+    return {
+        "consultations sales page": page(Consultation, own_consultations),
+        "consultations sales cursor": cursor_page(Consultation, own_consultations),
+        "consultations sales total": select(func.count(Consultation.id)).where(own_consultations),
+        "quotations sales page": page(Quotation, own_quotations),
+        "quotations sales cursor": cursor_page(Quotation, own_quotations),
+        "contracts sales page": page(Contract, own_contracts),
+        "contracts sales cursor": cursor_page(Contract, own_contracts),
+        "installations tech page": page(Installation, own_installations),
+        "installations tech pending": page(Installation, own_installations & pending),
+        "installations pending page": page(Installation, pending),
+        "quotation_items IN": select(QuotationItem).where(QuotationItem.quotation_id.in_(quotation_ids)),
+        "contract_items IN": select(ContractItem).where(ContractItem.contract_id.in_(contract_ids)),
+        "dash today consults": select(func.count(Consultation.id)).where(today),
+        "dash today consults sales": select(func.count(Consultation.id)).where(today, own_consultations),
+        "dash contracts by status": select(Contract.status, func.count(Contract.id)).group_by(Contract.status),
+        "dash contracts status sales": (
+            select(Contract.status, func.count(Contract.id)).where(own_contracts).group_by(Contract.status)
+        ),
+        "dash pending installs": select(func.count(Installation.id)).where(pending),
+        "dash pending installs tech": select(func.count(Installation.id)).where(pending, own_installations),
+        "installations scheduled": (
+            select(Installation).where(Installation.scheduled_date >= date.today()).limit(PAGE_SIZE)
+        ),
+    }, {"salesperson_id": sales_id, "technician_id": technician_id, "dashboard_day": day_start.date().isoformat()}
+
+
+def explain(connection, statement) -> list:
+    """실행 계획 (SQLite: EXPLAIN QUERY PLAN)"""
+    if connection.dialect.name != "sqlite":
+        return []
+    captured = []
+
+    def capture(conn, cursor, sql, parameters, context, executemany):
+        captured.append((sql, parameters))
+
+    # 드라이버에 실제로 전달되는 SQL/파라미터로 실행 계획 조회
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        connection.execute(statement).fetchall()
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    sql, parameters = captured[-1]
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+def run(repeat: int) -> dict:
+    from app.db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        queries, context = build_queries(db)
+        connection = db.connection()
+        report = {"params": context, "routes": {}}
+        for name, statement in queries.items():
+            connection.execute(statement).fetchall()  # 캐시 워밍업
+            latencies = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                connection.execute(statement).fetchall()
+                latencies.append((time.perf_counter() - started) * 1000)
+            report["routes"][name] = {**summarize(latencies), "plan": explain(connection, statement)}
+    finally:
+        db.close()
+    return report
+
+
+def set_revision(revision: str):
+    """측정 전에 스키마를 지정한 리비전으로 업/다운그레이드"""
+    from alembic import command
+    from app.db.database import engine
+    from app.db.migrate import alembic_config, current_revision, upgrade_database
+
+    upgrade_database()
+    if revision == "head":
+        return
+    with engine.begin() as connection:
+        if current_revision(connection) != revision:
+            command.downgrade(alembic_config(connection), revision)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록/대시보드 SQL 실행 시간 측정")
+    parser.add_argument("--db", required=True, help="benchmarks.seed로 생성한 SQLite 파일")
+    parser.add_argument("--repeat", type=int, default=200, help="쿼리별 반복 횟수")
+    parser.add_argument("--revision", default=None, help="측정 전 맞출 스키마 리비전 (예: 0001, head)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    use_database(args.db, prepare=False)
+
+    if args.revision:
+        set_revision(args.revision)
+    result = run(args.repeat)
+    report = {
+        **run_metadata(repeat=args.repeat, revision=args.revision, **result.pop("params")),
+        **result,
+    }
+    write_report(report, args.output)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare_reports(json.load(f), report), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+벤치마크 결과 집계/비교 공용 함수
+"""
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import platform
+import shlex
+import sqlite3
+import statistics
+import subprocess
+import sys
+
+
+def percentile(values, pct):
+    """정렬된 값 목록의 백분위수"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def summarize(values) -> dict:
+    """지연시간 목록 요약 (ms)"""
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean_ms": round(statistics.mean(values), 2) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+    }
+
+
+def git_revision() -> str:
+    """현재 커밋 해시 (git 저장소가 아니면 빈 문자열)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def command_line() -> str:
+    """결과를 다시 만들 수 있는 실행 명령 (python -m benchmarks.<스크립트> ...)"""
+    script = Path(sys.argv[0]).stem
+    return shlex.join(["python", "-m", f"benchmarks.{script}", *sys.argv[1:]])
+
+
+def run_metadata(**params) -> dict:
+    """실행 명령과 환경 정보 (커밋 간 비교, 재현용)"""
+    return {
+        "revision": git_revision(),
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "command": command_line(),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "params": params,
+    }
+
+
+def write_report(report: dict, output: str = None):
+    """결과를 JSON으로 출력 (output 지정 시 파일에도 저장)"""
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+def compare_reports(baseline: dict, current: dict) -> str:
+    """두 결과의 경로별 p50/p95/p99 및 처리량 변화 표"""
+    lines = [f"{'route':<28}{'p50':>20}{'p95':>20}{'p99':>20}"]
+    for route, stats in current.get("routes", {}).items():
+        base = baseline.get("routes", {}).get(route)
+        if not base:
+            continue
+        cells = []
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            before, after = base[key], stats[key]
+            change = (after - before) / before * 100 if before else 0.0
+            cells.append(f"{before:>7.1f}→{after:<7.1f}{change:+5.0f}%")
+        lines.append(f"{route:<28}" + "".join(f"{cell:>20}" for cell in cells))
+    if "throughput_rps" in current:
+        before_rps = baseline.get("throughput_rps", 0)
+        after_rps = current.get("throughput_rps", 0)
+        lines.append(f"throughput_rps: {before_rps} → {after_rps}")
+    return "\n".join(lines)
@@ -0,0 +1,386 @@
+"""
+대량 테스트 데이터 생성기
+운영 규모의 거래처/상담/견적/계약(항목 포함)/설치·AS/품목/재고 데이터를
+한글 이름과 주소로 생성해 일괄 INSERT 합니다. 같은 --seed 값이면 같은 데이터가 생성됩니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.seed --db bench.db --clients 20000
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+import argparse
+import random
+import sys
+import time
+
+from benchmarks.database import use_database
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍전고문손양배백허유남심노하곽성차주우구민진나지엄원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용"
+GIVEN_SYLLABLES = "민서준지현우예도하윤수진영은성재경혜동희승주연태호정유석원상미아나선다소채건시한규인철"
+COMPANY_PREFIXES = [
+    "한빛", "대한", "동양", "서울", "미래", "새한", "대성", "삼진", "우리", "한국", "신성", "태양",
+    "청솔", "푸른", "금강", "백두", "한결", "다온", "나라", "세종", "광명", "늘봄", "하나", "누리",
+]
+COMPANY_SUFFIXES = ["상사", "산업", "물산", "테크", "건설", "에너지", "정밀", "화학", "모터스", "유통", "솔루션", "엔지니어링"]
+INSTITUTIONS = ["시청", "구청", "공단", "연구원", "대학교", "병원", "교육청", "공사"]
+CITIES = {
+    "서울특별시": ["강남구", "서초구", "송파구", "마포구", "영등포구", "성동구", "종로구", "중구", "강서구", "노원구"],
+    "부산광역시": ["해운대구", "부산진구", "동래구", "남구", "사하구"],
+    "인천광역시": ["연수구", "남동구", "부평구", "서구"],
+    "대전광역시": ["유성구", "서구", "중구"],
+    "광주광역시": ["북구", "서구", "광산구"],
+    "울산광역시": ["남구", "울주군", "북구"],
+    "경기도": ["수원시 영통구", "성남시 분당구", "고양시 일산동구", "용인시 수지구", "화성시", "평택시"],
+    "충청남도": ["천안시 서북구", "아산시", "당진시"],
+    "경상남도": ["창원시 성산구", "김해시", "양산시"],
+}
+ROADS = ["테헤란로", "중앙대로", "세종대로", "한강대로", "산업로", "공단로", "과학로", "번영로", "시청로", "대학로"]
+ITEM_CATEGORIES = [
+    ("수소충전기", "대", 35000000, 120000000),
+    ("수소탱크", "개", 2500000, 9000000),
+    ("압축기", "대", 8000000, 30000000),
+    ("밸브", "개", 50000, 800000),
+    ("압력센서", "개", 80000, 600000),
+    ("필터", "개", 20000, 250000),
+    ("배관자재", "m", 10000, 90000),
+    ("디스펜서 노즐", "개", 300000, 2500000),
+    ("제어보드", "개", 400000, 3000000),
+    ("점검 서비스", "회", 100000, 1500000),
+]
+CONSULTATION_TEMPLATES = [
+    "{company} 담당자와 수소충전 설비 도입 상담",
+    "기존 설비 교체 관련 견적 요청",
+    "설치 일정 및 현장 여건 협의",
+    "AS 접수: 디스펜서 압력 저하 현상",
+    "정기 점검 계약 갱신 상담",
+    "보조금 신청 절차 안내",
+    "추가 충전기 증설 검토 요청",
+]
+INSTALLATION_RESULTS = ["정상 설치 완료", "배관 누설 점검 후 조치 완료", "센서 교체 완료", "부품 입고 대기", "현장 재방문 필요"]
+BENCH_PASSWORD = "bench1234"
+
+
+class KoreanFaker:
+    """한글 이름/회사명/주소 생성기"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def person(self) -> str:
+        given = "".join(self.rng.choice(GIVEN_SYLLABLES) for _ in range(2))
+        return self.rng.choice(SURNAMES) + given
+
+    def company(self) -> str:
+        return self.rng.choice(COMPANY_PREFIXES) + self.rng.choice(COMPANY_SUFFIXES)
+
+    def institution(self) -> str:
+        city = self.rng.choice(list(CITIES))
+        return city[:2] + self.rng.choice(INSTITUTIONS)
+
+    def address(self) -> str:
+        city = self.rng.choice(list(CITIES))
+        district = self.rng.choice(CITIES[city])
+        return f"{city} {district} {self.rng.choice(ROADS)} {self.rng.randint(1, 999)}"
+
+    def phone(self) -> str:
+        return f"010-{self.rng.randint(1000, 9999)}-{self.rng.randint(1000, 9999)}"
+
+    def business_number(self) -> str:
+        return f"{self.rng.randint(100, 999)}-{self.rng.randint(10, 99)}-{self.rng.randint(10000, 99999)}"
+
+    def moment(self, days: int = 365) -> datetime:
+        return datetime.utcnow() - timedelta(seconds=self.rng.randint(0, days * 86400))
+
+    def after(self, moment: datetime, low: int, high: int) -> datetime:
+        """moment로부터 low~high일 뒤 (등록/수정 시각이 미래가 되지 않도록 현재 시각까지)"""
+        return min(moment + timedelta(days=self.rng.randint(low, high)), datetime.utcnow())
+
+
+def _next_id(db, model) -> int:
+    from sqlalchemy import func, select
+    return (db.scalar(select(func.max(model.id))) or 0) + 1
+
+
+def _bulk_insert(db, model, rows):
+    from sqlalchemy import insert
+    if rows:
+        db.execute(insert(model), rows)
+
+
+def _seed_users(db, faker: KoreanFaker, sales: int, technicians: int):
+    """영업자/기사 계정 생성 (비밀번호: bench1234), 기존 벤치마크 계정은 재사용"""
+    from sqlalchemy import select
+    from app.core.security import get_password_hash
+    from app.models.user import User, UserRole
+
+    existing = {u.username: u.id for u in db.execute(select(User.username, User.id))}
+    hashed = get_password_hash(BENCH_PASSWORD)
+    rows = []
+    for role, prefix, count in ((UserRole.SALES, "sales", sales), (UserRole.TECHNICIAN, "tech", technicians)):
+        for i in range(1, count + 1):
+            username = f"bench_{prefix}{i:03d}"
+            if username in existing:
+                continue
+            rows.append({
+                "username": username,
+                "email": f"{username}@bench.nexo.local",
+                "hashed_password": hashed,
+                "full_name": faker.person(),
+                "phone": faker.phone(),
+                "role": role,
+                "is_active": True,
+                "is_admin": False,
+                "is_super_admin": False,
+            })
+    _bulk_insert(db, User, rows)
+    db.flush()
+    sales_ids = list(db.scalars(select(User.id).where(User.username.like("bench_sales%"))))
+    technician_ids = list(db.scalars(select(User.id).where(User.username.like("bench_tech%"))))
+    return sales_ids, technician_ids
+
+
+def _seed_items(db, faker: KoreanFaker, count: int):
+    """품목과 재고 생성 (일부는 최소 재고 미만)"""
+    from sqlalchemy import select
+    from app.models.item import Item
+    from app.models.inventory import Inventory
+
+    rng = faker.rng
+    existing = list(db.execute(select(Item.id, Item.unit_price)))
+    if len(existing) >= count:
+        return [(item_id, Decimal(price)) for item_id, price in existing]
+
+    next_id = _next_id(db, Item)
+    items, stock = [], []
+    for offset in range(count - len(existing)):
+        item_id = next_id + offset
+        category, unit, low, high = rng.choice(ITEM_CATEGORIES)
+        created_at = faker.moment(730)
+        items.append({
+            "id": item_id,
+            "code": f"BENCH-{item_id:05d}",
+            "name": f"{category} {rng.choice('ABCDEFGHJK')}{rng.randint(100, 999)}",
+            "description": f"{category} 표준 사양",
+            "unit_price": Decimal(rng.randrange(low, high, 1000)),
+            "unit": unit,
+            "is_active": rng.random() > 0.05,
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+        min_level = rng.randint(5, 50)
+        stock.append({
+            "item_id": item_id,
+            "quantity": rng.randint(0, min_level * 8),
+            "min_stock_level": min_level,
+            "location": f"{rng.choice(['본사', '평택', '창원'])} 창고 {rng.randint(1, 20)}-{rng.randint(1, 9)}",
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+    _bulk_insert(db, Item, items)
+    _bulk_insert(db, Inventory, stock)
+    return [(item_id, Decimal(price)) for item_id, price in existing] + [(i["id"], i["unit_price"]) for i in items]
+
+
+def _line_items(rng: random.Random, catalog, owner_key: str, owner_id: int):
+    """견적/계약 항목 1~5개와 합계"""
+    lines, total = [], Decimal(0)
+    for item_id, unit_price in rng.sample(catalog, k=min(len(catalog), rng.randint(1, 5))):
+        quantity = rng.randint(1, 10)
+        total_price = unit_price * quantity
+        total += total_price
+        lines.append({
+            owner_key: owner_id,
+            "item_id": item_id,
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "total_price": total_price,
+        })
+    return lines, total
+
+
+def seed(db, clients: int, seed_value: int = 42, batch_size: int = 1000, items: int = 300,
+         sales: int = None, technicians: int = None, progress: bool = False) -> dict:
+    """
+    거래처 clients건과 하위 데이터를 생성 (이미 있는 데이터에 추가)
+    거래처당 평균 상담 3건, 견적 1건(항목 1~5개), 견적의 40%는 계약, 계약마다 설치 1건(+AS 30%)
+    """
+    from app.db.client_search import SEARCH_FIELDS, text_grams
+    from app.models.client import Client, ClientSearchGram, ClientType
+    from app.models.consultation import Consultation
+    from app.models.quotation import Quotation, QuotationItem, QuotationStatus
+    from app.models.contract import Contract, ContractItem, ContractStatus
+    from app.models.installation import Installation, InstallationType, InstallationStatus
+
+    rng = random.Random(seed_value)
+    faker = KoreanFaker(rng)
+    sales_ids, technician_ids = _seed_users(
+        db, faker,
+        sales if sales is not None else max(5, clients // 400),
+        technicians if technicians is not None else max(3, clients // 800),
+    )
+    catalog = _seed_items(db, faker, items)
+    db.commit()
+
+    counts = {name: 0 for name in ("clients", "consultations", "quotations", "quotation_items",
+                                   "contracts", "contract_items", "installations")}
+    next_ids = {model: _next_id(db, model) for model in (Client, Consultation, Quotation, Contract)}
+    started = time.perf_counter()
+
+    for batch_start in range(0, clients, batch_size):
+        rows = {model: [] for model in (Client, ClientSearchGram, Consultation, Quotation, QuotationItem,
+                                        Contract, ContractItem, Installation)}
+        for _ in range(min(batch_size, clients - batch_start)):
+            client_id = next_ids[Client]
+            next_ids[Client] += 1
+            client_type = rng.choices(list(ClientType), weights=[2, 7, 1])[0]
+            created_at = faker.moment()
+            client = {
+                "id": client_id,
+                "client_type": client_type,
+                "address": faker.address(),
+                "notes": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+            if client_type == ClientType.INDIVIDUAL:
+                client.update(name=faker.person(), personal_phone=faker.phone())
+                client["personal_name"] = client["name"]
+            else:
+                company = faker.company() if client_type == ClientType.COMPANY else faker.institution()
+                client.update(
+                    name=company,
+                    company_name=company,
+                    representative_name=faker.person(),
+                    business_number=faker.business_number(),
+                    company_phone=faker.phone(),
+                )
+            rows[Client].append(client)
+            grams = set()
+            for field in SEARCH_FIELDS:
+                grams |= text_grams(client.get(field))
+            rows[ClientSearchGram].extend({"gram": gram, "client_id": client_id} for gram in grams)
+
+            consultation_ids = []
+            for _ in range(rng.choice((1, 2, 3, 3, 4, 5))):
+                consultation_id = next_ids[Consultation]
+                next_ids[Consultation] += 1
+                consultation_ids.append(consultation_id)
+                moment = faker.after(created_at, 0, 60)
+                rows[Consultation].append({
+                    "id": consultation_id,
+                    "client_id": client_id,
+                    "salesperson_id": rng.choice(sales_ids),
+                    "consultation_date": moment,
+                    "content": rng.choice(CONSULTATION_TEMPLATES).format(company=client["name"]),
+                    "created_at": moment,
+                    "updated_at": moment,
+                })
+
+            if rng.random() > 0.85:
+                continue
+            quotation_id = next_ids[Quotation]
+            next_ids[Quotation] += 1
+            salesperson_id = rng.choice(sales_ids)
+            quoted_at = faker.after(created_at, 1, 90)
+            lines, total = _line_items(rng, catalog, "quotation_id", quotation_id)
+            rows[QuotationItem].extend(lines)
+            is_contracted = rng.random() < 0.4
+            rows[Quotation].append({
+                "id": quotation_id,
+                "quotation_number": f"BQ{quoted_at:%Y%m%d}-{quotation_id:07d}",
+                "client_id": client_id,
+                "consultation_id": rng.choice(consultation_ids),
+                "salesperson_id": salesperson_id,
+                "status": QuotationStatus.APPROVED if is_contracted else rng.choice(list(QuotationStatus)),
+                "total_amount": total,
+                "valid_until": quoted_at + timedelta(days=30),
+                "created_at": quoted_at,
+                "updated_at": quoted_at,
+            })
+            if not is_contracted:
+                continue
+
+            contract_id = next_ids[Contract]
+            next_ids[Contract] += 1
+            contracted_at = faker.after(quoted_at, 1, 30)
+            status = rng.choices(list(ContractStatus), weights=[1, 3, 3, 6, 1])[0]
+            for line in lines:
+                contract_line = dict(line, contract_id=contract_id)
+                del contract_line["quotation_id"]
+                rows[ContractItem].append(contract_line)
+            rows[Contract].append({
+                "id": contract_id,
+                "contract_number": f"BC{contracted_at:%Y%m%d}-{contract_id:07d}",
+                "client_id": client_id,
+                "quotation_id": quotation_id,
+                "salesperson_id": salesperson_id,
+                "status": status,
+                "contract_date": contracted_at.date(),
+                "total_amount": total,
+                "created_at": contracted_at,
+                "updated_at": contracted_at,
+            })
+            visit_types = [InstallationType.INSTALLATION] + ([InstallationType.AS] if rng.random() < 0.3 else [])
+            for visit_type in visit_types:
+                scheduled = contracted_at + timedelta(days=rng.randint(3, 45))
+                visit_status = rng.choices(list(InstallationStatus), weights=[3, 2, 6, 1])[0]
+                done = visit_status == InstallationStatus.COMPLETED
+                rows[Installation].append({
+                    "contract_id": contract_id,
+                    "client_id": client_id,
+                    "technician_id": rng.choice(technician_ids),
+                    "installation_type": visit_type,
+                    "status": visit_status,
+                    "scheduled_date": scheduled.date(),
+                    "completed_date": scheduled if done else None,
+                    "result_text": rng.choice(INSTALLATION_RESULTS) if done else None,
+                    "created_at": contracted_at,
+                    "updated_at": min(scheduled, datetime.utcnow()) if done else contracted_at,
+                })
+
+        for model, model_rows in rows.items():
+            _bulk_insert(db, model, model_rows)
+        db.commit()
+
+        counts["clients"] += len(rows[Client])
+        counts["consultations"] += len(rows[Consultation])
+        counts["quotations"] += len(rows[Quotation])
+        counts["quotation_items"] += len(rows[QuotationItem])
+        counts["contracts"] += len(rows[Contract])
+        counts["contract_items"] += len(rows[ContractItem])
+        counts["installations"] += len(rows[Installation])
+        if progress:
+            print(f"  거래처 {counts['clients']:,}/{clients:,}건 생성", file=sys.stderr)
+
+    counts["items"] = len(catalog)
+    counts["sales"] = len(sales_ids)
+    counts["technicians"] = len(technician_ids)
+    counts["seconds"] = round(time.perf_counter() - started, 2)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대량 테스트 데이터 생성")
+    parser.add_argument("--db", required=True, help="대상 SQLite 파일")
+    parser.add_argument("--clients", type=int, default=10000, help="생성할 거래처 수")
+    parser.add_argument("--items", type=int, default=300, help="품목 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--batch-size", type=int, default=1000, help="INSERT 묶음 크기 (거래처 기준)")
+    args = parser.parse_args()
+
+    use_database(args.db)
+
+    from app.db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        counts = seed(db, args.clients, seed_value=args.seed, batch_size=args.batch_size,
+                      items=args.items, progress=True)
+    finally:
+        db.close()
+    for name, value in counts.items():
+        print(f"{name}: {value:,}" if isinstance(value, int) else f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
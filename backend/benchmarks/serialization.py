@@ -0,0 +1,120 @@
+"""
+응답 직렬화 벤치마크
+계약 목록(기본 1000건, 항목 포함)을 세 가지 방식으로 JSON 바이트로 만드는 시간을 비교합니다.
+- jsonable_encoder: dict 생성 → jsonable_encoder → json.dumps (response_model 없는 기존 목록 경로)
+- response_model: dict 생성 → pydantic 모델 검증 → JSON (response_model 있는 기존 상세 경로)
+- orjson: dict 생성 → orjson (app.core.responses.json_response 경로)
+--http를 주면 GET /api/contracts/?limit=N 전체 요청 지연시간도 측정합니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.serialization --db bench.db --rows 1000 --repeat 30 --http
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks.database import use_database
+from benchmarks.report import run_metadata, summarize, write_report
+
+
+def timed(function, repeat: int) -> dict:
+    """반복 실행 시간 요약 (ms)"""
+    function()  # 워밍업
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return summarize(latencies)
+
+
+async def load_contracts(rows: int) -> list:
+    """항목/거래처/영업자를 함께 로딩한 계약 목록"""
+    from sqlalchemy import select
+    from sqlalchemy.orm import joinedload, selectinload
+    from app.db.database import AsyncSessionLocal
+    from app.models.contract import Contract
+
+    async with AsyncSessionLocal() as db:
+        query = select(Contract).options(
+            joinedload(Contract.client), joinedload(Contract.salesperson), selectinload(Contract.items)
+        ).order_by(Contract.created_at, Contract.id).limit(rows)
+        return list((await db.scalars(query)).unique())
+
+
+def encode_routes(contracts: list, repeat: int) -> dict:
+    from typing import List
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import TypeAdapter
+    from app.api.contract import ContractResponse
+    from app.api.serializers import contract_to_dict
+    from app.core.responses import dumps
+
+    adapter = TypeAdapter(List[ContractResponse])
+
+    def legacy_encoder():
+        content = jsonable_encoder([contract_to_dict(contract) for contract in contracts])
+        # starlette JSONResponse.render와 같은 옵션
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+    def legacy_response_model():
+        value = adapter.validate_python([contract_to_dict(contract) for contract in contracts])
+        return adapter.dump_json(value)
+
+    def orjson_serializer():
+        return dumps([contract_to_dict(contract) for contract in contracts])
+
+    return {
+        "jsonable_encoder": {**timed(legacy_encoder, repeat), "bytes": len(legacy_encoder())},
+        "response_model": {**timed(legacy_response_model, repeat), "bytes": len(legacy_response_model())},
+        "orjson": {**timed(orjson_serializer, repeat), "bytes": len(orjson_serializer())},
+    }
+
+
+async def http_route(rows: int, repeat: int) -> dict:
+    """GET /api/contracts/?limit=rows 전체 요청 지연시간"""
+    import httpx
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/api/auth/login", data={"username": "admin", "password": "admin123"})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        params = {"limit": rows}
+        await client.get("/api/contracts/", params=params, headers=headers)
+        latencies = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = await client.get("/api/contracts/", params=params, headers=headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return {**summarize(latencies), "bytes": len(response.content)}
+
+
+async def run(rows: int, repeat: int, http: bool) -> dict:
+    contracts = await load_contracts(rows)
+    report = {
+        **run_metadata(rows=len(contracts), repeat=repeat),
+        "routes": encode_routes(contracts, repeat),
+    }
+    if http:
+        report["routes"]["GET /api/contracts/"] = await http_route(rows, repeat)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 벤치마크")
+    parser.add_argument("--db", required=True, help="benchmarks.seed로 생성한 SQLite 파일")
+    parser.add_argument("--rows", type=int, default=1000, help="계약 건수")
+    parser.add_argument("--repeat", type=int, default=30, help="반복 횟수")
+    parser.add_argument("--http", action="store_true", help="API 요청 지연시간도 측정")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    use_database(args.db)
+    report = asyncio.run(run(args.rows, args.repeat, args.http))
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Alembic 실행 환경
+접속 주소와 테이블 정의는 앱 설정(DATABASE_URL)과 모델(Base.metadata)을 그대로 사용합니다.
+app.db.migrate.upgrade_database()에서 호출할 때는 이미 열린 연결을 넘겨받습니다.
+"""
+from logging.config import fileConfig
+from alembic import context
+from app.db.database import engine, Base
+import app.models  # noqa: F401  모든 모델을 metadata에 등록
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def _configure(**kwargs):
+    context.configure(
+        target_metadata=target_metadata,
+        # SQLite는 ALTER TABLE 지원이 제한적이라 테이블 재생성 방식(batch)으로 변경
+        render_as_batch=True,
+        compare_type=True,
+        **kwargs
+    )
+
+
+def run_migrations_offline():
+    """SQL 스크립트만 출력 (alembic upgrade head --sql)"""
+    _configure(url=str(engine.url), literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """DB에 직접 적용"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+    with engine.connect() as connection:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
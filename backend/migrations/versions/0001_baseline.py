@@ -0,0 +1,23 @@
+"""기준 스키마 (마이그레이션 도입 이전 create_all로 만들어진 테이블)
+
+이 리비전은 아무것도 변경하지 않습니다.
+마이그레이션 도입 이전에 만들어진 DB는 app.db.migrate.upgrade_database()가
+이 리비전으로 표시(stamp)한 뒤 이후 마이그레이션을 적용합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
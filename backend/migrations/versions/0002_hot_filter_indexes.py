@@ -0,0 +1,45 @@
+"""역할별 목록/대시보드 필터용 인덱스
+
+- 영업자/기사 목록: 담당자 조건 + (created_at, id) 순 키셋 페이지네이션
+- 대시보드: 오늘 상담 수, 계약 상태별 건수, 대기 중인 설치/AS 건수
+- 견적/계약 항목: 상위 문서 기준 조회 및 일괄 삭제
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (인덱스 이름, 테이블, 컬럼) - 모델의 Index / index=True 정의와 같아야 함
+INDEXES = [
+    ("ix_consultations_salesperson_created", "consultations", ["salesperson_id", "created_at", "id"]),
+    ("ix_consultations_salesperson_date", "consultations", ["salesperson_id", "consultation_date"]),
+    ("ix_consultations_consultation_date", "consultations", ["consultation_date"]),
+    ("ix_quotations_salesperson_created", "quotations", ["salesperson_id", "created_at", "id"]),
+    ("ix_quotation_items_quotation_id", "quotation_items", ["quotation_id"]),
+    ("ix_contracts_salesperson_created", "contracts", ["salesperson_id", "created_at", "id"]),
+    ("ix_contracts_salesperson_status", "contracts", ["salesperson_id", "status"]),
+    ("ix_contracts_status", "contracts", ["status"]),
+    ("ix_contract_items_contract_id", "contract_items", ["contract_id"]),
+    ("ix_installations_technician_created", "installations", ["technician_id", "created_at", "id"]),
+    ("ix_installations_technician_status_scheduled", "installations", ["technician_id", "status", "scheduled_date"]),
+    ("ix_installations_status_scheduled", "installations", ["status", "scheduled_date"]),
+    ("ix_installations_scheduled_date", "installations", ["scheduled_date"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+    # 새 인덱스를 쿼리 플래너가 바로 쓰도록 통계 갱신
+    op.execute("ANALYZE")
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,59 @@
+"""동기화 변경 피드: 삭제 기록 테이블과 (updated_at, id) 인덱스
+
+- tombstones: 동기화 대상 행이 삭제되면 기록 (엔티티/담당자별 피드)
+- 변경 피드: 전체 (updated_at, id), 영업자/기사별 (담당자, updated_at, id)
+- updated_at이 비어 있는 기존 행은 created_at으로 채움 (피드에서 누락되지 않도록)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+SYNCED_TABLES = ["clients", "consultations", "quotations", "contracts", "installations"]
+
+# (인덱스 이름, 테이블, 컬럼) - 모델의 Index 정의와 같아야 함
+INDEXES = [
+    ("ix_tombstones_entity_deleted", "tombstones", ["entity", "deleted_at", "id"]),
+    ("ix_tombstones_entity_owner_deleted", "tombstones", ["entity", "owner_id", "deleted_at", "id"]),
+    ("ix_clients_updated", "clients", ["updated_at", "id"]),
+    ("ix_consultations_updated", "consultations", ["updated_at", "id"]),
+    ("ix_consultations_salesperson_updated", "consultations", ["salesperson_id", "updated_at", "id"]),
+    ("ix_quotations_updated", "quotations", ["updated_at", "id"]),
+    ("ix_quotations_salesperson_updated", "quotations", ["salesperson_id", "updated_at", "id"]),
+    ("ix_contracts_updated", "contracts", ["updated_at", "id"]),
+    ("ix_contracts_salesperson_updated", "contracts", ["salesperson_id", "updated_at", "id"]),
+    ("ix_installations_updated", "installations", ["updated_at", "id"]),
+    ("ix_installations_technician_updated", "installations", ["technician_id", "updated_at", "id"]),
+]
+
+
+def upgrade():
+    op.create_table(
+        "tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("entity", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer()),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_tombstones_id", "tombstones", ["id"], if_not_exists=True)
+    for table in SYNCED_TABLES:
+        op.execute(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL")
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+    op.execute("ANALYZE")
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_index("ix_tombstones_id", table_name="tombstones", if_exists=True)
+    op.drop_table("tombstones")
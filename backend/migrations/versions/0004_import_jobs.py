@@ -0,0 +1,50 @@
+"""대량 가져오기 작업 테이블
+
+CSV/XLSX 가져오기 작업의 상태, 처리 건수, 행별 오류를 보관합니다
+(작업을 실행하지 않는 워커 프로세스에서도 진행 상황을 조회할 수 있도록).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "import_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("target", sa.String(length=50), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "RUNNING", "COMPLETED", "FAILED", name="importstatus"),
+            nullable=False,
+        ),
+        sa.Column("total_rows", sa.Integer(), nullable=False),
+        sa.Column("inserted_rows", sa.Integer(), nullable=False),
+        sa.Column("error_count", sa.Integer(), nullable=False),
+        sa.Column("errors", sa.JSON()),
+        sa.Column("message", sa.Text()),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("started_at", sa.DateTime()),
+        sa.Column("finished_at", sa.DateTime()),
+        if_not_exists=True,
+    )
+    op.create_index("ix_import_jobs_id", "import_jobs", ["id"], if_not_exists=True)
+    op.create_index("ix_import_jobs_created_by", "import_jobs", ["created_by"], if_not_exists=True)
+    op.create_index("ix_import_jobs_created_at", "import_jobs", ["created_at"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_import_jobs_created_at", table_name="import_jobs", if_exists=True)
+    op.drop_index("ix_import_jobs_created_by", table_name="import_jobs", if_exists=True)
+    op.drop_index("ix_import_jobs_id", table_name="import_jobs", if_exists=True)
+    op.drop_table("import_jobs")
@@ -0,0 +1,22 @@
+"""계약의 견적 ID 인덱스
+
+견적 → 계약 전환 시 이미 전환된 견적인지 계약 전체를 스캔하지 않고 확인합니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_contracts_quotation_id", "contracts", ["quotation_id"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_contracts_quotation_id", table_name="contracts", if_exists=True)
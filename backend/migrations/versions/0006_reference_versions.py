@@ -0,0 +1,29 @@
+"""참조 데이터 캐시 버전 테이블
+
+직원(users)/품목(items)이 바뀔 때마다 버전을 올려, 워커 프로세스마다 메모리에 둔
+참조 데이터 캐시가 다음 요청에서 다시 읽도록 합니다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "reference_versions",
+        sa.Column("name", sa.String(length=50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_table("reference_versions")
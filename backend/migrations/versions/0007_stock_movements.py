@@ -0,0 +1,53 @@
+"""재고 수불부 테이블
+
+입고/출고/조정을 한 건씩 기록합니다. 기존 재고 수량은 품목별 기초 재고(조정) 한 건으로 옮겨
+수불부의 마지막 잔량(balance)이 현재 수량과 맞도록 합니다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "stock_movements",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("item_id", sa.Integer(), sa.ForeignKey("items.id"), nullable=False),
+        sa.Column("movement_type", sa.Enum("IN", "OUT", "ADJUST", name="movementtype"), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("balance", sa.Integer(), nullable=False),
+        sa.Column("contract_id", sa.Integer(), sa.ForeignKey("contracts.id")),
+        sa.Column("installation_id", sa.Integer(), sa.ForeignKey("installations.id")),
+        sa.Column("notes", sa.String(length=500)),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_stock_movements_id", "stock_movements", ["id"], if_not_exists=True)
+    op.create_index(
+        "ix_stock_movements_installation_id", "stock_movements", ["installation_id"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_stock_movements_item_created", "stock_movements", ["item_id", "created_at", "id"], if_not_exists=True
+    )
+    # 기초 재고
+    op.execute(
+        "INSERT INTO stock_movements (item_id, movement_type, quantity, balance, notes, created_at) "
+        "SELECT item_id, 'ADJUST', quantity, quantity, '기초 재고', CURRENT_TIMESTAMP "
+        "FROM inventory WHERE quantity <> 0"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_stock_movements_item_created", table_name="stock_movements", if_exists=True)
+    op.drop_index("ix_stock_movements_installation_id", table_name="stock_movements", if_exists=True)
+    op.drop_index("ix_stock_movements_id", table_name="stock_movements", if_exists=True)
+    op.drop_table("stock_movements")
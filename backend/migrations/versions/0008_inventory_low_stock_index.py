@@ -0,0 +1,34 @@
+"""부족 재고 부분 인덱스
+
+현재 수량이 최소 재고량 이하인 행만 (여유 수량, id) 순으로 담습니다.
+부족 재고 목록/대시보드 건수가 전체 재고를 읽지 않고 이 인덱스만 읽습니다.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+# app.models.inventory.STOCK_MARGIN과 같은 식
+STOCK_MARGIN = "quantity - coalesce(min_stock_level, 0)"
+
+
+def upgrade():
+    op.create_index(
+        "ix_inventory_low_stock",
+        "inventory",
+        [sa.text(STOCK_MARGIN), "id"],
+        sqlite_where=sa.text(f"{STOCK_MARGIN} <= 0"),
+        postgresql_where=sa.text(f"{STOCK_MARGIN} <= 0"),
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_inventory_low_stock", table_name="inventory", if_exists=True)
@@ -0,0 +1,32 @@
+"""설치/AS 사진 썸네일 URL
+
+목록/미리보기에서 원본 대신 내려받을 썸네일 경로를 보관합니다.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = ("photo_thumb_url_1", "photo_thumb_url_2")
+
+
+def upgrade():
+    # 스키마를 모델로 만든 DB에는 이미 있으므로 없는 컬럼만 추가
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("installations")}
+    for name in COLUMNS:
+        if name not in existing:
+            op.add_column("installations", sa.Column(name, sa.String(length=500)))
+
+
+def downgrade():
+    with op.batch_alter_table("installations") as batch_op:
+        for name in reversed(COLUMNS):
+            batch_op.drop_column(name)
@@ -0,0 +1,28 @@
+"""목록 키셋 페이지네이션용 created_at 인덱스
+
+목록 API는 (created_at, id) 순으로 정렬/커서 조회하므로 모델에는 created_at 인덱스가 있지만,
+마이그레이션 도입 이전 DB에는 만들어지지 않았습니다. 새로 만든 DB(create_all)와 같아지도록 추가합니다.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+TABLES = ("clients", "consultations", "contracts", "installations", "inventory", "items", "quotations", "users")
+
+
+def upgrade():
+    for table in TABLES:
+        op.create_index(f"ix_{table}_created_at", table, ["created_at"], if_not_exists=True)
+    op.execute("ANALYZE")
+
+
+def downgrade():
+    for table in reversed(TABLES):
+        op.drop_index(f"ix_{table}_created_at", table_name=table, if_exists=True)
@@ -0,0 +1,32 @@
+"""가져오기 작업 하트비트
+
+작업을 맡은 프로세스가 청크마다 갱신하는 시각을 보관합니다. 서버가 재시작되어 대기/진행 상태로
+남은 작업은 이 시각이 오래되었으므로 실패로 처리합니다.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 스키마를 모델로 만든 DB에는 이미 있으므로 없을 때만 추가
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("import_jobs")}
+    if "heartbeat_at" not in existing:
+        op.add_column("import_jobs", sa.Column("heartbeat_at", sa.DateTime()))
+    op.execute(
+        "UPDATE import_jobs SET heartbeat_at = COALESCE(finished_at, started_at, created_at) "
+        "WHERE heartbeat_at IS NULL"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("import_jobs") as batch_op:
+        batch_op.drop_column("heartbeat_at")
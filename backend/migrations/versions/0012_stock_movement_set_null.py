@@ -0,0 +1,36 @@
+"""수불 기록의 계약/작업/등록자 외래 키 ON DELETE SET NULL
+
+수불 기록이 있는 계약, 설치/AS, 직원 계정을 삭제하면 외래 키 제약 때문에 삭제가 실패했습니다.
+수불 기록은 남기고 연결만 해제하도록 외래 키를 다시 만듭니다
+(SQLite는 제약을 바꿀 수 없으므로 테이블을 새로 만들어 복사).
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+# 이름 없는 외래 키를 지정하기 위한 이름 규칙
+NAMING = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+FOREIGN_KEYS = (("contract_id", "contracts"), ("installation_id", "installations"), ("created_by", "users"))
+
+
+def _recreate(ondelete):
+    with op.batch_alter_table("stock_movements", recreate="always", naming_convention=NAMING) as batch_op:
+        for column, table in FOREIGN_KEYS:
+            name = f"fk_stock_movements_{column}_{table}"
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(name, table, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate("SET NULL")
+
+
+def downgrade():
+    _recreate(None)
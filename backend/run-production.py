@@ -3,11 +3,24 @@
 """
 import uvicorn
 import os
+import shutil
+import tempfile
 
 if __name__ == "__main__":
     # 프로덕션 모드
     os.environ["PRODUCTION"] = "true"
-    
+
+    # 워커별 메트릭을 /metrics에서 합산하기 위한 공유 디렉토리 (시작할 때마다 비움)
+    metrics_dir = os.environ.setdefault(
+        "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "nexo_crm_metrics")
+    )
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+    # 워커들이 동시에 마이그레이션하지 않도록 시작 전에 한 번 적용
+    from app.db.migrate import upgrade_database
+    upgrade_database()
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
@@ -15,4 +28,3 @@ if __name__ == "__main__":
         reload=False,
         workers=4  # 워커 프로세스 수 (선택사항)
     )
-
@@ -0,0 +1,138 @@
+"""
+API 테스트 공통 설정
+임시 디렉토리의 SQLite DB와 업로드/백업/가져오기 경로로 앱을 띄우고 TestClient로 요청합니다.
+테스트 세션 동안 DB 하나를 함께 쓰므로 각 테스트는 고유한 이름/번호로 데이터를 만들어 사용합니다.
+
+실행 (backend 디렉토리에서):
+    python -m pytest
+"""
+from datetime import date
+from pathlib import Path
+import os
+import sys
+import tempfile
+
+import pytest
+
+TEST_DIR = Path(tempfile.mkdtemp(prefix="nexo_test_"))
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# 앱(설정)을 import하기 전에 환경 변수 지정
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{TEST_DIR / 'test.db'}",
+    "UPLOAD_DIR": str(TEST_DIR / "uploads"),
+    "BACKUP_DIR": str(TEST_DIR / "backups"),
+    "IMPORT_DIR": str(TEST_DIR / "imports"),
+    "BCRYPT_ROUNDS": "4",  # 테스트에서는 해시 비용을 낮춤
+})
+sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from app.main import app  # noqa: E402
+
+from tests.utils import ADMIN, PASSWORD, login, ok, unique  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def admin(client) -> dict:
+    """관리자 인증 헤더"""
+    return login(client, **ADMIN)
+
+
+@pytest.fixture
+def make_user(client, admin):
+    """역할별 직원 생성 → (직원 정보, 인증 헤더)"""
+
+    def create(role: str = "sales"):
+        username = unique(role)
+        employee = ok(client.post("/api/employees/", json={
+            "username": username, "email": f"{username}@example.com", "full_name": f"테스트 {role}",
+            "role": role, "password": PASSWORD,
+        }, headers=admin))
+        return employee, login(client, username, PASSWORD)
+
+    return create
+
+
+@pytest.fixture
+def make_client(client, admin):
+    """거래처 생성"""
+
+    def create(name: str = None, headers: dict = None, **fields):
+        return ok(client.post("/api/clients/", json={
+            "name": name or unique("거래처"), "client_type": "company", **fields,
+        }, headers=headers or admin))
+
+    return create
+
+
+@pytest.fixture
+def make_item(client, admin):
+    """품목 생성"""
+
+    def create(unit_price: str = "10000", **fields):
+        code = unique("ITEM")
+        return ok(client.post("/api/items/", json={
+            "code": code, "name": f"품목 {code}", "unit_price": unit_price, **fields,
+        }, headers=admin))
+
+    return create
+
+
+@pytest.fixture
+def make_quotation(client, admin, make_client, make_item):
+    """견적 생성 (항목은 [(품목, 수량)] 목록, 없으면 새 품목 2개)"""
+
+    def create(lines=None, headers: dict = None, client_id: int = None, **fields):
+        lines = lines or [(make_item(), 2), (make_item(), 1)]
+        return ok(client.post("/api/quotations/", json={
+            "quotation_number": unique("Q"),
+            "client_id": client_id or make_client()["id"],
+            "items": [
+                {"item_id": item["id"], "quantity": quantity, "unit_price": str(item["unit_price"])}
+                for item, quantity in lines
+            ],
+            **fields,
+        }, headers=headers or admin))
+
+    return create
+
+
+@pytest.fixture
+def make_contract(client, admin, make_client, make_item):
+    """계약 생성 (항목은 [(품목, 수량)] 목록, 없으면 새 품목 2개)"""
+
+    def create(lines=None, headers: dict = None, client_id: int = None, **fields):
+        lines = lines or [(make_item(), 2), (make_item(), 1)]
+        return ok(client.post("/api/contracts/", json={
+            "contract_number": unique("C"),
+            "client_id": client_id or make_client()["id"],
+            "contract_date": date.today().isoformat(),
+            "items": [
+                {"item_id": item["id"], "quantity": quantity, "unit_price": str(item["unit_price"])}
+                for item, quantity in lines
+            ],
+            **fields,
+        }, headers=headers or admin))
+
+    return create
+
+
+@pytest.fixture
+def make_installation(client, admin, make_contract):
+    """설치/AS 생성 (계약이 없으면 새 계약, 담당 기사는 등록한 관리자)"""
+
+    def create(contract: dict = None, **fields):
+        contract = contract or make_contract()
+        return ok(client.post("/api/installations/", json={
+            "contract_id": contract["id"], "client_id": contract["client_id"], "installation_type": "installation",
+            "result_text": "결과 메모", "notes": "메모", **fields,
+        }, headers=admin))
+
+    return create
@@ -0,0 +1,203 @@
+-- 마이그레이션 도입 이전(기준 커밋)의 create_all로 만든 스키마
+CREATE TABLE clients (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	client_type VARCHAR(11) NOT NULL, 
+	personal_name VARCHAR(50), 
+	personal_phone VARCHAR(20), 
+	personal_email VARCHAR(100), 
+	company_name VARCHAR(100), 
+	business_number VARCHAR(20), 
+	representative_name VARCHAR(50), 
+	company_phone VARCHAR(20), 
+	company_email VARCHAR(100), 
+	address TEXT, 
+	notes TEXT, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id)
+);
+
+CREATE TABLE consultations (
+	id INTEGER NOT NULL, 
+	client_id INTEGER NOT NULL, 
+	salesperson_id INTEGER NOT NULL, 
+	consultation_date DATETIME NOT NULL, 
+	content TEXT NOT NULL, 
+	notes TEXT, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(client_id) REFERENCES clients (id), 
+	FOREIGN KEY(salesperson_id) REFERENCES users (id)
+);
+
+CREATE TABLE contract_items (
+	id INTEGER NOT NULL, 
+	contract_id INTEGER NOT NULL, 
+	item_id INTEGER NOT NULL, 
+	quantity INTEGER NOT NULL, 
+	unit_price NUMERIC(15, 2) NOT NULL, 
+	total_price NUMERIC(15, 2) NOT NULL, 
+	notes TEXT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(contract_id) REFERENCES contracts (id), 
+	FOREIGN KEY(item_id) REFERENCES items (id)
+);
+
+CREATE TABLE contracts (
+	id INTEGER NOT NULL, 
+	contract_number VARCHAR(50) NOT NULL, 
+	client_id INTEGER NOT NULL, 
+	quotation_id INTEGER, 
+	salesperson_id INTEGER NOT NULL, 
+	status VARCHAR(11) NOT NULL, 
+	contract_date DATE NOT NULL, 
+	total_amount NUMERIC(15, 2), 
+	notes TEXT, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(client_id) REFERENCES clients (id), 
+	FOREIGN KEY(quotation_id) REFERENCES quotations (id), 
+	FOREIGN KEY(salesperson_id) REFERENCES users (id)
+);
+
+CREATE TABLE installations (
+	id INTEGER NOT NULL, 
+	contract_id INTEGER NOT NULL, 
+	client_id INTEGER NOT NULL, 
+	technician_id INTEGER NOT NULL, 
+	installation_type VARCHAR(12) NOT NULL, 
+	status VARCHAR(11) NOT NULL, 
+	scheduled_date DATE, 
+	completed_date DATETIME, 
+	result_text TEXT, 
+	photo_url_1 VARCHAR(500), 
+	photo_url_2 VARCHAR(500), 
+	notes TEXT, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(contract_id) REFERENCES contracts (id), 
+	FOREIGN KEY(client_id) REFERENCES clients (id), 
+	FOREIGN KEY(technician_id) REFERENCES users (id)
+);
+
+CREATE TABLE inventory (
+	id INTEGER NOT NULL, 
+	item_id INTEGER NOT NULL, 
+	quantity INTEGER NOT NULL, 
+	min_stock_level INTEGER, 
+	location VARCHAR(100), 
+	notes VARCHAR(500), 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(item_id) REFERENCES items (id)
+);
+
+CREATE TABLE items (
+	id INTEGER NOT NULL, 
+	code VARCHAR(50) NOT NULL, 
+	name VARCHAR(200) NOT NULL, 
+	description TEXT, 
+	unit_price NUMERIC(15, 2) NOT NULL, 
+	unit VARCHAR(20), 
+	is_active BOOLEAN, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id)
+);
+
+CREATE TABLE quotation_items (
+	id INTEGER NOT NULL, 
+	quotation_id INTEGER NOT NULL, 
+	item_id INTEGER NOT NULL, 
+	quantity INTEGER NOT NULL, 
+	unit_price NUMERIC(15, 2) NOT NULL, 
+	total_price NUMERIC(15, 2) NOT NULL, 
+	notes TEXT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(quotation_id) REFERENCES quotations (id), 
+	FOREIGN KEY(item_id) REFERENCES items (id)
+);
+
+CREATE TABLE quotations (
+	id INTEGER NOT NULL, 
+	quotation_number VARCHAR(50) NOT NULL, 
+	client_id INTEGER NOT NULL, 
+	consultation_id INTEGER, 
+	salesperson_id INTEGER NOT NULL, 
+	status VARCHAR(9) NOT NULL, 
+	total_amount NUMERIC(15, 2), 
+	valid_until DATETIME, 
+	notes TEXT, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(client_id) REFERENCES clients (id), 
+	FOREIGN KEY(consultation_id) REFERENCES consultations (id), 
+	FOREIGN KEY(salesperson_id) REFERENCES users (id)
+);
+
+CREATE TABLE users (
+	id INTEGER NOT NULL, 
+	username VARCHAR(50) NOT NULL, 
+	email VARCHAR(100) NOT NULL, 
+	hashed_password VARCHAR(255) NOT NULL, 
+	full_name VARCHAR(100) NOT NULL, 
+	phone VARCHAR(20), 
+	role VARCHAR(11) NOT NULL, 
+	is_active BOOLEAN, 
+	is_admin BOOLEAN, 
+	is_super_admin BOOLEAN, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id)
+);
+
+CREATE INDEX ix_clients_id ON clients (id);
+
+CREATE INDEX ix_clients_name ON clients (name);
+
+CREATE INDEX ix_consultations_client_id ON consultations (client_id);
+
+CREATE INDEX ix_consultations_id ON consultations (id);
+
+CREATE INDEX ix_contract_items_id ON contract_items (id);
+
+CREATE INDEX ix_contracts_client_id ON contracts (client_id);
+
+CREATE UNIQUE INDEX ix_contracts_contract_number ON contracts (contract_number);
+
+CREATE INDEX ix_contracts_id ON contracts (id);
+
+CREATE INDEX ix_installations_client_id ON installations (client_id);
+
+CREATE INDEX ix_installations_id ON installations (id);
+
+CREATE INDEX ix_inventory_id ON inventory (id);
+
+CREATE UNIQUE INDEX ix_inventory_item_id ON inventory (item_id);
+
+CREATE UNIQUE INDEX ix_items_code ON items (code);
+
+CREATE INDEX ix_items_id ON items (id);
+
+CREATE INDEX ix_items_name ON items (name);
+
+CREATE INDEX ix_quotation_items_id ON quotation_items (id);
+
+CREATE INDEX ix_quotations_client_id ON quotations (client_id);
+
+CREATE INDEX ix_quotations_id ON quotations (id);
+
+CREATE UNIQUE INDEX ix_quotations_quotation_number ON quotations (quotation_number);
+
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+
+CREATE INDEX ix_users_id ON users (id);
+
+CREATE UNIQUE INDEX ix_users_username ON users (username);
+
@@ -0,0 +1,41 @@
+"""비동기 DB 경로 (AsyncSession) 로 동작하는 CRUD와 동시 요청"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.db.database import get_async_database_url
+from tests.utils import ok, unique
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:///./nexo_crm.db", "sqlite+aiosqlite:///./nexo_crm.db"),
+    ("postgresql://user:secret@db/nexo", "postgresql+asyncpg://user:secret@db/nexo"),
+    ("postgresql+psycopg2://user@db/nexo", "postgresql+asyncpg://user@db/nexo"),
+])
+def test_async_database_url(url, expected):
+    assert get_async_database_url(url) == expected
+
+
+def test_client_crud_round_trip(client, admin, make_client):
+    created = make_client(name=unique("비동기"), address="부산시")
+    assert ok(client.get(f"/api/clients/{created['id']}", headers=admin))["address"] == "부산시"
+
+    updated = ok(client.put(f"/api/clients/{created['id']}", json={**created, "address": "대구시"}, headers=admin))
+    assert updated["address"] == "대구시"
+
+    ok(client.delete(f"/api/clients/{created['id']}", headers=admin))
+    assert client.get(f"/api/clients/{created['id']}", headers=admin).status_code == 404
+    assert client.delete(f"/api/clients/{created['id']}", headers=admin).status_code == 404
+
+
+def test_concurrent_requests_use_separate_sessions(client, admin):
+    """여러 요청이 동시에 들어와도 세션이 섞이지 않고 각자 커밋"""
+    names = [unique("동시") for _ in range(20)]
+
+    def create_and_read(name):
+        created = ok(client.post("/api/clients/", json={"name": name, "client_type": "company"}, headers=admin))
+        return ok(client.get(f"/api/clients/{created['id']}", headers=admin))["name"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(create_and_read, names)) == names
+    assert ok(client.get("/health"))
@@ -0,0 +1,127 @@
+"""인증 캐시: 다른 워커에서의 직원 변경 반영과 적중/미적중 메트릭"""
+import time
+
+import pytest
+
+from app.core.auth_cache import TokenUserCache, user_cache
+from app.core.metrics import AUTH_CACHE_LOOKUPS
+from app.db import references
+from app.db.database import SessionLocal
+from app.models.user import User, UserRole
+from app.schemas.auth import CurrentUser
+from tests.utils import count_queries, ok
+
+
+@pytest.fixture
+def check_every_request(monkeypatch):
+    """다른 워커의 변경을 바로 확인하도록 인증 버전 확인 간격을 0으로"""
+    monkeypatch.setattr(user_cache, "version_check_seconds", 0)
+
+
+def _auth_version() -> int:
+    with SessionLocal() as db:
+        row = db.get(references.ReferenceVersion, references.AUTH)
+        return row.version if row else 0
+
+
+def _lookups(result: str) -> float:
+    return AUTH_CACHE_LOOKUPS.labels(result)._value.get()
+
+
+def _snapshot(user_id: int = 1) -> CurrentUser:
+    return CurrentUser.model_construct(id=user_id, username="u", role=UserRole.SALES)
+
+
+def test_cache_hit_miss_and_stale_version():
+    cache = TokenUserCache(max_size=10, ttl_seconds=60)
+    hits, stale = _lookups("hit"), _lookups("stale")
+
+    assert cache.get("token", 1) is None
+    cache.set("token", _snapshot(), 1)
+    assert cache.get("token", 1).id == 1
+    # users 버전이 바뀌면 항목을 버림
+    assert cache.get("token", 2) is None
+    assert cache.get("token", 2) is None
+
+    assert cache.stats() == {"size": 0, "hits": 1, "misses": 2, "stale": 1}
+    assert _lookups("hit") == hits + 1
+    assert _lookups("stale") == stale + 1
+
+
+def test_cache_respects_token_expiry_and_size():
+    cache = TokenUserCache(max_size=2, ttl_seconds=60)
+    cache.set("expired", _snapshot(), 1, token_expires_at=time.time() - 1)
+    assert cache.get("expired", 1) is None
+
+    for token in ("a", "b", "c"):
+        cache.set(token, _snapshot(), 1)
+    assert cache.get("a", 1) is None
+    assert cache.get("c", 1) is not None
+
+    cache.invalidate_user(1)
+    assert cache.stats()["size"] == 0
+
+
+def test_repeated_requests_hit_cache(client, make_user):
+    _, headers = make_user("sales")
+    ok(client.get("/api/auth/me", headers=headers))
+    hits = _lookups("hit")
+    with count_queries() as statements:
+        ok(client.get("/api/auth/me", headers=headers))
+    assert _lookups("hit") == hits + 1
+    # 확인 간격 안의 적중은 SQL 없이 처리
+    assert statements == []
+
+
+def test_version_is_checked_only_when_due(client, make_user, monkeypatch):
+    _, headers = make_user("sales")
+    ok(client.get("/api/auth/me", headers=headers))
+    monkeypatch.setattr(user_cache, "version_check_seconds", 0)
+    with count_queries() as statements:
+        ok(client.get("/api/auth/me", headers=headers))
+    assert len(statements) == 1 and "reference_versions" in statements[0]
+
+
+def test_only_auth_changes_bump_auth_version(client, admin, make_user):
+    """이름 변경은 인증 캐시를 비우지 않고, 역할 변경과 삭제만 버전을 올림"""
+    employee, _ = make_user("sales")
+    body = {"username": employee["username"], "email": employee["email"], "full_name": "새 이름", "role": "sales"}
+    version = _auth_version()
+    ok(client.put(f"/api/employees/{employee['id']}", json=body, headers=admin))
+    assert _auth_version() == version
+    ok(client.put(f"/api/employees/{employee['id']}", json={**body, "role": "technician"}, headers=admin))
+    assert _auth_version() == version + 1
+    ok(client.delete(f"/api/employees/{employee['id']}", headers=admin))
+    assert _auth_version() == version + 2
+
+
+def test_change_from_another_worker_invalidates_cached_user(client, make_user, check_every_request):
+    """다른 프로세스가 DB만 수정해도 (invalidate_user 호출 없이) 다음 요청에 반영"""
+    employee, headers = make_user("sales")
+    assert ok(client.get("/api/auth/me", headers=headers))["role"] == "sales"
+
+    with SessionLocal() as db:
+        db.get(User, employee["id"]).role = UserRole.TECHNICIAN
+        db.commit()
+
+    assert ok(client.get("/api/auth/me", headers=headers))["role"] == "technician"
+
+
+def test_deleted_user_is_rejected(client, admin, make_user, check_every_request):
+    employee, headers = make_user("sales")
+    ok(client.get("/api/auth/me", headers=headers))
+    ok(client.delete(f"/api/employees/{employee['id']}", headers=admin))
+
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
+
+
+def test_metrics_exposes_auth_cache_lookups(client, admin):
+    ok(client.get("/api/auth/me", headers=admin))
+    body = client.get("/metrics").text
+    assert 'auth_cache_lookups_total{result="hit"}' in body
+
+
+def test_invalid_token_is_401(client):
+    user_cache.clear()
+    response = client.get("/api/auth/me", headers={"Authorization": "Bearer nope"})
+    assert response.status_code == 401
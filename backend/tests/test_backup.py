@@ -0,0 +1,109 @@
+"""온라인 백업: 생성, 잠금, 목록, Range 다운로드, 삭제"""
+import gzip
+import hashlib
+import os
+import sqlite3
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.db import backup as backup_service
+from tests.utils import ok
+
+
+@pytest.fixture
+def backup(client, admin):
+    created = ok(client.get("/api/backup/create", headers=admin))
+    yield created
+    client.delete(f"/api/backup/{created['backup_file']}", headers=admin)
+
+
+def test_backup_is_consistent_compressed_snapshot(client, admin, backup, tmp_path):
+    assert backup["compression"] == "gzip"
+    path = backup_service.backup_dir() / backup["backup_file"]
+    assert backup_service.file_sha256(path) == backup["sha256"]
+
+    manifest = backup_service.read_manifest(path)
+    raw = gzip.decompress(path.read_bytes())
+    assert hashlib.sha256(raw).hexdigest() == manifest["database_sha256"]
+    assert manifest["integrity_check"] == "ok"
+
+    restored = tmp_path / "restored.db"
+    restored.write_bytes(raw)
+    with sqlite3.connect(restored) as db:
+        assert db.execute("SELECT count(*) FROM users WHERE username = 'admin'").fetchone()[0] == 1
+
+
+def test_backups_in_same_second_get_distinct_names(client, admin):
+    names = [ok(client.get("/api/backup/create", headers=admin))["backup_file"] for _ in range(2)]
+    try:
+        assert names[0] != names[1]
+        listed = {row["filename"] for row in ok(client.get("/api/backup/list", headers=admin))["backups"]}
+        assert set(names) <= listed
+    finally:
+        for name in names:
+            client.delete(f"/api/backup/{name}", headers=admin)
+
+
+def test_lock_file_blocks_other_workers(client, admin):
+    lock = backup_service.backup_dir() / backup_service.LOCK_FILENAME
+    lock.touch()
+    try:
+        response = client.get("/api/backup/create", headers=admin)
+        assert response.status_code == 409
+    finally:
+        lock.unlink(missing_ok=True)
+
+
+def test_stale_lock_is_reclaimed(client, admin):
+    lock = backup_service.backup_dir() / backup_service.LOCK_FILENAME
+    lock.touch()
+    stale = time.time() - settings.BACKUP_LOCK_STALE_SECONDS - 1
+    os.utime(lock, (stale, stale))
+
+    created = ok(client.get("/api/backup/create", headers=admin))
+    client.delete(f"/api/backup/{created['backup_file']}", headers=admin)
+    assert not lock.exists()
+
+
+def test_range_download_resumes(client, admin, backup):
+    url = f"/api/backup/download/{backup['backup_file']}"
+    whole = client.get(url, headers=admin)
+    assert whole.status_code == 200
+    assert whole.headers["Accept-Ranges"] == "bytes"
+    assert whole.headers["X-Checksum-SHA256"] == backup["sha256"]
+    body = whole.content
+    size = len(body)
+
+    part = client.get(url, headers={**admin, "Range": "bytes=10-"})
+    assert part.status_code == 206
+    assert part.headers["Content-Range"] == f"bytes 10-{size - 1}/{size}"
+    assert body[:10] + part.content == body
+
+    tail = client.get(url, headers={**admin, "Range": "bytes=-5"})
+    assert tail.status_code == 206 and tail.content == body[-5:]
+
+    # If-Range가 다르면 전체 파일
+    changed = client.get(url, headers={**admin, "Range": "bytes=10-", "If-Range": '"other"'})
+    assert changed.status_code == 200 and changed.content == body
+
+    unsatisfiable = client.get(url, headers={**admin, "Range": f"bytes={size}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["Content-Range"] == f"bytes */{size}"
+
+
+@pytest.mark.parametrize("filename, status_code", [
+    ("..nexo_crm_backup_x.db", 400), ("other.db", 400), ("nexo_crm_backup_19990101_000000_abcd.db.gz", 404),
+])
+def test_download_rejects_bad_names(client, admin, filename, status_code):
+    assert client.get(f"/api/backup/download/{filename}", headers=admin).status_code == status_code
+
+
+def test_delete_removes_manifest(client, admin):
+    created = ok(client.get("/api/backup/create", headers=admin))
+    path = backup_service.backup_dir() / created["backup_file"]
+    ok(client.delete(f"/api/backup/{created['backup_file']}", headers=admin))
+    assert not path.exists()
+    assert not backup_service.manifest_path(path).exists()
+    assert client.delete(f"/api/backup/{created['backup_file']}", headers=admin).status_code == 404
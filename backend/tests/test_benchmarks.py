@@ -0,0 +1,86 @@
+"""벤치마크 패키지: 데이터 생성기와 부하 테스트 실행 (별도 DB 파일에서 하위 프로세스로 실행)"""
+import json
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.report import compare_reports, summarize
+from tests.conftest import BACKEND_DIR
+
+
+def _run(*args, timeout=300):
+    return subprocess.run(
+        [sys.executable, "-m", *args], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=timeout, check=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def seeded_db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("bench") / "bench.db"
+    _run("benchmarks.seed", "--db", str(path), "--clients", "40", "--items", "10", "--seed", "3")
+    return path
+
+
+def test_seed_creates_schema_admin_and_related_rows(seeded_db):
+    with sqlite3.connect(seeded_db) as db:
+        count = lambda table: db.execute(f"SELECT count(*) FROM {table}").fetchone()[0]  # noqa: E731
+        assert count("clients") == 40
+        assert count("items") == 10
+        assert count("consultations") > 0 and count("quotation_items") > 0
+        assert count("client_search_grams") > 0
+        assert db.execute("SELECT count(*) FROM users WHERE is_super_admin = 1").fetchone()[0] == 1
+        # 마이그레이션이 최신 리비전까지 적용됨
+        assert db.execute("SELECT version_num FROM alembic_version").fetchone()[0]
+        names = [row[0] for row in db.execute("SELECT name FROM clients ORDER BY id LIMIT 5")]
+    assert all(any("가" <= ch <= "힣" for ch in name) for name in names)
+
+
+def test_load_driver_reports_routes(seeded_db, tmp_path):
+    output = tmp_path / "report.json"
+    _run("benchmarks.load", "--db", str(seeded_db), "--users", "3", "--duration", "5", "--requests", "30",
+         "--output", str(output))
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["routes"]
+    for stats in report["routes"].values():
+        assert {"p50_ms", "p95_ms", "p99_ms"} <= set(stats)
+    assert "→" in compare_reports(report, report)
+
+
+def test_summarize_percentiles():
+    stats = summarize(list(range(1, 101)))
+    assert stats["count"] == 100
+    assert stats["p50_ms"] == 51 and stats["p99_ms"] == 99
+    assert summarize([])["p95_ms"] == 0.0
+
+
+def test_serialization_benchmark_runs(seeded_db, tmp_path):
+    output = tmp_path / "serialization.json"
+    _run("benchmarks.serialization", "--db", str(seeded_db), "--rows", "10", "--repeat", "1", "--http",
+         "--output", str(output))
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert "GET /api/contracts/" in report["routes"]
+
+
+def test_convert_benchmark_runs(seeded_db, tmp_path):
+    output = tmp_path / "convert.json"
+    _run("benchmarks.convert", "--db", str(seeded_db), "--lines", "5", "--repeat", "1", "--output", str(output))
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert set(report["routes"]) == {"client", "convert"}
+    routes = report["routes"]
+    assert routes["convert"]["statements_per_contract"] < routes["client"]["statements_per_contract"]
+
+
+@pytest.mark.parametrize("mode", ["blocking", "async"])
+def test_concurrency_benchmark_modes(seeded_db, tmp_path, mode):
+    """전환 전 방식(blocking)과 현재 API(async)를 같은 명령으로 측정하고 실행 명령/환경을 기록"""
+    output = tmp_path / f"{mode}.json"
+    _run("benchmarks.concurrency", "--db", str(seeded_db), "--clients", "3", "--requests", "4", "--rows", "0",
+         "--mode", mode, "--output", str(output))
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["mode"] == mode and report["params"]["mode"] == mode
+    assert report["command"].startswith("python -m benchmarks.concurrency ") and f"--mode {mode}" in report["command"]
+    assert {"python", "sqlite", "cpus"} <= set(report["environment"])
+    assert set(report["routes"]) == {"clients", "clients_search", "consultations", "health"}
+    assert all(stats["errors"] == 0 for stats in report["routes"].values())
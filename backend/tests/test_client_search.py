@@ -0,0 +1,89 @@
+"""거래처 검색 색인 (2-gram) 과 상담/견적/계약의 client_name 필터"""
+from datetime import datetime
+
+import pytest
+
+from app.db.client_search import text_grams
+from tests.utils import ok, unique
+
+
+def _search(client, headers, term, path="/api/clients/", param="search"):
+    return [row["id"] for row in ok(client.get(path, params={param: term, "limit": 1000}, headers=headers))]
+
+
+def test_text_grams_include_last_character():
+    assert text_grams(" 나비  설비 ") == {"나비", "비 ", " 설", "설비"}
+    assert text_grams("") == set()
+
+
+def test_partial_korean_search_over_all_fields(client, admin, make_client):
+    token = unique("")
+    by_name = make_client(name=f"한빛{token}상사")
+    by_company = make_client(company_name=f"주식회사 한빛{token}")
+    by_representative = make_client(representative_name=f"김{token}")
+    by_address = make_client(address=f"서울시 {token}로 1")
+    make_client(name=f"무관{unique('')}")
+
+    found = _search(client, admin, token)
+    assert set(found) == {by_name["id"], by_company["id"], by_representative["id"], by_address["id"]}
+    # 거래처명 일치가 주소 일치보다 먼저
+    assert found.index(by_name["id"]) < found.index(by_address["id"])
+    assert _search(client, admin, f"빛{token[:4]}") == _search(client, admin, f"한빛{token[:4]}")
+
+
+def test_search_rejects_scattered_gram_false_positives(client, admin, make_client):
+    token = unique("")
+    # "가나"와 "나다" 2-gram은 모두 있지만 "가나다"는 포함하지 않음
+    decoy = make_client(name=f"가나{token} 나다")
+    target = make_client(name=f"가나다{token}")
+
+    found = _search(client, admin, f"가나다{token[:3]}")
+    assert target["id"] in found
+    assert decoy["id"] not in found
+
+
+def test_index_follows_update_and_delete(client, admin, make_client):
+    old, new = unique("옛"), unique("새")
+    created = make_client(name=old)
+    assert _search(client, admin, old) == [created["id"]]
+
+    ok(client.put(f"/api/clients/{created['id']}", json={**created, "name": new}, headers=admin))
+    assert _search(client, admin, old) == []
+    assert _search(client, admin, new) == [created["id"]]
+
+    ok(client.delete(f"/api/clients/{created['id']}", headers=admin))
+    assert _search(client, admin, new) == []
+
+
+def test_single_character_and_symbols(client, admin, make_client):
+    created = make_client(name=f"%_{unique('')}")
+    assert created["id"] in _search(client, admin, "%")
+    assert created["id"] in _search(client, admin, "%_")
+    assert _search(client, admin, "   ") == _search(client, admin, "")
+
+
+@pytest.mark.parametrize("path, factory", [
+    ("/api/quotations/", "make_quotation"), ("/api/contracts/", "make_contract"),
+])
+def test_child_routers_filter_by_client_name(request, client, admin, make_client, path, factory):
+    token = unique("")
+    target = make_client(name=f"검색{token}")
+    other = make_client()
+    create = request.getfixturevalue(factory)
+    matched = create(client_id=target["id"])
+    create(client_id=other["id"])
+
+    assert _search(client, admin, token, path, "client_name") == [matched["id"]]
+
+
+def test_consultations_filter_by_client_name(client, admin, make_client):
+    token = unique("")
+    target = make_client(name=f"상담{token}")
+    consultation = ok(client.post("/api/consultations/", json={
+        "client_id": target["id"], "consultation_date": datetime.utcnow().isoformat(), "content": "문의",
+    }, headers=admin))
+    ok(client.post("/api/consultations/", json={
+        "client_id": make_client()["id"], "consultation_date": datetime.utcnow().isoformat(), "content": "문의",
+    }, headers=admin))
+
+    assert _search(client, admin, token, "/api/consultations/", "client_name") == [consultation["id"]]
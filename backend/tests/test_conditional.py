@@ -0,0 +1,117 @@
+"""조건부 조회: ETag / Last-Modified / 304"""
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from tests.utils import count_queries, ok
+
+
+def _get(client, path, headers, **params):
+    return client.get(path, params=params, headers=headers)
+
+
+def test_detail_etag_and_304(client, admin, make_client):
+    created = make_client()
+    path = f"/api/clients/{created['id']}"
+    first = _get(client, path, admin)
+    etag = first.headers["ETag"]
+    assert not etag.startswith("W/")
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    again = client.get(path, headers={**admin, "If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["ETag"] == etag
+
+    ok(client.put(path, json={**created, "notes": "변경"}, headers=admin))
+    changed = client.get(path, headers={**admin, "If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+
+
+def test_detail_if_modified_since(client, admin, make_client):
+    path = f"/api/clients/{make_client()['id']}"
+    last_modified = _get(client, path, admin).headers["Last-Modified"]
+    assert client.get(path, headers={**admin, "If-Modified-Since": last_modified}).status_code == 304
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(days=1), usegmt=True)
+    assert client.get(path, headers={**admin, "If-Modified-Since": past}).status_code == 200
+    assert client.get(path, headers={**admin, "If-Modified-Since": "garbage"}).status_code == 200
+
+
+def test_detail_version_follows_related_rows(client, admin, make_contract):
+    """계약 상세 ETag는 함께 응답하는 거래처가 바뀌어도 달라짐"""
+    contract = make_contract()
+    path = f"/api/contracts/{contract['id']}"
+    etag = _get(client, path, admin).headers["ETag"]
+    related = ok(client.get(f"/api/clients/{contract['client_id']}", headers=admin))
+    ok(client.put(f"/api/clients/{contract['client_id']}", json={**related, "name": related["name"] + "2"},
+                  headers=admin))
+    assert client.get(path, headers={**admin, "If-None-Match": etag}).status_code == 200
+
+
+def test_list_304_without_body_queries(client, make_user, make_contract):
+    _, sales = make_user("sales")
+    make_contract(headers=sales)
+    etag = _get(client, "/api/contracts/", sales).headers["ETag"]
+    assert etag.startswith("W/")
+
+    with count_queries() as statements:
+        response = client.get("/api/contracts/", headers={**sales, "If-None-Match": etag})
+    assert response.status_code == 304
+    # 항목/본문 조회 없이 버전 쿼리만
+    assert not any("contract_items" in statement for statement in statements)
+
+
+def test_list_version_changes_on_insert_update_and_delete(client, make_user, make_contract):
+    _, sales = make_user("sales")
+    contract = make_contract(headers=sales)
+
+    def etag():
+        return _get(client, "/api/contracts/", sales).headers["ETag"]
+
+    initial = etag()
+    second = make_contract(headers=sales)
+    after_insert = etag()
+    assert after_insert != initial
+
+    ok(client.patch(f"/api/contracts/{contract['id']}", json={"notes": "수정"}, headers=sales))
+    after_update = etag()
+    assert after_update != after_insert
+
+    ok(client.delete(f"/api/contracts/{second['id']}", headers=sales))
+    assert etag() != after_update
+
+
+def test_list_version_is_per_page(client, make_user, make_contract):
+    """다른 페이지의 변경은 이 페이지의 버전을 바꾸지 않음"""
+    _, sales = make_user("sales")
+    first, _, last = (make_contract(headers=sales) for _ in range(3))
+    page = {"limit": 1}
+    etag = _get(client, "/api/contracts/", sales, **page).headers["ETag"]
+
+    ok(client.patch(f"/api/contracts/{last['id']}", json={"notes": "뒤 페이지"}, headers=sales))
+    assert client.get("/api/contracts/", params=page, headers={**sales, "If-None-Match": etag}).status_code == 304
+
+    ok(client.patch(f"/api/contracts/{first['id']}", json={"notes": "첫 페이지"}, headers=sales))
+    assert client.get("/api/contracts/", params=page, headers={**sales, "If-None-Match": etag}).status_code == 200
+
+
+def test_list_version_cost_does_not_scan_filtered_set(client, admin):
+    with count_queries() as statements:
+        ok(client.get("/api/items/", params={"limit": 5}, headers=admin))
+    assert not any("count(" in statement.lower() or "max(" in statement.lower() for statement in statements)
+
+    response = client.get("/api/items/", params={"limit": 5, "with_total": "true"}, headers=admin)
+    etag = response.headers["ETag"]
+    assert client.get("/api/items/", params={"limit": 5, "with_total": "true"},
+                      headers={**admin, "If-None-Match": etag}).status_code == 304
+
+
+def test_etag_differs_per_user_and_query(client, make_user, make_contract):
+    _, first = make_user("sales")
+    _, second = make_user("sales")
+    assert _get(client, "/api/contracts/", first).headers["ETag"] != _get(client, "/api/contracts/", second).headers["ETag"]
+    assert (_get(client, "/api/contracts/", first).headers["ETag"]
+            != _get(client, "/api/contracts/", first, include_items="false").headers["ETag"])
+
+
+def test_wildcard_if_none_match(client, admin, make_client):
+    path = f"/api/clients/{make_client()['id']}"
+    assert client.get(path, headers={**admin, "If-None-Match": "*"}).status_code == 304
@@ -0,0 +1,62 @@
+"""견적 → 계약 전환 (POST /api/quotations/{id}/convert)"""
+import pytest
+
+from tests.utils import count_queries, ok, unique
+
+
+def _convert(client, headers, quotation_id: int, **fields):
+    return client.post(f"/api/quotations/{quotation_id}/convert", json={
+        "contract_number": unique("CV"), **fields,
+    }, headers=headers)
+
+
+def test_convert_copies_lines_and_approves_quotation(client, admin, make_quotation):
+    quotation = make_quotation(notes="견적 메모")
+    contract = ok(_convert(client, admin, quotation["id"]))
+
+    assert contract["quotation_id"] == quotation["id"]
+    assert contract["client_id"] == quotation["client_id"]
+    assert contract["salesperson_id"] == quotation["salesperson_id"]
+    assert contract["total_amount"] == quotation["total_amount"]
+    assert contract["notes"] == "견적 메모"
+    line = lambda row: (row["item_id"], row["quantity"], row["unit_price"], row["total_price"])  # noqa: E731
+    assert [line(row) for row in contract["items"]] == [line(row) for row in quotation["items"]]
+    assert ok(client.get(f"/api/quotations/{quotation['id']}", headers=admin))["status"] == "approved"
+
+
+def test_convert_copies_lines_in_one_statement(client, admin, make_quotation, make_item):
+    quotation = make_quotation(lines=[(make_item(), index + 1) for index in range(10)])
+    with count_queries() as statements:
+        contract = ok(_convert(client, admin, quotation["id"]))
+    assert len(contract["items"]) == 10
+    inserts = [
+        statement for statement in statements if statement.lstrip().upper().startswith("INSERT INTO CONTRACT_ITEMS")
+    ]
+    assert len(inserts) == 1 and "SELECT" in inserts[0].upper()
+
+
+def test_convert_twice_or_with_used_number_is_rejected(client, admin, make_quotation, make_contract):
+    quotation = make_quotation()
+    ok(_convert(client, admin, quotation["id"]))
+    assert _convert(client, admin, quotation["id"]).status_code == 400
+
+    other = make_quotation()
+    used = make_contract()["contract_number"]
+    assert _convert(client, admin, other["id"], contract_number=used).status_code == 400
+    # 실패한 전환은 견적 상태도 바꾸지 않음
+    assert ok(client.get(f"/api/quotations/{other['id']}", headers=admin))["status"] == "draft"
+
+
+@pytest.mark.parametrize("status", ["rejected", "expired"])
+def test_closed_quotation_cannot_be_converted(client, admin, make_quotation, status):
+    quotation = make_quotation(status=status)
+    assert _convert(client, admin, quotation["id"]).status_code == 400
+
+
+def test_sales_can_convert_only_own_quotation(client, make_user, make_quotation):
+    _, owner = make_user("sales")
+    _, other = make_user("sales")
+    quotation = make_quotation(headers=owner)
+    assert _convert(client, other, quotation["id"]).status_code == 403
+    assert ok(_convert(client, owner, quotation["id"]))["quotation_id"] == quotation["id"]
+    assert _convert(client, owner, 999999999).status_code == 404
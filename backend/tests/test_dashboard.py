@@ -0,0 +1,89 @@
+"""대시보드 요약 (/api/dashboard/summary)"""
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.api import dashboard
+from app.core.config import settings
+from tests.utils import ok
+
+
+def _utc(day: date, at: time, zone: str = "Asia/Seoul") -> datetime:
+    """업무 시간대의 날짜/시각 → 저장 형식(UTC, 시간대 없음)"""
+    return datetime.combine(day, at, tzinfo=ZoneInfo(zone)).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def clear_summary_cache():
+    with dashboard._summary_cache_lock:
+        dashboard._summary_cache.clear()
+    yield
+
+
+def test_sales_summary_counts_own_consultations_today(client, make_user, make_client):
+    _, sales = make_user("sales")
+    _, other = make_user("sales")
+    client_id = make_client()["id"]
+    now = _utc(datetime.now(ZoneInfo("Asia/Seoul")).date(), time(12))
+    for headers, consultation_date in ((sales, now), (sales, now - timedelta(days=2)), (other, now)):
+        ok(client.post("/api/consultations/", json={
+            "client_id": client_id, "consultation_date": consultation_date.isoformat(), "content": "상담",
+        }, headers=headers))
+
+    summary = ok(client.get("/api/dashboard/summary", headers=sales))
+    assert summary["today_consultations"] == 1
+    # 재고는 관리자만
+    assert summary["low_stock_items"] is None
+
+
+def test_today_is_business_local_day(client, make_user, make_client):
+    """KST 08:00 상담은 UTC로는 전날 23:00이지만 KST 기준 오늘로 집계"""
+    _, sales = make_user("sales")
+    client_id = make_client()["id"]
+    today = datetime.now(ZoneInfo("Asia/Seoul")).date()
+    for at in (_utc(today, time(8)), _utc(today - timedelta(days=1), time(23, 59))):
+        ok(client.post("/api/consultations/", json={
+            "client_id": client_id, "consultation_date": at.isoformat(), "content": "업무 시간대",
+        }, headers=sales))
+
+    assert settings.TIMEZONE == "Asia/Seoul"
+    assert dashboard._today() == today
+    assert ok(client.get("/api/dashboard/summary", headers=sales))["today_consultations"] == 1
+
+
+def test_day_range_follows_configured_timezone(monkeypatch):
+    day = date(2026, 3, 1)
+    assert dashboard._day_range(day) == (datetime(2026, 2, 28, 15), datetime(2026, 3, 1, 15))
+    monkeypatch.setattr(settings, "TIMEZONE", "UTC")
+    assert dashboard._day_range(day) == (datetime(2026, 3, 1), datetime(2026, 3, 2))
+
+
+def test_scope_key_rolls_over_with_business_date(make_user, monkeypatch, client, admin):
+    user = dashboard.CurrentUser(**{
+        **ok(client.get("/api/auth/me", headers=admin)), "is_admin": False, "role": "sales",
+    })
+    key = dashboard._scope_key(user)
+    monkeypatch.setattr(dashboard, "_today", lambda: date.today() + timedelta(days=2))
+    assert dashboard._scope_key(user) != key
+
+
+def test_contract_counts_by_status_are_scoped(client, make_user, make_contract):
+    _, sales = make_user("sales")
+    make_contract(headers=sales, status="signed")
+    make_contract(headers=sales, status="in_progress")
+    make_contract(status="signed")  # 관리자가 등록 (다른 영업자)
+
+    summary = ok(client.get("/api/dashboard/summary", headers=sales))
+    assert summary["contracts_by_status"] == {"signed": 1, "in_progress": 1}
+    assert summary["in_progress_contracts"] == 2
+
+
+def test_admin_summary_includes_low_stock_count(client, admin):
+    summary = ok(client.get("/api/dashboard/summary", headers=admin))
+    assert isinstance(summary["low_stock_items"], int)
+    assert set(summary) >= {"today_consultations", "contracts_by_status", "pending_tasks", "generated_at"}
+
+
+def test_summary_requires_login(client):
+    assert client.get("/api/dashboard/summary").status_code == 401
@@ -0,0 +1,80 @@
+"""내보내기 (/api/{contracts|quotations|installations}/export)"""
+from decimal import Decimal
+import csv
+import io
+import zipfile
+
+import orjson
+import pytest
+
+from app.core.export import _csv_cell, _xlsx_cell
+from tests.utils import unique
+
+FORMULA = '=HYPERLINK("http://example.com","열기")'
+
+
+def _export(client, headers, path: str, export_format: str, **params) -> bytes:
+    response = client.get(f"/api/{path}/export", params={"format": export_format, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.content
+
+
+@pytest.fixture
+def formula_contract(make_client, make_contract):
+    client_name = unique("@거래처")
+    contract = make_contract(client_id=make_client(client_name)["id"], notes=FORMULA)
+    return client_name, contract
+
+
+@pytest.mark.parametrize("text", [FORMULA, "+1", "-1+2", "@SUM(A1)", "\tx", "\rx"])
+def test_csv_cell_escapes_formula_prefixes(text):
+    assert _csv_cell(text) == "'" + text
+
+
+@pytest.mark.parametrize("value, expected", [(-5, "-5"), (Decimal("-1.5"), "-1.5"), ("a=b", "a=b"), (None, "")])
+def test_csv_cell_keeps_numbers_and_plain_text(value, expected):
+    assert _csv_cell(value) == expected
+
+
+def test_xlsx_cell_writes_formula_text_as_string():
+    cell = _xlsx_cell("=1+1")
+    assert cell.startswith('<c t="inlineStr">') and "<f>" not in cell
+    assert _xlsx_cell(-5) == "<c><v>-5</v></c>"
+
+
+def test_csv_export_escapes_formulas(client, admin, formula_contract):
+    client_name, contract = formula_contract
+    content = _export(
+        client, admin, "contracts", "csv", client_name=client_name, fields="id,notes", expand="client"
+    )
+    rows = list(csv.reader(io.StringIO(content.decode("utf-8-sig"))))
+    header, row = rows[0], rows[1]
+    values = dict(zip(header, row))
+    assert values["id"] == str(contract["id"])
+    assert values["notes"] == "'" + FORMULA
+    assert values["client.name"] == "'" + client_name
+
+
+def test_xlsx_export_has_no_formula_cells(client, admin, formula_contract):
+    client_name, _ = formula_contract
+    content = _export(
+        client, admin, "contracts", "xlsx", client_name=client_name, fields="id,notes", expand="client"
+    )
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    assert "<f>" not in sheet
+    assert "=HYPERLINK(&quot;" in sheet or '=HYPERLINK("' in sheet
+    assert f'<t xml:space="preserve">{client_name}</t>' in sheet
+
+
+def test_ndjson_export_keeps_raw_values(client, admin, formula_contract):
+    client_name, contract = formula_contract
+    content = _export(client, admin, "contracts", "ndjson", client_name=client_name, fields="id,notes")
+    rows = [orjson.loads(line) for line in content.splitlines()]
+    assert rows == [{"id": contract["id"], "notes": FORMULA}]
+
+
+def test_rejects_unknown_format_and_many_relations(client, admin):
+    assert client.get("/api/contracts/export", params={"format": "pdf"}, headers=admin).status_code == 400
+    response = client.get("/api/contracts/export", params={"format": "csv", "expand": "items"}, headers=admin)
+    assert response.status_code == 400
@@ -0,0 +1,55 @@
+"""?fields= / ?expand= 부분 응답과 컬럼 단위 SELECT"""
+import pytest
+
+from tests.utils import count_queries, ok
+
+
+def test_sparse_fields_narrow_response_and_select(client, admin, make_installation):
+    installation = make_installation()
+    with count_queries() as statements:
+        rows = ok(client.get("/api/installations/", params={
+            "fields": "id,status,client.name", "limit": 100000,
+        }, headers=admin))
+
+    row = next(row for row in rows if row["id"] == installation["id"])
+    assert row == {"id": installation["id"], "status": "pending", "client": {"name": row["client"]["name"]}}
+    select = next(s for s in statements if "FROM installations" in s and "LIMIT" in s)
+    assert "result_text" not in select and "photo_url_1" not in select and "installations.notes" not in select
+
+
+def test_full_response_by_default(client, admin, make_installation):
+    installation = make_installation()
+    detail = ok(client.get(f"/api/installations/{installation['id']}", headers=admin))
+    assert detail["result_text"] == "결과 메모"
+    assert {"client", "technician"} <= set(detail)
+
+
+def test_expand_selects_relations(client, admin, make_quotation):
+    quotation = make_quotation()
+    detail = ok(client.get(f"/api/quotations/{quotation['id']}", params={"expand": "items"}, headers=admin))
+    assert len(detail["items"]) == 2
+    assert "client" not in detail and "salesperson" not in detail
+
+    with count_queries() as statements:
+        narrow = ok(client.get(f"/api/quotations/{quotation['id']}", params={
+            "fields": "id,salesperson.full_name",
+        }, headers=admin))
+    assert narrow == {"id": quotation["id"], "salesperson": {"full_name": quotation["salesperson"]["full_name"]}}
+    # 영업자 요약은 참조 데이터 캐시에서 (본문 조회에 users JOIN 없음), 항목은 조회하지 않음
+    body_select = statements[-1]
+    assert "FROM quotations" in body_select and "JOIN" not in body_select
+    assert not any("quotation_items" in statement for statement in statements)
+
+
+def test_uncached_relation_column_uses_join(client, admin, make_contract):
+    contract = make_contract()
+    detail = ok(client.get(f"/api/contracts/{contract['id']}", params={"fields": "id,salesperson.email"},
+                           headers=admin))
+    assert detail["salesperson"]["email"]
+
+
+@pytest.mark.parametrize("params", [
+    {"fields": "id,nope"}, {"fields": "client.nope"}, {"expand": "secrets"}, {"fields": "status.value"},
+])
+def test_unknown_fields_are_400(client, admin, params):
+    assert client.get("/api/contracts/", params=params, headers=admin).status_code == 400
@@ -0,0 +1,118 @@
+"""대량 가져오기 (/api/imports)"""
+from datetime import datetime, timedelta
+import time
+
+import pytest
+from sqlalchemy import select
+
+from app.db import bulk_import
+from app.db.database import SessionLocal
+from app.models.import_job import ImportJob, ImportStatus
+from tests.utils import ok, unique
+
+
+def _upload(client, headers, target: str, text: str, filename: str = "data.csv", encoding: str = "utf-8"):
+    return client.post(
+        f"/api/imports/{target}", files={"file": (filename, text.encode(encoding), "text/csv")}, headers=headers
+    )
+
+
+def _wait(client, headers, job_id: int, timeout: float = 10) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = ok(client.get(f"/api/imports/{job_id}", headers=headers))
+        if job["status"] not in ("pending", "running") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+def _add_job(status: ImportStatus, heartbeat_at: datetime, created_by: int) -> int:
+    with SessionLocal() as db:
+        job = ImportJob(target="clients", filename="old.csv", status=status, created_by=created_by,
+                        heartbeat_at=heartbeat_at)
+        db.add(job)
+        db.commit()
+        return job.id
+
+
+@pytest.fixture
+def admin_id(client, admin):
+    return ok(client.get("/api/auth/me", headers=admin))["id"]
+
+
+def test_client_import_with_row_errors(client, admin):
+    name = unique("가져온거래처")
+    response = _upload(client, admin, "clients", f"거래처명,구분,주소\n{name},company,서울\n잘못된행,unknown,\n")
+    assert response.status_code == 202
+    job = _wait(client, admin, response.json()["id"])
+    assert job["status"] == "completed"
+    assert (job["total_rows"], job["inserted_rows"], job["error_count"]) == (2, 1, 1)
+    assert job["errors"][0]["row"] == 3
+    assert ok(client.get("/api/clients/", params={"search": name}, headers=admin))[0]["address"] == "서울"
+
+
+def test_cp949_csv_and_duplicate_item_codes(client, admin):
+    code = unique("IMP")
+    text = f"품목코드,품목명,단가\n{code},가져온 품목,1000\n{code},중복,2000\n"
+    job = _wait(client, admin, _upload(client, admin, "items", text, encoding="cp949").json()["id"])
+    assert (job["inserted_rows"], job["error_count"]) == (1, 1)
+    assert "중복" in job["errors"][0]["message"]
+
+
+def test_rejects_unknown_format_and_target(client, admin, make_user):
+    assert _upload(client, admin, "clients", "x", filename="data.txt").status_code == 400
+    assert _upload(client, admin, "orders", "x").status_code == 404
+    _, sales = make_user("sales")
+    assert _upload(client, sales, "items", "품목코드\nX\n").status_code == 403
+
+
+def test_missing_header_fails_job(client, admin):
+    job = _wait(client, admin, _upload(client, admin, "items", "품목명\n이름만\n").json()["id"])
+    assert job["status"] == "failed" and "필수 열" in job["message"]
+
+
+def test_stale_jobs_are_failed_on_read(client, admin, admin_id):
+    old = datetime.utcnow() - timedelta(seconds=bulk_import.settings.IMPORT_STALE_SECONDS + 60)
+    running = _add_job(ImportStatus.RUNNING, old, admin_id)
+    pending = _add_job(ImportStatus.PENDING, old, admin_id)
+    alive = _add_job(ImportStatus.RUNNING, datetime.utcnow(), admin_id)
+
+    job = ok(client.get(f"/api/imports/{running}", headers=admin))
+    assert job["status"] == "failed" and job["message"] == bulk_import.STALE_MESSAGE
+    assert job["finished_at"] is not None
+    statuses = {job["id"]: job["status"] for job in ok(client.get("/api/imports/", headers=admin))}
+    assert statuses[pending] == "failed"
+    assert statuses[alive] == "running"
+
+
+def test_fail_stale_jobs_on_startup(admin_id):
+    old = datetime.utcnow() - timedelta(seconds=bulk_import.settings.IMPORT_STALE_SECONDS + 60)
+    job_id = _add_job(ImportStatus.RUNNING, old, admin_id)
+    assert bulk_import.fail_stale_jobs() >= 1
+    with SessionLocal() as db:
+        assert db.scalar(select(ImportJob.status).where(ImportJob.id == job_id)) == ImportStatus.FAILED
+
+
+def test_failed_job_is_not_overwritten(admin_id):
+    """실패로 처리된 뒤 늦게 끝난 작업은 상태를 되돌리지 않음"""
+    job_id = _add_job(ImportStatus.FAILED, datetime.utcnow(), admin_id)
+    with SessionLocal() as db:
+        assert bulk_import._update_job(db, job_id, status=ImportStatus.COMPLETED) is False
+        db.commit()
+        assert db.scalar(select(ImportJob.status).where(ImportJob.id == job_id)) == ImportStatus.FAILED
+
+
+def test_progress_refreshes_heartbeat_of_queued_jobs(admin_id):
+    old = datetime.utcnow() - timedelta(hours=1)
+    running, queued = _add_job(ImportStatus.RUNNING, old, admin_id), _add_job(ImportStatus.PENDING, old, admin_id)
+    with bulk_import._jobs_lock:
+        bulk_import._jobs.update({running, queued})
+    try:
+        with SessionLocal() as db:
+            assert bulk_import._update_job(db, running, total_rows=1)
+            db.commit()
+            heartbeats = db.scalars(select(ImportJob.heartbeat_at).where(ImportJob.id.in_([running, queued])))
+            assert all(value > old for value in heartbeats)
+    finally:
+        with bulk_import._jobs_lock:
+            bulk_import._jobs.difference_update({running, queued})
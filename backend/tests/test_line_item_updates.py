@@ -0,0 +1,119 @@
+"""견적/계약 수정 시 항목 변경분 반영 (PUT) 과 머리글 수정 (PATCH)"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+
+from app.db.database import SessionLocal
+from tests.utils import count_queries, ok
+
+RESOURCES = [("quotations", "make_quotation"), ("contracts", "make_contract")]
+HEADER_FIELDS = {
+    "quotations": ("quotation_number", "client_id", "consultation_id", "status", "valid_until", "notes"),
+    "contracts": ("contract_number", "client_id", "quotation_id", "status", "contract_date", "notes"),
+}
+WRITES = ("INSERT", "UPDATE", "DELETE")
+
+
+def _body(resource: str, document: dict, items: list = None) -> dict:
+    """상세 응답으로 PUT 본문 생성 (items가 없으면 기존 항목을 id 없이 그대로)"""
+    body = {name: document[name] for name in HEADER_FIELDS[resource]}
+    body["items"] = items if items is not None else [
+        {name: line[name] for name in ("item_id", "quantity", "unit_price", "notes")} for line in document["items"]
+    ]
+    return body
+
+
+def _writes(statements) -> list:
+    return [statement for statement in statements if statement.lstrip().upper().startswith(WRITES)]
+
+
+def _total(document: dict) -> Decimal:
+    return sum((Decimal(str(line["total_price"])) for line in document["items"]), Decimal(0))
+
+
+@pytest.fixture(params=RESOURCES, ids=[resource for resource, _ in RESOURCES])
+def document(request, client, admin):
+    resource, factory = request.param
+    created = request.getfixturevalue(factory)()
+    return resource, ok(client.get(f"/api/{resource}/{created['id']}", headers=admin))
+
+
+def test_resubmitting_same_lines_writes_nothing(client, admin, document):
+    resource, detail = document
+    with count_queries() as statements:
+        updated = ok(client.put(f"/api/{resource}/{detail['id']}", json=_body(resource, detail), headers=admin))
+    assert _writes(statements) == []
+    assert [line["id"] for line in updated["items"]] == [line["id"] for line in detail["items"]]
+    assert updated["updated_at"] == detail["updated_at"]
+
+
+def test_put_recomputes_drifted_total(client, admin, document):
+    """저장된 합계가 항목과 어긋나 있어도 PUT은 요청 항목 전체로 다시 계산"""
+    resource, detail = document
+    with SessionLocal() as db:
+        db.execute(text(f"UPDATE {resource} SET total_amount = 1 WHERE id = :id"), {"id": detail["id"]})
+        db.commit()
+
+    updated = ok(client.put(f"/api/{resource}/{detail['id']}", json=_body(resource, detail), headers=admin))
+    assert Decimal(str(updated["total_amount"])) == _total(detail)
+
+
+def test_changing_one_quantity_updates_one_line(client, admin, document):
+    resource, detail = document
+    body = _body(resource, detail)
+    body["items"][0]["quantity"] += 3
+
+    with count_queries() as statements:
+        updated = ok(client.put(f"/api/{resource}/{detail['id']}", json=body, headers=admin))
+    line_writes = [statement for statement in _writes(statements) if "_items" in statement.split("SET")[0]]
+    assert len(line_writes) == 1 and line_writes[0].lstrip().upper().startswith("UPDATE")
+    assert [line["id"] for line in updated["items"]] == [line["id"] for line in detail["items"]]
+    assert Decimal(str(updated["total_amount"])) == _total(updated)
+    assert updated["updated_at"] != detail["updated_at"]
+
+
+def test_insert_and_delete_keep_remaining_ids(client, admin, document, make_item):
+    resource, detail = document
+    kept = detail["items"][0]
+    new_item = make_item(unit_price="700")
+    body = _body(resource, detail, items=[
+        {name: kept[name] for name in ("id", "item_id", "quantity", "unit_price")},
+        {"item_id": new_item["id"], "quantity": 4, "unit_price": "700"},
+    ])
+
+    updated = ok(client.put(f"/api/{resource}/{detail['id']}", json=body, headers=admin))
+    lines = {line["item_id"]: line["id"] for line in updated["items"]}
+    assert lines.keys() == {kept["item_id"], new_item["id"]}
+    assert lines[kept["item_id"]] == kept["id"]
+    assert Decimal(str(updated["total_amount"])) == _total(updated)
+
+
+def test_unknown_or_repeated_line_id_is_rejected(client, admin, document):
+    resource, detail = document
+    line = {name: detail["items"][0][name] for name in ("id", "item_id", "quantity", "unit_price")}
+    unknown = {**line, "id": 10 ** 9}
+    for items in ([unknown], [line, line]):
+        response = client.put(f"/api/{resource}/{detail['id']}", json=_body(resource, detail, items), headers=admin)
+        assert response.status_code == 400
+
+
+def test_patch_updates_header_without_touching_lines(client, admin, document):
+    resource, detail = document
+    with count_queries() as statements:
+        patched = ok(client.patch(f"/api/{resource}/{detail['id']}", json={"notes": "머리글만"}, headers=admin))
+    assert patched["notes"] == "머리글만"
+    assert not any("_items" in statement for statement in _writes(statements))
+    assert [line["id"] for line in patched["items"]] == [line["id"] for line in detail["items"]]
+    assert patched["total_amount"] == detail["total_amount"]
+
+    # 같은 값이면 쓰지 않음
+    with count_queries() as statements:
+        ok(client.patch(f"/api/{resource}/{detail['id']}", json={"notes": "머리글만"}, headers=admin))
+    assert _writes(statements) == []
+
+
+def test_patch_rejects_null_for_required_fields(client, admin, document):
+    resource, detail = document
+    assert client.patch(f"/api/{resource}/{detail['id']}", json={"status": None}, headers=admin).status_code == 400
+    assert client.patch(f"/api/{resource}/999999999", json={"notes": "x"}, headers=admin).status_code == 404
@@ -0,0 +1,58 @@
+"""견적/계약 목록의 항목 일괄 로딩 (N+1 없음) 과 include_items"""
+import pytest
+
+from tests.utils import count_queries, ok
+
+
+@pytest.mark.parametrize("resource, factory", [("quotations", "make_quotation"), ("contracts", "make_contract")])
+def test_list_loads_items_in_constant_queries(request, client, make_user, resource, factory):
+    create = request.getfixturevalue(factory)
+    _, sales = make_user("sales")
+    create(headers=sales)
+    create(headers=sales)
+
+    with count_queries() as few:
+        rows = ok(client.get(f"/api/{resource}/", headers=sales))
+    assert len(rows) == 2
+
+    for _ in range(4):
+        create(headers=sales)
+    with count_queries() as many:
+        rows = ok(client.get(f"/api/{resource}/", headers=sales))
+    assert len(rows) == 6
+    assert len(many) == len(few)
+    assert all(len(row["items"]) == 2 for row in rows)
+    assert {"client", "salesperson"} <= set(rows[0])
+
+
+@pytest.mark.parametrize("resource, factory", [("quotations", "make_quotation"), ("contracts", "make_contract")])
+def test_include_items_false_skips_items(request, client, make_user, resource, factory):
+    create = request.getfixturevalue(factory)
+    _, sales = make_user("sales")
+    created = create(headers=sales)
+
+    with count_queries() as with_items:
+        ok(client.get(f"/api/{resource}/", headers=sales))
+    with count_queries() as without_items:
+        rows = ok(client.get(f"/api/{resource}/", params={"include_items": "false"}, headers=sales))
+
+    assert [row["id"] for row in rows] == [created["id"]]
+    assert "items" not in rows[0]
+    assert rows[0]["client"]["id"] == created["client_id"]
+    assert len(without_items) < len(with_items)
+    assert not any("_items" in statement for statement in without_items)
+
+
+def test_list_items_match_detail(client, admin, make_quotation, make_item):
+    first, second = make_item(unit_price="1500"), make_item(unit_price="2500")
+    quotation = make_quotation(lines=[(first, 3), (second, 1)])
+
+    listed = next(
+        row for row in ok(client.get("/api/quotations/", params={"limit": 1000}, headers=admin))
+        if row["id"] == quotation["id"]
+    )
+    detail = ok(client.get(f"/api/quotations/{quotation['id']}", headers=admin))
+    assert sorted((item["item_id"], item["quantity"]) for item in listed["items"]) == [
+        (first["id"], 3), (second["id"], 1)
+    ]
+    assert {item["id"] for item in listed["items"]} == {item["id"] for item in detail["items"]}
@@ -0,0 +1,107 @@
+"""로그인: 해시 풀, 비용 변경 시 재해시, 실패 응답"""
+import asyncio
+import threading
+
+import bcrypt
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.password_pool import PasswordHashPool, PasswordPoolBusy, password_pool
+from app.core.security import get_password_hash, password_needs_rehash, verify_password
+from app.db.database import SessionLocal
+from app.models.reference_version import ReferenceVersion
+from app.models.user import User
+from tests.utils import PASSWORD, login, ok
+
+
+def _stored_hash(user_id: int) -> str:
+    with SessionLocal() as db:
+        return db.get(User, user_id).hashed_password
+
+
+def _versions() -> dict:
+    with SessionLocal() as db:
+        return dict(db.execute(select(ReferenceVersion.name, ReferenceVersion.version)).all())
+
+
+def test_hash_uses_configured_rounds():
+    hashed = get_password_hash("비밀번호")
+    assert hashed.split("$")[2] == f"{settings.BCRYPT_ROUNDS:02d}"
+    assert verify_password("비밀번호", hashed)
+    assert not verify_password("다른값", hashed)
+    assert not password_needs_rehash(hashed)
+    assert password_needs_rehash("not-a-hash")
+
+
+def test_login_rehashes_when_cost_changes(client, make_user):
+    employee, _ = make_user("technician")
+    old_rounds = settings.BCRYPT_ROUNDS + 1
+    with SessionLocal() as db:
+        db.get(User, employee["id"]).hashed_password = bcrypt.hashpw(
+            PASSWORD.encode(), bcrypt.gensalt(rounds=old_rounds)
+        ).decode()
+        db.commit()
+    assert password_needs_rehash(_stored_hash(employee["id"]))
+    versions = _versions()
+
+    login(client, employee["username"], PASSWORD)
+    # 비밀번호는 같으므로 인증/참조 캐시 버전은 그대로
+    assert _versions() == versions
+    rehashed = _stored_hash(employee["id"])
+    assert not password_needs_rehash(rehashed)
+    assert verify_password(PASSWORD, rehashed)
+
+    # 이미 현재 비용이면 그대로
+    login(client, employee["username"], PASSWORD)
+    assert _stored_hash(employee["id"]) == rehashed
+
+
+@pytest.mark.parametrize("username, password", [("admin", "wrong"), ("nobody-here", "admin123")])
+def test_bad_credentials_are_401(client, username, password):
+    response = client.post("/api/auth/login", data={"username": username, "password": password})
+    assert response.status_code == 401
+
+
+def test_inactive_user_is_403(client, make_user):
+    employee, _ = make_user("sales")
+    with SessionLocal() as db:
+        db.get(User, employee["id"]).is_active = False
+        db.commit()
+    response = client.post("/api/auth/login", data={"username": employee["username"], "password": PASSWORD})
+    assert response.status_code == 403
+
+
+def test_pool_rejects_when_queue_is_full():
+    pool = PasswordHashPool(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordPoolBusy):
+            await pool.run(lambda: None)
+        release.set()
+        assert await first is True
+        assert pool.stats()["pending"] == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_busy_pool_returns_503(client, monkeypatch):
+    async def busy(*args):
+        raise PasswordPoolBusy()
+
+    monkeypatch.setattr(password_pool, "run", busy)
+    response = client.post("/api/auth/login", data={"username": "admin", "password": "admin123"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_created_employee_can_log_in(client, make_user):
+    employee, headers = make_user("sales")
+    assert ok(client.get("/api/auth/me", headers=headers))["id"] == employee["id"]
@@ -0,0 +1,72 @@
+"""부족 재고 목록 (GET /api/inventory/low-stock)"""
+from sqlalchemy import select
+
+from app.db.database import engine
+from app.models.inventory import Inventory, LOW_STOCK, STOCK_MARGIN
+from tests.utils import ok, unique
+
+# 다른 테스트의 재고보다 앞에 오도록 큰 최소 재고량 사용
+BASE_LEVEL = 10 ** 9
+
+
+def _stock(client, admin, make_item, quantity: int, min_stock_level: int) -> dict:
+    item = make_item()
+    inventory = ok(client.post("/api/inventory/", json={
+        "item_id": item["id"], "quantity": quantity, "min_stock_level": min_stock_level, "location": unique("L"),
+    }, headers=admin))
+    return {**inventory, "item": item}
+
+
+def test_low_stock_sorted_by_shortage_with_item(client, admin, make_item):
+    mild = _stock(client, admin, make_item, 5, BASE_LEVEL)
+    severe = _stock(client, admin, make_item, 0, BASE_LEVEL + 10)
+    enough = _stock(client, admin, make_item, 20, 10)
+
+    rows = ok(client.get("/api/inventory/low-stock", params={"limit": 100000}, headers=admin))
+    shortages = [row["shortage"] for row in rows]
+    assert shortages == sorted(shortages, reverse=True) and min(shortages) >= 0
+    mine = [row for row in rows if row["id"] in (mild["id"], severe["id"], enough["id"])]
+    assert [(row["id"], row["shortage"]) for row in mine] == [
+        (severe["id"], BASE_LEVEL + 10), (mild["id"], BASE_LEVEL - 5),
+    ]
+    assert mine[0]["item"] == {"id": severe["item"]["id"], "name": severe["item"]["name"],
+                               "code": severe["item"]["code"]}
+
+
+def test_cursor_pages_through_ties(client, admin, make_item):
+    level = BASE_LEVEL * 10  # 가장 부족한 재고로 맨 앞에 오도록
+    created = [_stock(client, admin, make_item, 0, level)["id"] for _ in range(3)]
+
+    seen, cursor = [], None
+    for _ in range(3):
+        params = {"limit": 1, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/inventory/low-stock", params=params, headers=admin)
+        seen += [row["id"] for row in ok(response)]
+        cursor = response.headers.get("X-Next-Cursor")
+    # 부족량이 같으면 id 순
+    assert seen == sorted(created)
+
+
+def test_restocking_removes_row(client, admin, make_item):
+    low = _stock(client, admin, make_item, 0, BASE_LEVEL * 3)
+    ok(client.post(f"/api/inventory/{low['id']}/movements", json={
+        "movement_type": "in", "quantity": BASE_LEVEL * 3 + 1,
+    }, headers=admin))
+    rows = ok(client.get("/api/inventory/low-stock", params={"limit": 100000}, headers=admin))
+    assert low["id"] not in {row["id"] for row in rows}
+
+
+def test_total_header_and_admin_only(client, admin, make_user):
+    response = client.get("/api/inventory/low-stock", params={"with_total": "true", "limit": 1}, headers=admin)
+    assert int(response.headers["X-Total-Count"]) >= len(ok(response))
+    _, sales = make_user("sales")
+    assert client.get("/api/inventory/low-stock", headers=sales).status_code == 403
+
+
+def test_query_uses_partial_index():
+    query = select(Inventory.id).where(LOW_STOCK).order_by(STOCK_MARGIN, Inventory.id).limit(10)
+    with engine.connect() as connection:
+        compiled = query.compile(connection, compile_kwargs={"literal_binds": True})
+        plan = " ".join(str(row[-1]) for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}"))
+    assert "ix_inventory_low_stock" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,59 @@
+"""Prometheus 메트릭 (/metrics)"""
+from prometheus_client.parser import text_string_to_metric_families
+
+from app.core.config import settings
+from app.core.metrics import UNMATCHED_ROUTE, route_template
+from tests.utils import ok
+
+
+def _samples(client, name: str) -> list:
+    families = text_string_to_metric_families(client.get("/metrics").text)
+    return [sample for family in families for sample in family.samples if sample.name == name]
+
+
+def test_latency_is_labelled_by_route_template(client, admin, make_client):
+    created = make_client()
+    ok(client.get(f"/api/clients/{created['id']}", headers=admin))
+    client.get("/api/clients/999999999", headers=admin)
+
+    labels = [sample.labels for sample in _samples(client, "http_request_duration_seconds_count")]
+    assert {"method": "GET", "route": "/api/clients/{client_id}", "status": "200"} in labels
+    assert {"method": "GET", "route": "/api/clients/{client_id}", "status": "404"} in labels
+    # ID가 라벨에 들어가지 않음
+    assert not any(str(created["id"]) in label["route"] for label in labels)
+
+
+def test_sql_statements_counted_per_request(client, admin):
+    before = sum(sample.value for sample in _samples(client, "db_queries_total"))
+    ok(client.get("/api/clients/", headers=admin))
+    assert sum(sample.value for sample in _samples(client, "db_queries_total")) > before
+
+    counts = {
+        sample.labels["route"]: sample.value
+        for sample in _samples(client, "http_request_db_queries_sum")
+        if sample.labels["method"] == "GET"
+    }
+    assert counts["/api/clients/"] > 0
+    assert counts.get("/health", 0) == 0
+
+
+def test_unmatched_paths_share_one_label(client):
+    client.get("/no/such/path/123")
+    client.get("/no/such/path/456")
+    routes = {sample.labels["route"] for sample in _samples(client, "http_request_duration_seconds_count")}
+    assert UNMATCHED_ROUTE in routes
+    assert not any(route.startswith("/no/such") for route in routes)
+
+
+def test_route_template_restores_prefix():
+    class Route:
+        path = "/{client_id}"
+
+    scope = {"route": Route(), "path_params": {"client_id": "7"}, "path": "/api/clients/7"}
+    assert route_template(scope) == "/api/clients/{client_id}"
+    assert route_template({"path": "/x"}) == UNMATCHED_ROUTE
+
+
+def test_metrics_can_be_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+    assert client.get("/metrics").status_code == 404
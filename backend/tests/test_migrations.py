@@ -0,0 +1,127 @@
+"""스키마 마이그레이션: 기존 DB를 올린 결과가 새로 만든 DB와 같은지"""
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, event, inspect
+
+from app.db import migrate
+from app.db.database import Base
+
+LEGACY_SCHEMA = Path(__file__).parent / "fixtures" / "legacy_schema.sql"
+
+
+def _engine(path: Path):
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def _foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    return engine
+
+
+def _migrate(monkeypatch, engine):
+    monkeypatch.setattr(migrate, "engine", engine)
+    migrate.upgrade_database()
+
+
+def _schema(engine) -> dict:
+    """테이블별 인덱스(이름 → 컬럼, unique)와 외래 키 (비교용)"""
+    inspector = inspect(engine)
+    return {
+        table: {
+            "indexes": sorted(
+                (index["name"], tuple(index["column_names"]), bool(index["unique"]))
+                for index in inspector.get_indexes(table)
+            ),
+            "foreign_keys": sorted(
+                (tuple(fk["constrained_columns"]), fk["referred_table"], (fk.get("options") or {}).get("ondelete"))
+                for fk in inspector.get_foreign_keys(table)
+            ),
+        }
+        for table in inspector.get_table_names() if table != "alembic_version"
+    }
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    engine = _engine(tmp_path / "legacy.db")
+    with engine.begin() as connection:
+        connection.connection.executescript(LEGACY_SCHEMA.read_text(encoding="utf-8"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def fresh_engine(tmp_path, monkeypatch):
+    engine = _engine(tmp_path / "fresh.db")
+    _migrate(monkeypatch, engine)
+    yield engine
+    engine.dispose()
+
+
+def test_migrated_legacy_database_matches_models(legacy_engine, monkeypatch):
+    _migrate(monkeypatch, legacy_engine)
+    with legacy_engine.connect() as connection:
+        assert migrate.current_revision(connection) == migrate.head_revision()
+        diff = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+    assert [change for change in diff if change[0] in ("add_index", "remove_index", "add_table", "add_column")] == []
+
+
+def test_migrated_legacy_database_matches_fresh_database(legacy_engine, fresh_engine, monkeypatch):
+    _migrate(monkeypatch, legacy_engine)
+    assert _schema(legacy_engine) == _schema(fresh_engine)
+
+
+def test_created_at_indexes_exist_after_upgrade(legacy_engine, monkeypatch):
+    _migrate(monkeypatch, legacy_engine)
+    inspector = inspect(legacy_engine)
+    for table in ("clients", "consultations", "contracts", "installations", "inventory", "items", "quotations",
+                  "users"):
+        assert f"ix_{table}_created_at" in {index["name"] for index in inspector.get_indexes(table)}
+
+
+def test_upgrade_is_idempotent(fresh_engine, monkeypatch):
+    before = _schema(fresh_engine)
+    _migrate(monkeypatch, fresh_engine)
+    assert _schema(fresh_engine) == before
+
+
+def test_latest_migration_round_trips(fresh_engine):
+    before = _schema(fresh_engine)
+    with fresh_engine.begin() as connection:
+        command.downgrade(migrate.alembic_config(connection), "-1")
+    with fresh_engine.begin() as connection:
+        command.upgrade(migrate.alembic_config(connection), "head")
+    assert _schema(fresh_engine) == before
+
+
+def _stock_movement_ondelete(engine) -> dict:
+    return {
+        fk["constrained_columns"][0]: (fk.get("options") or {}).get("ondelete")
+        for fk in inspect(engine).get_foreign_keys("stock_movements")
+    }
+
+
+def test_stock_movement_foreign_keys_become_set_null(fresh_engine):
+    """0012 이전 DB(외래 키에 ON DELETE 없음)의 수불 기록을 보존하면서 SET NULL로 변경"""
+    with fresh_engine.begin() as connection:
+        command.downgrade(migrate.alembic_config(connection), "0011")
+    assert _stock_movement_ondelete(fresh_engine)["created_by"] is None
+    with fresh_engine.begin() as connection:
+        connection.exec_driver_sql("INSERT INTO items (code, name, unit_price, is_active) VALUES ('X', 'X', 1, 1)")
+        connection.exec_driver_sql(
+            "INSERT INTO stock_movements (item_id, movement_type, quantity, balance, created_at) "
+            "VALUES (1, 'IN', 3, 3, CURRENT_TIMESTAMP)"
+        )
+
+    with fresh_engine.begin() as connection:
+        command.upgrade(migrate.alembic_config(connection), "head")
+    assert set(_stock_movement_ondelete(fresh_engine).items()) >= {
+        ("contract_id", "SET NULL"), ("installation_id", "SET NULL"), ("created_by", "SET NULL"),
+    }
+    with fresh_engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT quantity, balance FROM stock_movements").all() == [(3, 3)]
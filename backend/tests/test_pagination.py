@@ -0,0 +1,82 @@
+"""목록 커서(keyset) 페이지네이션과 X-Total-Count"""
+import pytest
+
+from app.db.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, encode_key_cursor
+from tests.utils import ok
+
+
+def _walk(client, path, headers, limit, params=None, between_pages=None):
+    """커서를 따라 끝까지 조회한 ID 목록"""
+    ids, cursor = [], None
+    while True:
+        response = client.get(path, params={**(params or {}), "limit": limit, **({"cursor": cursor} if cursor else {})},
+                              headers=headers)
+        ids += [row["id"] for row in ok(response)]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return ids
+        if between_pages:
+            between_pages()
+
+
+def test_cursor_walk_matches_single_page(client, admin, make_item):
+    for _ in range(5):
+        make_item()
+    everything = [row["id"] for row in ok(client.get("/api/items/", params={"limit": 100000}, headers=admin))]
+
+    assert _walk(client, "/api/items/", admin, limit=3) == everything
+
+
+def test_cursor_pages_do_not_repeat_or_skip_under_inserts(client, make_user, make_quotation):
+    _, sales = make_user("sales")
+    existing = [make_quotation(headers=sales)["id"] for _ in range(4)]
+    inserted = []
+
+    ids = _walk(client, "/api/quotations/", sales, limit=2, params={"include_items": "false"},
+                between_pages=lambda: inserted.append(make_quotation(headers=sales)["id"]))
+
+    # 새로 생긴 행은 뒤에 붙고, 이미 지나간 페이지는 다시 나오지 않음
+    assert len(ids) == len(set(ids))
+    assert ids[:4] == existing
+    assert set(ids) == set(existing) | set(inserted)
+
+
+def test_with_total_sets_count_header(client, make_user, make_contract):
+    _, sales = make_user("sales")
+    for _ in range(3):
+        make_contract(headers=sales)
+
+    response = client.get("/api/contracts/", params={"limit": 1, "with_total": "true"}, headers=sales)
+    assert len(ok(response)) == 1
+    assert response.headers[TOTAL_COUNT_HEADER] == "3"
+    assert NEXT_CURSOR_HEADER in response.headers
+
+    response = client.get("/api/contracts/", params={"limit": 5}, headers=sales)
+    assert TOTAL_COUNT_HEADER not in response.headers
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_skip_still_supported(client, make_user, make_contract):
+    _, sales = make_user("sales")
+    ids = [make_contract(headers=sales)["id"] for _ in range(3)]
+    rows = ok(client.get("/api/contracts/", params={"skip": 1, "limit": 1}, headers=sales))
+    assert [row["id"] for row in rows] == ids[1:2]
+
+
+@pytest.mark.parametrize("path", [
+    "/api/clients/", "/api/consultations/", "/api/quotations/", "/api/contracts/", "/api/installations/",
+    "/api/inventory/", "/api/items/", "/api/employees/", "/api/admin/accounts",
+])
+def test_every_list_accepts_cursor(client, admin, path):
+    response = client.get(path, params={"limit": 1, "with_total": "true"}, headers=admin)
+    ok(response)
+    assert TOTAL_COUNT_HEADER in response.headers
+    cursor = response.headers.get(NEXT_CURSOR_HEADER)
+    if cursor:
+        ok(client.get(path, params={"limit": 1, "cursor": cursor}, headers=admin))
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", encode_key_cursor(["yesterday", 1])])
+def test_bad_cursor_is_400(client, admin, cursor):
+    response = client.get("/api/items/", params={"cursor": cursor}, headers=admin)
+    assert response.status_code == 400
@@ -0,0 +1,95 @@
+"""참조 데이터 캐시 (직원 / 품목 요약, 품목 ID 검증)"""
+import pytest
+from sqlalchemy import update
+
+from app.db import references
+from app.db.database import SessionLocal
+from app.models.item import Item
+from tests.utils import count_queries, ok
+
+
+@pytest.fixture
+def stocked_item(client, admin, make_item):
+    """재고가 등록된 품목 → (품목, 재고 ID)"""
+    item = make_item()
+    inventory = ok(client.post("/api/inventory/", json={"item_id": item["id"], "quantity": 1}, headers=admin))
+    return item, inventory["id"]
+
+
+def test_item_rename_is_reflected_in_inventory(client, admin, stocked_item):
+    item, inventory_id = stocked_item
+    ok(client.put(f"/api/items/{item['id']}", json={
+        "code": item["code"], "name": "새 이름", "unit_price": str(item["unit_price"]),
+    }, headers=admin))
+
+    with count_queries() as statements:
+        detail = ok(client.get(f"/api/inventory/{inventory_id}", headers=admin))
+    assert detail["item"] == {"id": item["id"], "name": "새 이름", "code": item["code"]}
+    # 품목 요약은 캐시에서 (본문 조회에 items JOIN 없음)
+    assert "JOIN items" not in statements[-1]
+
+
+def test_employee_rename_is_reflected_in_lists(client, admin, make_user, make_quotation):
+    employee, sales = make_user("sales")
+    quotation = make_quotation(headers=sales)
+    ok(client.put(f"/api/employees/{employee['id']}", json={
+        "username": employee["username"], "email": employee["email"], "full_name": "바뀐 영업자", "role": "sales",
+    }, headers=admin))
+
+    rows = ok(client.get("/api/quotations/", headers=sales))
+    assert [(row["id"], row["salesperson"]["full_name"]) for row in rows] == [(quotation["id"], "바뀐 영업자")]
+
+
+def test_change_from_another_process_is_picked_up(client, admin, stocked_item):
+    """다른 워커가 수정해도 버전이 올라가므로 다음 요청에서 다시 읽음"""
+    item, inventory_id = stocked_item
+    ok(client.get(f"/api/inventory/{inventory_id}", headers=admin))
+    version, loads = references.items.version, references.items.loads
+
+    with SessionLocal() as db:
+        db.get(Item, item["id"]).name = "다른 워커에서 수정"
+        db.commit()
+
+    detail = ok(client.get(f"/api/inventory/{inventory_id}", headers=admin))
+    assert detail["item"]["name"] == "다른 워커에서 수정"
+    assert references.items.version > version and references.items.loads == loads + 1
+
+
+def test_unchanged_tables_are_not_reloaded(client, admin):
+    ok(client.get("/api/quotations/", headers=admin))
+    loads = [table.loads for table in references.TABLES]
+    with count_queries() as statements:
+        ok(client.get("/api/quotations/", headers=admin))
+    assert [table.loads for table in references.TABLES] == loads
+    # 버전만 읽고 users/items 전체는 다시 읽지 않음
+    assert not any(statement.lstrip().startswith("SELECT items.id") for statement in statements)
+
+
+def test_core_update_needs_bump(client, admin, make_item):
+    """매퍼 이벤트가 없는 Core UPDATE는 bump() 호출 후에 반영"""
+    item = make_item()
+    ok(client.get("/api/inventory/", headers=admin))
+    with SessionLocal() as db:
+        db.execute(update(Item).where(Item.id == item["id"]).values(name="Core 수정"))
+        references.bump(db.connection(), Item.__tablename__)
+        db.commit()
+    ok(client.get("/api/inventory/", headers=admin))
+    assert references.items.get(item["id"])["name"] == "Core 수정"
+
+
+def test_unknown_item_ids_are_rejected(client, admin, make_client, make_item):
+    item = make_item()
+    response = client.post("/api/quotations/", json={
+        "quotation_number": "Q-UNKNOWN-ITEM", "client_id": make_client()["id"],
+        "items": [
+            {"item_id": item["id"], "quantity": 1, "unit_price": "1"},
+            {"item_id": 999999999, "quantity": 1, "unit_price": "1"},
+        ],
+    }, headers=admin)
+    assert response.status_code == 400
+    assert "999999999" in response.json()["detail"]
+
+
+def test_cache_never_holds_password_hashes(client, admin):
+    ok(client.get("/api/quotations/", headers=admin))
+    assert all("hashed_password" not in row for row in references.users.rows.values())
@@ -0,0 +1,53 @@
+"""공용 직렬화와 orjson 응답"""
+from datetime import date, datetime
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from app.api.contract import ContractResponse
+from app.api.quotation import QuotationResponse
+from app.core.responses import dumps
+from app.models.contract import ContractStatus
+from tests.utils import ok
+
+
+def test_dumps_handles_decimal_datetime_and_enum():
+    payload = {
+        "whole": Decimal("15000.00"), "fraction": Decimal("12.5"), "status": ContractStatus.SIGNED,
+        "day": date(2024, 5, 1), "at": datetime(2024, 5, 1, 9, 30), "tags": {"a"}, 1: "숫자 키",
+    }
+    assert orjson.loads(dumps(payload)) == {
+        "whole": 15000, "fraction": 12.5, "status": "signed",
+        "day": "2024-05-01", "at": "2024-05-01T09:30:00", "tags": ["a"], "1": "숫자 키",
+    }
+    with pytest.raises(TypeError):
+        dumps({"bad": object()})
+
+
+def test_contract_detail_matches_response_model(client, admin, make_contract):
+    contract = make_contract()
+    response = client.get(f"/api/contracts/{contract['id']}", headers=admin)
+    assert response.headers["content-type"] == "application/json"
+    body = ok(response)
+    # 응답 모델 검증 없이 직렬화해도 스키마는 그대로
+    ContractResponse.model_validate(body)
+    assert body["client"]["id"] == contract["client_id"]
+    assert body["salesperson"]["full_name"]
+    assert body["total_amount"] == 2 * 10000 + 10000
+
+
+def test_list_and_detail_share_serializer(client, admin, make_quotation):
+    quotation = make_quotation()
+    detail = ok(client.get(f"/api/quotations/{quotation['id']}", headers=admin))
+    listed = next(
+        row for row in ok(client.get("/api/quotations/", params={"limit": 100000}, headers=admin))
+        if row["id"] == quotation["id"]
+    )
+    QuotationResponse.model_validate(detail)
+    assert listed == detail
+
+
+def test_decimal_prices_keep_fractions(client, admin, make_item):
+    item = make_item(unit_price="1234.50")
+    assert ok(client.get(f"/api/items/{item['id']}", headers=admin))["unit_price"] == 1234.5
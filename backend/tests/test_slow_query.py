@@ -0,0 +1,77 @@
+"""느린 쿼리 기록기와 관리자 조회 API"""
+import time
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.db import slow_query
+from app.db.slow_query import SlowQueryLog, install_slow_query_log, redact
+from tests.utils import ok
+
+
+def test_redact_masks_strings_and_keeps_ids():
+    assert redact((1, "홍길동", b"xx", Decimal("1.5"), date(2024, 1, 2), None)) == [
+        1, "<str:3>", "<bytes:2>", "1.5", "2024-01-02", None,
+    ]
+    assert redact({"name": "secret", "id": 3}) == {"name": "<str:6>", "id": 3}
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    """기준 0ms로 켠 별도 엔진과 기록기"""
+    monkeypatch.setattr(settings, "SLOW_QUERY_ENABLED", True)
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    log = SlowQueryLog(max_entries=5, explain=True)
+    monkeypatch.setattr(slow_query, "slow_query_log", log)
+    engine = create_engine(f"sqlite:///{tmp_path / 'slow.db'}")
+    install_slow_query_log(engine)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE people (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(text("INSERT INTO people (name) VALUES (:name)"), {"name": "김철수"})
+    yield engine, log
+    engine.dispose()
+
+
+def _wait_for_plan(entry: dict):
+    deadline = time.time() + 5
+    while entry["plan_status"] == "pending" and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_slow_select_records_plan_and_redacted_parameters(recorded):
+    engine, log = recorded
+    with engine.connect() as connection:
+        connection.execute(text("SELECT * FROM people WHERE name = :name"), {"name": "김철수"}).all()
+
+    entry = log.entries(1)[0]
+    assert entry["statement"].startswith("SELECT * FROM people")
+    assert entry["parameters"] == ["<str:3>"]
+    _wait_for_plan(entry)
+    assert entry["plan_status"] == "ok"
+    assert any("people" in line for line in entry["plan"])
+
+
+def test_writes_are_not_explained_and_log_is_bounded(recorded):
+    engine, log = recorded
+    with engine.begin() as connection:
+        for i in range(10):
+            connection.execute(text("INSERT INTO people (name) VALUES ('x')"))
+    entries = log.entries(100)
+    assert len(entries) == 5
+    assert entries[0]["plan_status"] == "skipped"
+    assert entries[0]["id"] > entries[-1]["id"]  # 최신순
+
+    log.clear()
+    assert log.entries() == []
+
+
+def test_endpoint_is_admin_only(client, admin, make_user):
+    _, sales = make_user("sales")
+    assert client.get("/api/admin/slow-queries", headers=sales).status_code == 403
+    body = ok(client.get("/api/admin/slow-queries", headers=admin))
+    assert body["enabled"] is settings.SLOW_QUERY_ENABLED
+    assert isinstance(body["queries"], list)
+    ok(client.delete("/api/admin/slow-queries", headers=admin))
@@ -0,0 +1,93 @@
+"""SQLite 엔진 프로파일: PRAGMA와 잠금 충돌 재시도"""
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db import sqlite_profile
+from app.db.database import engine
+from app.db.sqlite_profile import engine_options, is_lock_error, retry_delay
+
+
+def test_pragmas_applied_on_connect():
+    with engine.connect() as connection:
+        pragma = lambda name: connection.execute(text(f"PRAGMA {name}")).scalar()  # noqa: E731
+        assert pragma("journal_mode").lower() == settings.SQLITE_JOURNAL_MODE.lower()
+        assert pragma("foreign_keys") == 1
+        assert pragma("busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("cache_size") == settings.SQLITE_CACHE_SIZE
+
+
+def test_engine_options():
+    assert engine_options("sqlite:///./x.db")["pool_size"] == settings.DB_POOL_SIZE
+    assert engine_options("sqlite://") == {}
+    assert engine_options("postgresql://db/nexo") == {}
+
+
+def test_retry_delay_is_bounded():
+    for attempt in range(10):
+        assert 0 <= retry_delay(attempt) <= settings.DB_LOCK_RETRY_MAX_MS / 1000
+
+
+class FlakyCursor:
+    """처음 failures번은 지정한 오류를 내는 커서"""
+
+    def __init__(self, failures: int, error: Exception):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def execute(self, statement, parameters):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(sqlite_profile, "retry_delay", lambda attempt: 0)
+
+
+def test_lock_error_is_retried(no_sleep):
+    execute = sqlite_profile._make_execute_with_retry(is_async=False)
+    cursor = FlakyCursor(2, sqlite3.OperationalError("database is locked"))
+    assert execute(cursor, "UPDATE x SET y = 1", (), None)
+    assert cursor.calls == 3
+
+
+def test_retries_are_bounded(no_sleep):
+    execute = sqlite_profile._make_execute_with_retry(is_async=False)
+    cursor = FlakyCursor(100, sqlite3.OperationalError("database is locked"))
+    with pytest.raises(sqlite3.OperationalError):
+        execute(cursor, "UPDATE x SET y = 1", (), None)
+    assert cursor.calls == settings.DB_LOCK_RETRIES + 1
+
+
+def test_other_errors_are_not_retried(no_sleep):
+    execute = sqlite_profile._make_execute_with_retry(is_async=False)
+    cursor = FlakyCursor(1, sqlite3.OperationalError("no such table: x"))
+    with pytest.raises(sqlite3.OperationalError):
+        execute(cursor, "UPDATE x SET y = 1", (), None)
+    assert cursor.calls == 1
+    assert not is_lock_error(ValueError("database is locked"))
+
+
+def test_writer_waits_for_other_process_lock():
+    """다른 연결이 쓰기 잠금을 잡고 있어도 busy_timeout 안에 풀리면 쓰기 성공"""
+    other = sqlite3.connect(engine.url.database, isolation_level=None, check_same_thread=False)
+    other.execute("BEGIN IMMEDIATE")
+    timer = threading.Timer(0.3, other.execute, ("COMMIT",))
+    timer.start()
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE IF NOT EXISTS lock_probe (id INTEGER PRIMARY KEY)"))
+            connection.execute(text("INSERT INTO lock_probe DEFAULT VALUES"))
+    finally:
+        timer.join()
+        other.close()
+    with engine.begin() as connection:
+        assert connection.execute(text("SELECT count(*) FROM lock_probe")).scalar() >= 1
+        connection.execute(text("DROP TABLE lock_probe"))
@@ -0,0 +1,149 @@
+"""재고 수불 (입고/출고/조정, 설치 완료 출고, 수불 기록의 계약/작업 연결)"""
+from sqlalchemy import select
+
+from app.db.database import SessionLocal
+from app.models.stock_movement import StockMovement
+from tests.utils import PASSWORD, login, ok, unique
+
+
+def _stock(client, admin, item: dict, quantity: int) -> int:
+    return ok(client.post("/api/inventory/", json={"item_id": item["id"], "quantity": quantity}, headers=admin))["id"]
+
+
+def _move(client, admin, inventory_id: int, movement_type: str, quantity: int):
+    return client.post(f"/api/inventory/{inventory_id}/movements", json={
+        "movement_type": movement_type, "quantity": quantity,
+    }, headers=admin)
+
+
+def _quantity(client, admin, inventory_id: int) -> int:
+    return ok(client.get(f"/api/inventory/{inventory_id}", headers=admin))["quantity"]
+
+
+def _complete(client, headers, installation_id: int):
+    return client.put(f"/api/installations/{installation_id}/complete", params={"result_text": "완료"}, headers=headers)
+
+
+def test_movements_apply_deltas_and_record_balance(client, admin, make_item):
+    inventory_id = _stock(client, admin, make_item(), 10)
+    assert ok(_move(client, admin, inventory_id, "in", 5))["balance"] == 15
+    assert ok(_move(client, admin, inventory_id, "out", 4))["balance"] == 11
+    adjusted = ok(_move(client, admin, inventory_id, "adjust", -3))
+    assert (adjusted["quantity"], adjusted["balance"]) == (-3, 8)
+    assert _quantity(client, admin, inventory_id) == 8
+
+    history = ok(client.get(f"/api/inventory/{inventory_id}/movements", headers=admin))
+    assert [(row["movement_type"], row["quantity"], row["balance"]) for row in history][-3:] == [
+        ("in", 5, 15), ("out", -4, 11), ("adjust", -3, 8),
+    ]
+
+
+def test_invalid_movements_are_rejected(client, admin, make_item):
+    inventory_id = _stock(client, admin, make_item(), 2)
+    assert _move(client, admin, inventory_id, "out", 3).status_code == 400  # 재고 부족
+    assert _move(client, admin, inventory_id, "in", 0).status_code == 400
+    assert _move(client, admin, inventory_id, "adjust", 0).status_code == 400
+    assert _move(client, admin, 999999999, "in", 1).status_code == 404
+    assert _quantity(client, admin, inventory_id) == 2
+
+
+def _put(client, admin, inventory_id: int, item: dict, quantity: int, expected=None):
+    body = {"item_id": item["id"], "quantity": quantity, "location": "창고"}
+    if expected is not None:
+        body["expected_quantity"] = expected
+    return client.put(f"/api/inventory/{inventory_id}", json=body, headers=admin)
+
+
+def test_put_quantity_records_adjustment(client, admin, make_item):
+    item = make_item()
+    inventory_id = _stock(client, admin, item, 5)
+    ok(_put(client, admin, inventory_id, item, 9, expected=5))
+    history = ok(client.get(f"/api/inventory/{inventory_id}/movements", headers=admin))
+    assert (history[-1]["movement_type"], history[-1]["quantity"], history[-1]["balance"]) == ("adjust", 4, 9)
+
+
+def test_put_from_stale_screen_is_rejected(client, admin, make_item):
+    """두 관리자가 같은 수량(5)을 보고 저장하면 나중 저장은 409 (먼저 저장한 값을 덮어쓰지 않음)"""
+    item = make_item()
+    inventory_id = _stock(client, admin, item, 5)
+    ok(_put(client, admin, inventory_id, item, 8, expected=5))
+    assert _put(client, admin, inventory_id, item, 3, expected=5).status_code == 409
+    assert _quantity(client, admin, inventory_id) == 8
+
+    # 입출고 이후도 마찬가지
+    ok(_move(client, admin, inventory_id, "out", 1))
+    assert _put(client, admin, inventory_id, item, 10, expected=8).status_code == 409
+    assert _quantity(client, admin, inventory_id) == 7
+
+
+def test_put_without_expected_quantity(client, admin, make_item):
+    item = make_item()
+    inventory_id = _stock(client, admin, item, 5)
+    assert _put(client, admin, inventory_id, item, 6).status_code == 428
+    # 수량을 바꾸지 않는 수정(위치 등)은 그대로 허용, 화면의 수량이 오래되어도 현재 수량은 유지
+    assert ok(_put(client, admin, inventory_id, item, 5))["location"] == "창고"
+    ok(_move(client, admin, inventory_id, "in", 2))
+    ok(_put(client, admin, inventory_id, item, 5, expected=5))
+    assert _quantity(client, admin, inventory_id) == 7
+
+
+def test_completing_installation_posts_stock_out_once(client, admin, make_item, make_contract, make_installation):
+    stocked, unstocked = make_item(), make_item()
+    inventory_id = _stock(client, admin, stocked, 10)
+    contract = make_contract(lines=[(stocked, 2), (stocked, 1), (unstocked, 5)])
+    installation = make_installation(contract)
+
+    ok(_complete(client, admin, installation["id"]))
+    assert _quantity(client, admin, inventory_id) == 7
+    ok(_complete(client, admin, installation["id"]))  # 다시 완료해도 출고는 한 번
+    assert _quantity(client, admin, inventory_id) == 7
+
+    out = ok(client.get(f"/api/inventory/{inventory_id}/movements", params={"movement_type": "out"}, headers=admin))
+    assert [(row["quantity"], row["contract_id"], row["installation_id"]) for row in out] == [
+        (-3, contract["id"], installation["id"])
+    ]
+
+
+def test_short_stock_cancels_completion(client, admin, make_item, make_contract, make_installation):
+    item = make_item()
+    inventory_id = _stock(client, admin, item, 1)
+    installation = make_installation(make_contract(lines=[(item, 2)]))
+
+    assert _complete(client, admin, installation["id"]).status_code == 400
+    assert _quantity(client, admin, inventory_id) == 1
+    assert ok(client.get(f"/api/installations/{installation['id']}", headers=admin))["status"] != "completed"
+
+
+def test_deleting_installation_and_contract_keeps_ledger(client, admin, make_item, make_contract, make_installation):
+    """외래 키가 켜진 상태에서도 출고 기록이 있는 작업/계약을 삭제할 수 있고, 기록은 연결만 해제"""
+    item = make_item()
+    inventory_id = _stock(client, admin, item, 5)
+    contract = make_contract(lines=[(item, 2)])
+    installation = make_installation(contract)
+    ok(_complete(client, admin, installation["id"]))
+
+    ok(client.delete(f"/api/installations/{installation['id']}", headers=admin))
+    ok(client.delete(f"/api/contracts/{contract['id']}", headers=admin))
+
+    with SessionLocal() as db:
+        movement = db.scalar(select(StockMovement).where(StockMovement.item_id == item["id"],
+                                                         StockMovement.quantity == -2))
+        assert (movement.contract_id, movement.installation_id, movement.balance) == (None, None, 3)
+    assert _quantity(client, admin, inventory_id) == 3
+
+
+def test_deleting_account_keeps_ledger(client, admin, make_item):
+    """수불을 등록한 관리자 계정을 삭제해도 기록은 남고 등록자만 비워짐"""
+    username = unique("admin")
+    account = ok(client.post("/api/admin/accounts", json={
+        "username": username, "email": f"{username}@example.com", "full_name": "삭제할 관리자",
+        "role": "admin", "password": PASSWORD,
+    }, headers=admin))
+    inventory_id = _stock(client, admin, make_item(), 1)
+    movement = ok(_move(client, login(client, username, PASSWORD), inventory_id, "in", 4))
+
+    ok(client.delete(f"/api/admin/accounts/{account['id']}", headers=admin))
+
+    with SessionLocal() as db:
+        row = db.get(StockMovement, movement["id"])
+        assert (row.created_by, row.balance) == (None, 5)
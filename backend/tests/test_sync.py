@@ -0,0 +1,111 @@
+"""모바일 동기화 변경 피드 (/api/sync/{feed})"""
+import pytest
+
+from app.core.config import settings
+from app.db import sync
+from app.db.sqlite_profile import max_lock_wait
+from tests.utils import ok
+
+
+@pytest.fixture
+def no_settle(monkeypatch):
+    """방금 등록한 행도 바로 응답하도록 최근 구간을 비움"""
+    monkeypatch.setattr(sync, "settle_seconds", lambda: 0)
+
+
+@pytest.fixture
+def make_consultation(client, make_client):
+    def create(headers: dict, content: str = "상담"):
+        return ok(client.post("/api/consultations/", json={
+            "client_id": make_client()["id"], "consultation_date": "2024-01-01T10:00:00", "content": content,
+        }, headers=headers))
+
+    return create
+
+
+def _feed(client, headers, since=None, **params):
+    if since:
+        params["since"] = since
+    return ok(client.get("/api/sync/consultations", params=params, headers=headers))
+
+
+def test_settle_window_covers_lock_wait_budget(monkeypatch):
+    """busy_timeout을 매 시도마다 기다리고 재시도 대기까지 더한 시간보다 길어야 함"""
+    attempts = settings.DB_LOCK_RETRIES + 1
+    assert sync.settle_seconds() > attempts * settings.SQLITE_BUSY_TIMEOUT_MS / 1000
+
+    monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 20000)
+    assert max_lock_wait() >= attempts * 20
+    assert sync.settle_seconds() > max_lock_wait()
+
+
+def test_recent_changes_wait_for_settle_window(client, make_user, make_consultation):
+    _, sales = make_user("sales")
+    make_consultation(sales)
+    page = _feed(client, sales)
+    assert page["changes"] == [] and page["has_more"] is False
+
+
+def test_initial_sync_then_incremental_changes(client, make_user, make_consultation, no_settle):
+    _, sales = make_user("sales")
+    _, other = make_user("sales")
+    first, second = make_consultation(sales), make_consultation(sales)
+    make_consultation(other)
+
+    page = _feed(client, sales)
+    assert [row["id"] for row in page["changes"]] == [first["id"], second["id"]]
+    assert page["deleted"] == [] and page["has_more"] is False
+
+    # 변경 없음 → 빈 응답, 같은 위치
+    assert _feed(client, sales, page["next"])["changes"] == []
+
+    ok(client.put(f"/api/consultations/{first['id']}", json={
+        "client_id": first["client_id"], "consultation_date": "2024-01-01T10:00:00", "content": "수정",
+    }, headers=sales))
+    page = _feed(client, sales, page["next"])
+    assert [(row["id"], row["content"]) for row in page["changes"]] == [(first["id"], "수정")]
+
+
+def test_deleted_rows_are_reported_to_owner(client, make_user, make_consultation, no_settle):
+    _, sales = make_user("sales")
+    _, other = make_user("sales")
+    mine, theirs = make_consultation(sales), make_consultation(other)
+    token = _feed(client, sales)["next"]
+    other_token = _feed(client, other)["next"]
+
+    ok(client.delete(f"/api/consultations/{mine['id']}", headers=sales))
+    ok(client.delete(f"/api/consultations/{theirs['id']}", headers=other))
+
+    page = _feed(client, sales, token)
+    assert page["deleted"] == [mine["id"]] and page["changes"] == []
+    assert _feed(client, other, other_token)["deleted"] == [theirs["id"]]
+    # 한 번 받은 삭제는 다시 응답하지 않음
+    assert _feed(client, sales, page["next"])["deleted"] == []
+
+
+def test_limit_pages_with_has_more(client, make_user, make_consultation, no_settle):
+    _, sales = make_user("sales")
+    ids = [make_consultation(sales)["id"] for _ in range(5)]
+
+    seen, token = [], None
+    while True:
+        page = _feed(client, sales, token, limit=2)
+        seen += [row["id"] for row in page["changes"]]
+        token = page["next"]
+        if not page["has_more"]:
+            break
+    assert seen == ids
+
+
+def test_fields_still_track_position(client, make_user, make_consultation, no_settle):
+    _, sales = make_user("sales")
+    make_consultation(sales)
+    page = _feed(client, sales, fields="id")
+    assert list(page["changes"][0]) == ["id"]
+    assert _feed(client, sales, page["next"], fields="id")["changes"] == []
+
+
+def test_bad_token_and_unknown_feed(client, admin):
+    assert client.get("/api/sync/consultations", params={"since": "not-a-token"}, headers=admin).status_code == 400
+    assert client.get("/api/sync/items", headers=admin).status_code == 404
+    assert client.get("/api/sync/consultations").status_code == 401
@@ -0,0 +1,119 @@
+"""설치/AS 완료 사진 업로드 (EXIF 제거, 내용 해시 경로, 썸네일, 검증 후 공개)"""
+from pathlib import Path
+import hashlib
+import io
+import time
+
+import pytest
+from PIL import Image
+
+from app.core import uploads
+from app.core.config import settings
+from tests.utils import ok
+
+GPS_IFD = 0x8825
+ORIENTATION = 0x0112
+
+
+def _jpeg_with_exif(color=(200, 10, 10), size=(64, 32)) -> bytes:
+    """촬영 위치(GPS)와 회전 정보(90도)가 있는 JPEG"""
+    exif = Image.Exif()
+    exif[ORIENTATION] = 6
+    exif.get_ifd(GPS_IFD)[2] = (37.0, 33.0, 0.0)
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="JPEG", exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def _png(color=(1, 2, 3)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (16, 16), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def complete(client, admin):
+    """사진을 첨부해 완료 처리 (photo1=내용, photo2=내용)"""
+
+    def run(installation_id: int, **photos):
+        files = {name: (f"{name}.jpg", content, "image/jpeg") for name, content in photos.items()}
+        return client.put(f"/api/installations/{installation_id}/complete", params={"result_text": "완료"},
+                          files=files or None, headers=admin)
+
+    return run
+
+
+def _path(url: str) -> Path:
+    return Path(settings.UPLOAD_DIR) / url[len("/uploads/"):]
+
+
+def _staged() -> list:
+    return list(uploads.staging_dir().iterdir())
+
+
+def _wait_for(path: Path, timeout: float = 30) -> bool:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.1)
+    return True
+
+
+def test_exif_is_stripped_before_publishing(client, complete, make_installation):
+    installation = ok(complete(make_installation()["id"], photo1=_jpeg_with_exif()))
+    path = _path(installation["photo_url_1"])
+    content = path.read_bytes()
+
+    # 해시는 EXIF를 제거한 내용으로 계산
+    assert path.stem == hashlib.sha256(content).hexdigest() and path.suffix == ".jpg"
+    with Image.open(path) as image:
+        assert not image.getexif()
+        assert image.size == (32, 64)  # 회전 정보는 반영
+    assert _staged() == []
+    assert _wait_for(_path(installation["photo_thumb_url_1"]))
+
+
+def test_same_photo_is_stored_once(client, complete, make_installation):
+    photo = _jpeg_with_exif(color=(10, 200, 10))
+    first = ok(complete(make_installation()["id"], photo1=photo))
+    second = ok(complete(make_installation()["id"], photo1=photo, photo2=photo))
+    assert first["photo_url_1"] == second["photo_url_1"] == second["photo_url_2"]
+    assert len(list(_path(first["photo_url_1"]).parent.glob("*.jpg"))) <= 2  # 원본 + 썸네일
+
+
+def test_photo_without_metadata_is_kept_as_is(client, complete, make_installation):
+    photo = _png()
+    installation = ok(complete(make_installation()["id"], photo1=photo))
+    assert installation["photo_url_1"].endswith(hashlib.sha256(photo).hexdigest() + ".png")
+    assert _path(installation["photo_url_1"]).read_bytes() == photo
+
+
+def test_rejected_uploads_leave_no_files(client, admin, complete, make_installation, monkeypatch):
+    installation_id = make_installation()["id"]
+    assert complete(installation_id, photo1=b"not an image").status_code == 400
+    assert complete(installation_id, photo1=b"\xff\xd8\xff" + b"broken" * 10).status_code == 400
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 1024)
+    assert complete(installation_id, photo1=_jpeg_with_exif(size=(512, 512))).status_code == 413
+    assert _staged() == []
+    assert ok(client.get(f"/api/installations/{installation_id}", headers=admin))["status"] != "completed"
+
+
+def test_failed_validation_does_not_publish_photo(client, admin, complete, make_item, make_contract, make_installation):
+    item = make_item()
+    ok(client.post("/api/inventory/", json={"item_id": item["id"], "quantity": 0}, headers=admin))
+    installation = make_installation(make_contract(lines=[(item, 1)]))
+    photo = _jpeg_with_exif(color=(3, 3, 250))
+
+    assert complete(installation["id"], photo1=photo).status_code == 400  # 재고 부족
+    assert _staged() == []
+    photos = Path(settings.UPLOAD_DIR) / uploads.PHOTO_DIR
+    before = set(photos.rglob("*")) if photos.exists() else set()
+
+    # 같은 사진으로 다른 작업을 완료하면 그때 공개
+    published = ok(complete(make_installation()["id"], photo1=photo))
+    assert _path(published["photo_url_1"]) not in before
+
+
+def test_staging_dir_is_not_served(client):
+    assert not uploads.staging_dir().resolve().is_relative_to(Path(settings.UPLOAD_DIR).resolve())
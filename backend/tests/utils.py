@@ -0,0 +1,41 @@
+"""테스트 보조 함수"""
+from contextlib import contextmanager
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.db.database import async_engine
+
+ADMIN = {"username": "admin", "password": "admin123"}
+PASSWORD = "test1234"
+
+
+def unique(prefix: str = "T") -> str:
+    """테스트 데이터용 고유 문자열"""
+    return f"{prefix}{uuid.uuid4().hex[:10]}"
+
+
+def login(client: TestClient, username: str, password: str) -> dict:
+    response = client.post("/api/auth/login", data={"username": username, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def ok(response, status_code: int = 200):
+    """응답 코드 확인 후 JSON 본문"""
+    assert response.status_code == status_code, (response.request.url, response.status_code, response.text)
+    return response.json() if response.content else None
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 비동기 엔진으로 실행한 SQL 목록 (N+1 확인용)"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)